@@ -0,0 +1,173 @@
+"""
+Load test: N sesi dashboard bersamaan menjalankan pencocokan lewat
+`MatchScheduler` (atau langsung tanpa scheduler sebagai pembanding).
+
+    python -m benchmarks.load_test --dataset-dir dataset --sessions 50 --mode sql
+    DATABASE_URL=postgresql://... python -m benchmarks.load_test --sessions 50 --distinct-sets 5 --mode sql
+    DATABASE_URL=postgresql://... python -m benchmarks.load_test --sessions 50 --direct
+
+Setiap sesi adalah satu thread yang mengirim `--requests` request, dimulai
+bersamaan (burst), dengan jeda acak `--think-ms` di antaranya. Set benchmark
+diambil dari `--distinct-sets` set acak, jadi sesi berbeda sering meminta set
+yang sama (seperti beberapa manajer yang mencari peran yang sama). Cache hasil
+per baseline tidak dipakai, agar yang diukur hanya efek penggabungan request
+dan pembatasan query paralel.
+
+Dilaporkan: latensi per request (p50/p95/maks), throughput, jumlah request
+yang digabung/ditolak/gagal, kedalaman antrian maksimum dan puncak koneksi
+database yang dipakai bersamaan.
+"""
+
+import argparse
+import os
+import random
+import statistics
+import tempfile
+import threading
+import time
+
+import pandas as pd
+from sqlalchemy import text
+
+from talent_match.db import create_pooled_engine, pool_metrics
+from talent_match.embedded import embedded_url, prepare_embedded_database
+from talent_match.matching import TalentMatcher, read_talent_matrix
+from talent_match.scheduler import MatchScheduler, QueueFull, request_key
+
+
+def benchmark_sets(engine, n_sets, seed=0):
+    """`n_sets` set acak berisi 1-3 employee_id."""
+    with engine.connect() as conn:
+        employee_ids = pd.read_sql_query(text("SELECT employee_id FROM employees ORDER BY employee_id"), conn)
+    employee_ids = employee_ids['employee_id'].tolist()
+    rng = random.Random(seed)
+    return [rng.sample(employee_ids, rng.randint(1, 3)) for _ in range(n_sets)]
+
+
+class ConnectionSampler:
+    """Puncak koneksi pool yang sedang dipakai, di-sample di thread terpisah."""
+
+    def __init__(self, engine, interval=0.001):
+        self.engine = engine
+        self.interval = interval
+        self.peak = 0
+        self._stop = threading.Event()
+        self._thread = threading.Thread(target=self._sample, daemon=True)
+
+    def _sample(self):
+        while not self._stop.is_set():
+            self.peak = max(self.peak, self.engine.pool.checkedout())
+            time.sleep(self.interval)
+
+    def __enter__(self):
+        self._thread.start()
+        return self
+
+    def __exit__(self, *exc):
+        self._stop.set()
+        self._thread.join()
+
+
+def run_load_test(matcher, sets, sessions, requests_per_session, scheduler=None, think_ms=0, seed=0):
+    """Jalankan semua sesi; kembalikan (latensi ms per request sukses, counter hasil, detik total)."""
+    latencies, outcomes = [], {'ok': 0, 'rejected': 0, 'failed': 0}
+    lock = threading.Lock()
+    start_barrier = threading.Barrier(sessions)
+
+    def session(index):
+        rng = random.Random(seed + index)
+        start_barrier.wait()
+        for _ in range(requests_per_session):
+            benchmark_ids = rng.choice(sets)
+            start = time.perf_counter()
+            try:
+                if scheduler is None:
+                    matcher.match(benchmark_ids)
+                else:
+                    scheduler.run(request_key(benchmark_ids), lambda ids=benchmark_ids: matcher.match(ids))
+                outcome = 'ok'
+            except QueueFull:
+                outcome = 'rejected'
+            except Exception:
+                outcome = 'failed'
+            elapsed = (time.perf_counter() - start) * 1000
+            with lock:
+                outcomes[outcome] += 1
+                if outcome == 'ok':
+                    latencies.append(elapsed)
+            if think_ms:
+                time.sleep(rng.uniform(0, think_ms) / 1000)
+
+    threads = [threading.Thread(target=session, args=(i,)) for i in range(sessions)]
+    start = time.perf_counter()
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    return latencies, outcomes, time.perf_counter() - start
+
+
+def percentile(values, q):
+    return statistics.quantiles(values, n=100)[q - 1] if len(values) > 1 else (values[0] if values else 0.0)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Load test sesi dashboard bersamaan.")
+    parser.add_argument('--dataset-dir', help="pakai backend embedded dari folder ini (default: DATABASE_URL)")
+    parser.add_argument('--mode', choices=['sql', 'engine'], default='sql', help="backend pencocokan")
+    parser.add_argument('--sessions', type=int, default=20)
+    parser.add_argument('--requests', type=int, default=3, help="request per sesi")
+    parser.add_argument('--distinct-sets', type=int, default=5, help="jumlah set benchmark berbeda")
+    parser.add_argument('--think-ms', type=float, default=0, help="jeda acak maksimum antar request per sesi")
+    parser.add_argument('--workers', type=int, default=4, help="worker scheduler")
+    parser.add_argument('--queue', type=int, default=32, help="request menunggu maksimum")
+    parser.add_argument('--queue-timeout', type=float, default=5.0, help="detik menunggu slot antrian")
+    parser.add_argument('--pool-size', type=int, default=5)
+    parser.add_argument('--max-overflow', type=int, default=10)
+    parser.add_argument('--direct', action='store_true', help="tanpa scheduler (setiap sesi langsung ke database)")
+    parser.add_argument('--seed', type=int, default=0)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        if args.dataset_dir:
+            db_path = prepare_embedded_database(args.dataset_dir, tmp_dir)
+            engine = create_pooled_engine(embedded_url(db_path), args.pool_size, args.max_overflow,
+                                          connect_args={'read_only': True})
+        else:
+            engine = create_pooled_engine(os.environ['DATABASE_URL'], args.pool_size, args.max_overflow)
+
+        talent_matrix = read_talent_matrix(engine) if args.mode == 'engine' else None
+        matcher = TalentMatcher(engine, talent_matrix)
+        sets = benchmark_sets(engine, args.distinct_sets, args.seed)
+        scheduler = None if args.direct else MatchScheduler(args.workers, args.queue, args.queue_timeout)
+
+        with ConnectionSampler(engine) as sampler:
+            latencies, outcomes, seconds = run_load_test(
+                matcher, sets, args.sessions, args.requests, scheduler, args.think_ms, args.seed
+            )
+        metrics = pool_metrics(engine)
+        engine.dispose()
+
+    n_requests = args.sessions * args.requests
+    label = 'langsung (tanpa scheduler)' if args.direct else f'scheduler {args.workers} worker, antrian {args.queue}'
+    print(f"{args.sessions} sesi x {args.requests} request, {args.distinct_sets} set berbeda, mode {args.mode}, {label}")
+    print(
+        f"  selesai {outcomes['ok']}/{n_requests}, ditolak {outcomes['rejected']}, gagal {outcomes['failed']} "
+        f"dalam {seconds:.2f} s ({n_requests / max(seconds, 1e-9):.1f} request/detik)"
+    )
+    if latencies:
+        print(
+            f"  latensi p50 {percentile(latencies, 50):.1f} ms, p95 {percentile(latencies, 95):.1f} ms, "
+            f"maks {max(latencies):.1f} ms"
+        )
+    print(f"  koneksi database: puncak {sampler.peak} dipakai bersamaan, {metrics['connects']} koneksi dibuka")
+    if scheduler is not None:
+        stats = scheduler.stats()
+        print(
+            f"  scheduler: {stats['submitted']} dieksekusi, {stats['coalesced']} digabung, "
+            f"antrian maks {stats['max_depth']}, tunggu p50 {stats['wait_p50_ms']:.1f} ms / p95 {stats['wait_p95_ms']:.1f} ms"
+        )
+
+
+if __name__ == '__main__':
+    main()
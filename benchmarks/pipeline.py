@@ -0,0 +1,241 @@
+"""
+Benchmark pipeline matching per tahap: latensi dan puncak memori (RSS).
+
+Tahap yang diukur:
+- load_tables   : muat tabel sumber ke DuckDB (hanya backend embedded)
+- tv_rules      : evaluasi rule TV (build `tv_features` di DuckDB, atau
+                  `refresh_tv_features(full_refresh=True)` di Postgres)
+- load_matrix   : baca `tv_features` ke `TalentMatrix`
+- employee_list : query daftar karyawan untuk pilihan benchmark
+- baseline      : median flag TV benchmark
+- ranking       : skor semua karyawan + urutan ranking
+- result_frame  : hasil ranking -> DataFrame (wide dan long)
+- topk          : ranking top-K lewat `PatternIndex`
+- result_view   : agregasi dashboard (`ResultView`)
+
+Tahap per-request diulang dengan set benchmark acak; yang dicatat median
+latensi dan puncak memori terbesar. Hasil disimpan sebagai JSON (satu file per
+commit/backend/skala) agar bisa dibandingkan antar commit:
+
+    python -m benchmarks.synth_data --employees 50000 --out .cache/synth/50k
+    python -m benchmarks.pipeline --backend embedded --dataset-dir .cache/synth/50k
+    DATABASE_URL=postgresql://... python -m benchmarks.pipeline --backend postgres
+    python -m benchmarks.pipeline --backend postgres --database-url postgresql://.../bench_db --refresh
+    python -m benchmarks.pipeline --dataset-dir .cache/synth/50k --compare benchmarks/results/<file>.json
+"""
+
+import argparse
+import json
+import os
+import platform
+import statistics
+import subprocess
+import tempfile
+import threading
+import time
+from contextlib import contextmanager
+
+import duckdb
+import numpy as np
+import pandas as pd
+from sqlalchemy import create_engine, text
+
+from talent_match.embedded import TV_FEATURES_BUILD_QUERY, embedded_url, load_tables
+from talent_match.engine import TalentMatrix
+from talent_match.feature_store import refresh_tv_features
+from talent_match.pattern_index import PatternIndex
+from talent_match.queries import TV_FEATURES_QUERY
+from talent_match.results import ResultView
+
+EMPLOYEE_LIST_QUERY = "SELECT employee_id, fullname FROM employees ORDER BY fullname;"
+
+
+def current_rss():
+    """RSS proses saat ini dalam byte (Linux)."""
+    with open('/proc/self/statm') as f:
+        return int(f.read().split()[1]) * os.sysconf('SC_PAGE_SIZE')
+
+
+class StageRecorder:
+    """Catat latensi dan puncak RSS (di atas RSS awal) untuk setiap tahap."""
+
+    def __init__(self, sample_interval=0.002):
+        self.sample_interval = sample_interval
+        self.samples = {}
+
+    @contextmanager
+    def stage(self, name):
+        start_rss = current_rss()
+        peak = [start_rss]
+        done = threading.Event()
+
+        def sample():
+            while not done.wait(self.sample_interval):
+                peak[0] = max(peak[0], current_rss())
+
+        sampler = threading.Thread(target=sample, daemon=True)
+        sampler.start()
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            elapsed = time.perf_counter() - start
+            done.set()
+            sampler.join()
+            peak[0] = max(peak[0], current_rss())
+            self.samples.setdefault(name, []).append((elapsed * 1000, (peak[0] - start_rss) / 2**20))
+
+    def summary(self):
+        return {
+            name: {
+                'runs': len(runs),
+                'latency_ms': round(statistics.median(ms for ms, _ in runs), 3),
+                'peak_mem_mb': round(max(mb for _, mb in runs), 2),
+            }
+            for name, runs in self.samples.items()
+        }
+
+
+def prepare_embedded(recorder, dataset_dir, db_path):
+    """Bangun file DuckDB sambil mengukur load_tables dan tv_rules."""
+    conn = duckdb.connect(db_path)
+    try:
+        with recorder.stage('load_tables'):
+            load_tables(conn, dataset_dir)
+        with recorder.stage('tv_rules'):
+            conn.execute(TV_FEATURES_BUILD_QUERY)
+        conn.execute("CHECKPOINT")
+    finally:
+        conn.close()
+    return create_engine(embedded_url(db_path), connect_args={'read_only': True})
+
+
+def run_request_stages(recorder, talent_matrix, benchmark_ids):
+    with recorder.stage('baseline'):
+        baseline = talent_matrix.baseline(benchmark_ids)
+    with recorder.stage('ranking'):
+        _, tgv_match, final_match = talent_matrix.score(baseline)
+        order = talent_matrix._ranking(final_match)
+    with recorder.stage('result_frame'):
+        df_results = talent_matrix.wide_frame(order, baseline, tgv_match[order], final_match[order])
+    with recorder.stage('result_frame_long'):
+        talent_matrix.match_baseline(baseline)
+    with recorder.stage('result_view'):
+        view = ResultView(df_results, benchmark_ids)
+        view.ranked_display()
+        for employee_id in view.ranked['employee_id'].head(5):
+            view.candidate_tgv(employee_id)
+            view.candidate_tv(employee_id)
+    return baseline
+
+
+def run_benchmark(recorder, engine, backend, repeats=10, top_k=200, seed=0, refresh=False):
+    """Jalankan semua tahap; kembalikan jumlah karyawan di matriks TV."""
+    if backend == 'postgres' and refresh:
+        with recorder.stage('tv_rules'):
+            refresh_tv_features(engine, full_refresh=True)
+
+    with recorder.stage('load_matrix'):
+        with engine.connect() as conn:
+            df_features = pd.read_sql_query(text(TV_FEATURES_QUERY), conn)
+        talent_matrix = TalentMatrix.from_frame(df_features)
+    del df_features
+
+    for _ in range(repeats):
+        with recorder.stage('employee_list'):
+            with engine.connect() as conn:
+                pd.read_sql_query(text(EMPLOYEE_LIST_QUERY), conn)
+
+    with recorder.stage('pattern_index'):
+        pattern_index = PatternIndex(talent_matrix)
+
+    rng = np.random.default_rng(seed)
+    for _ in range(repeats):
+        size = int(rng.integers(1, 4))
+        benchmark_ids = list(rng.choice(talent_matrix.employee_ids, size, replace=False))
+        baseline = run_request_stages(recorder, talent_matrix, benchmark_ids)
+        with recorder.stage('topk'):
+            pattern_index.top_k(baseline, top_k)
+            pattern_index.histogram(baseline)
+
+    return len(talent_matrix)
+
+
+def git_commit():
+    try:
+        return subprocess.run(
+            ['git', 'rev-parse', '--short', 'HEAD'], capture_output=True, text=True, check=True
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return 'unknown'
+
+
+def print_stages(stages, previous=None):
+    print(f"{'tahap':<20}{'latensi ms':>12}{'puncak MB':>12}" + (f"{'vs dasar':>12}" if previous else ''))
+    for name, stage in stages.items():
+        line = f"{name:<20}{stage['latency_ms']:>12.2f}{stage['peak_mem_mb']:>12.1f}"
+        if previous and name in previous:
+            ratio = stage['latency_ms'] / max(previous[name]['latency_ms'], 1e-9)
+            line += f"{ratio:>11.2f}x"
+        print(line)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Benchmark pipeline matching per tahap.")
+    parser.add_argument('--backend', choices=['embedded', 'postgres'], default='embedded')
+    parser.add_argument('--dataset-dir', default='dataset', help="folder CSV/Parquet (backend embedded)")
+    parser.add_argument('--repeats', type=int, default=10)
+    parser.add_argument('--top-k', type=int, default=200)
+    parser.add_argument('--database-url', help="database Postgres (default: DATABASE_URL)")
+    parser.add_argument(
+        '--refresh', action='store_true',
+        help="ukur juga refresh penuh tv_features (postgres, wajib dengan --database-url: menulis ulang tv_features)",
+    )
+    parser.add_argument('--results-dir', default='benchmarks/results')
+    parser.add_argument('--compare', help="file hasil sebelumnya sebagai pembanding")
+    args = parser.parse_args()
+    if args.refresh and args.backend == 'postgres' and not args.database_url:
+        # Refresh penuh menghapus dan mengisi ulang tv_features: jangan sampai mengenai
+        # database produksi hanya karena DATABASE_URL kebetulan ter-set
+        parser.error("--refresh menulis ulang tv_features; tentukan database target dengan --database-url")
+
+    recorder = StageRecorder()
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        if args.backend == 'embedded':
+            engine = prepare_embedded(recorder, args.dataset_dir, os.path.join(tmp_dir, 'talent.duckdb'))
+        else:
+            engine = create_engine(args.database_url or os.environ['DATABASE_URL'])
+        n_employees = run_benchmark(recorder, engine, args.backend, args.repeats, args.top_k, refresh=args.refresh)
+        engine.dispose()
+    stages = recorder.summary()
+
+    commit = git_commit()
+    result = {
+        'commit': commit,
+        'backend': args.backend,
+        'dataset_dir': args.dataset_dir,
+        'employees': n_employees,
+        'repeats': args.repeats,
+        'created': time.strftime('%Y-%m-%dT%H:%M:%S'),
+        'python': platform.python_version(),
+        'numpy': np.__version__,
+        'pandas': pd.__version__,
+        'stages': stages,
+    }
+
+    os.makedirs(args.results_dir, exist_ok=True)
+    path = os.path.join(args.results_dir, f'{commit}-{args.backend}-{n_employees}.json')
+    with open(path, 'w') as f:
+        json.dump(result, f, indent=2)
+
+    previous = None
+    if args.compare:
+        with open(args.compare) as f:
+            previous = json.load(f)['stages']
+    print(f"{n_employees} karyawan, backend {args.backend}, commit {commit}")
+    print_stages(stages, previous)
+    print(f"Hasil disimpan ke {path}")
+
+
+if __name__ == '__main__':
+    main()
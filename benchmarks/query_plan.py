@@ -0,0 +1,100 @@
+"""
+Bandingkan waktu planning vs eksekusi query Task 2: tanpa prepare (SQL dikirim
+utuh setiap request) vs prepared statement (`talent_query.read_talent_match`).
+Mode `baseline` menjalankan versi lama (`baseline_query.sql`): Rule Engine TV
+dari tabel mentah dan ID benchmark disisipkan ke SQL dengan f-string
+(`IN ('EMP...', ...)`), agar angka sebelum/sesudah bisa diulang.
+
+    DATABASE_URL=postgresql://... python -m benchmarks.query_plan --runs 30
+    DATABASE_URL=postgresql://... python -m benchmarks.query_plan --modes baseline prepared
+
+Tambahkan PGOPTIONS="-c plan_cache_mode=force_generic_plan" untuk melihat
+efek generic plan tanpa menunggu heuristik custom-vs-generic Postgres.
+"""
+
+import argparse
+import os
+import re
+import statistics
+import time
+
+from sqlalchemy import create_engine, text
+
+from talent_match.queries import TALENT_MATCH_QUERY
+from talent_match.talent_query import PREPARED_NAME, prepare_talent_query
+
+DEFAULT_BENCHMARKS = [
+    ['EMP100312', 'EMP100335', 'EMP100175'],
+    ['EMP100001', 'EMP100002'],
+    ['EMP100010'],
+]
+
+
+MODES = ['baseline', 'unprepared', 'prepared']
+
+BASELINE_QUERY_PATH = os.path.join(os.path.dirname(__file__), 'baseline_query.sql')
+
+
+def baseline_statement(benchmark_ids):
+    """Query lama dengan ID benchmark sebagai literal f-string (hanya untuk pembanding, jangan dipakai di app)."""
+    formatted_ids = tuple(benchmark_ids)
+    if len(formatted_ids) == 1:
+        formatted_ids = f"('{formatted_ids[0]}')"
+    with open(BASELINE_QUERY_PATH) as f:
+        query = f.read()
+    return query.replace('{formatted_ids}', str(formatted_ids)).strip().rstrip(';')
+
+
+def statement_builder(mode):
+    """Fungsi benchmark_ids -> (statement, params) untuk `mode`."""
+    if mode == 'baseline':
+        return lambda benchmark_ids: (baseline_statement(benchmark_ids), {})
+    statement = TALENT_MATCH_QUERY.strip().rstrip(';') if mode == 'unprepared' else f"EXECUTE {PREPARED_NAME}(:benchmark_ids)"
+    return lambda benchmark_ids: (statement, {'benchmark_ids': list(benchmark_ids)})
+
+
+def explain_timings(conn, statement, params):
+    """(planning_ms, execution_ms) dari EXPLAIN (ANALYZE, SUMMARY)."""
+    rows = conn.execute(text(f"EXPLAIN (ANALYZE, SUMMARY) {statement}"), params).scalars().all()
+    plan = '\n'.join(rows)
+    planning = float(re.search(r'Planning Time: ([\d.]+)', plan).group(1))
+    execution = float(re.search(r'Execution Time: ([\d.]+)', plan).group(1))
+    return planning, execution
+
+
+def measure(conn, build_statement, benchmark_sets, runs):
+    planning, execution, wall = [], [], []
+    for i in range(runs):
+        statement, params = build_statement(benchmark_sets[i % len(benchmark_sets)])
+        plan_ms, exec_ms = explain_timings(conn, statement, params)
+        planning.append(plan_ms)
+        execution.append(exec_ms)
+
+        start = time.perf_counter()
+        conn.execute(text(statement), params).fetchall()
+        wall.append((time.perf_counter() - start) * 1000)
+    return statistics.median(planning), statistics.median(execution), statistics.median(wall)
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    parser.add_argument('--runs', type=int, default=30)
+    parser.add_argument('--modes', nargs='+', choices=MODES, default=MODES)
+    args = parser.parse_args()
+
+    engine = create_engine(os.environ['DATABASE_URL'])
+    with engine.connect() as conn:
+        if 'prepared' in args.modes:
+            prepare_talent_query(conn)
+        results = {
+            mode: measure(conn, statement_builder(mode), DEFAULT_BENCHMARKS, args.runs)
+            for mode in args.modes
+        }
+
+    print(f"{'mode':<12}{'planning ms':>14}{'execution ms':>15}{'wall ms':>10}")
+    for mode, (planning, execution, wall) in results.items():
+        print(f"{mode:<12}{planning:>14.2f}{execution:>15.2f}{wall:>10.2f}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,135 @@
+"""
+Stub lokal endpoint OpenAI-compatible (`POST /v1/chat/completions`).
+
+Mengembalikan profil pekerjaan tetap, baik sebagai JSON biasa maupun stream
+SSE token demi token, dengan latensi yang bisa diatur. Arahkan dashboard ke
+stub ini lewat secrets:
+
+    OPENROUTER_BASE_URL = "http://127.0.0.1:8765/v1"
+
+    python -m benchmarks.stub_llm --port 8765 --first-token-delay 1.0 --token-delay 0.02
+"""
+
+import argparse
+import json
+import re
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+STUB_PROFILE = """### Deskripsi Pekerjaan
+Menganalisis data operasional dan bisnis untuk menghasilkan wawasan yang dapat ditindaklanjuti.
+
+### Persyaratan Kunci
+- S1 Statistika, Matematika, Informatika atau bidang terkait
+- Pengalaman 2+ tahun di bidang analisis data
+- Mahir SQL dan Python
+- Terbiasa dengan alat visualisasi data
+- Kemampuan komunikasi yang baik
+
+### Kompetensi Kunci
+- Berpikir analitis
+- Pemecahan masalah
+- Orientasi pada detail
+- Komunikasi data
+- Rasa ingin tahu
+"""
+
+
+class StubState:
+    """Pengaturan stub dan jumlah request yang diterima (untuk pengujian)."""
+
+    def __init__(self, first_token_delay=0.0, token_delay=0.0, profile=STUB_PROFILE):
+        self.first_token_delay = first_token_delay
+        self.token_delay = token_delay
+        self.profile = profile
+        self.requests = 0
+        self._lock = threading.Lock()
+
+    def count_request(self):
+        with self._lock:
+            self.requests += 1
+
+
+def make_handler(state):
+    class StubHandler(BaseHTTPRequestHandler):
+        def log_message(self, format, *args):
+            pass
+
+        def do_POST(self):
+            if not self.path.rstrip('/').endswith('/chat/completions'):
+                self.send_error(404)
+                return
+            body = json.loads(self.rfile.read(int(self.headers.get('Content-Length', 0))) or b'{}')
+            state.count_request()
+            time.sleep(state.first_token_delay)
+            if body.get('stream'):
+                self._stream(body.get('model', 'stub'))
+            else:
+                self._complete(body.get('model', 'stub'))
+
+        def _chunk(self, model, delta, finish_reason=None):
+            return {
+                'id': 'chatcmpl-stub', 'object': 'chat.completion.chunk', 'created': int(time.time()),
+                'model': model,
+                'choices': [{'index': 0, 'delta': delta, 'finish_reason': finish_reason}],
+            }
+
+        def _stream(self, model):
+            self.send_response(200)
+            self.send_header('Content-Type', 'text/event-stream')
+            self.send_header('Cache-Control', 'no-cache')
+            self.end_headers()
+            for token in re.findall(r'\S+\s*|\s+', state.profile):
+                event = self._chunk(model, {'content': token})
+                self.wfile.write(f"data: {json.dumps(event)}\n\n".encode())
+                self.wfile.flush()
+                time.sleep(state.token_delay)
+            self.wfile.write(f"data: {json.dumps(self._chunk(model, {}, 'stop'))}\n\n".encode())
+            self.wfile.write(b"data: [DONE]\n\n")
+            self.wfile.flush()
+
+        def _complete(self, model):
+            time.sleep(state.token_delay * len(state.profile.split()))
+            payload = json.dumps({
+                'id': 'chatcmpl-stub', 'object': 'chat.completion', 'created': int(time.time()),
+                'model': model,
+                'choices': [{
+                    'index': 0, 'finish_reason': 'stop',
+                    'message': {'role': 'assistant', 'content': state.profile},
+                }],
+                'usage': {'prompt_tokens': 0, 'completion_tokens': 0, 'total_tokens': 0},
+            }).encode()
+            self.send_response(200)
+            self.send_header('Content-Type', 'application/json')
+            self.send_header('Content-Length', str(len(payload)))
+            self.end_headers()
+            self.wfile.write(payload)
+
+    return StubHandler
+
+
+def start_stub_server(host='127.0.0.1', port=0, **state_kwargs):
+    """Jalankan stub di thread latar; kembalikan (server, state, base_url)."""
+    state = StubState(**state_kwargs)
+    server = ThreadingHTTPServer((host, port), make_handler(state))
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server, state, f"http://{host}:{server.server_address[1]}/v1"
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Stub lokal endpoint OpenAI-compatible.")
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=8765)
+    parser.add_argument('--first-token-delay', type=float, default=0.5)
+    parser.add_argument('--token-delay', type=float, default=0.02)
+    args = parser.parse_args()
+
+    state = StubState(args.first_token_delay, args.token_delay)
+    server = ThreadingHTTPServer((args.host, args.port), make_handler(state))
+    print(f"Stub LLM berjalan di http://{args.host}:{args.port}/v1")
+    server.serve_forever()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,180 @@
+"""
+Generator data sintetis dengan skema sama dengan `dataset/Study Case DA - *.csv`.
+
+Distribusi nilai diambil dari dataset asli (resampling empiris):
+- employees: setiap kolom id dimensi dan masa kerja di-sample dari distribusi
+  marjinalnya; nama depan/belakang dikombinasikan dari nama yang ada.
+- competencies_yearly, papi_scores, performance_yearly: setiap karyawan
+  mendapat grid yang sama (pilar x tahun, skala, tahun) dengan skor di-sample
+  per sel grid, termasuk proporsi nilai kosong.
+- strengths: urutan 14 tema diambil utuh dari satu karyawan asli (agar tetap
+  permutasi yang valid).
+- profiles_psych: setiap kolom di-sample terpisah, kecuali disc/disc_word
+  yang di-sample berpasangan.
+Tabel dimensi disalin apa adanya. Data ditulis per batch karyawan sehingga
+skala 1 juta karyawan tidak perlu muat di memori sekaligus.
+
+    python -m benchmarks.synth_data --employees 50000 --out .cache/synth/50k
+    python -m benchmarks.synth_data --employees 1000000 --out .cache/synth/1m --format parquet
+"""
+
+import argparse
+import os
+import shutil
+
+import numpy as np
+import pandas as pd
+
+from talent_match.embedded import CSV_PREFIX, TABLE_SCHEMAS
+
+EMPLOYEE_TABLES = ['employees', 'performance_yearly', 'competencies_yearly', 'papi_scores', 'profiles_psych', 'strengths']
+
+# Kolom kunci grid per karyawan untuk tabel tahunan/skala
+GRID_KEYS = {
+    'performance_yearly': ['year'],
+    'competencies_yearly': ['pillar_code', 'year'],
+    'papi_scores': ['scale_code'],
+}
+
+# Kolom profiles_psych yang di-sample bersama
+PSYCH_GROUPS = [['pauli'], ['faxtor'], ['disc', 'disc_word'], ['mbti'], ['iq'], ['gtq'], ['tiki']]
+
+PANDAS_TYPES = {'VARCHAR': 'string', 'INTEGER': 'Int64', 'DOUBLE': 'float64'}
+
+
+def read_source(dataset_dir, table):
+    """Baca CSV asli sebagai string mentah (nilai kosong tetap '')."""
+    path = os.path.join(dataset_dir, f'{CSV_PREFIX}{table}.csv')
+    return pd.read_csv(path, dtype=str, keep_default_na=False)
+
+
+class SyntheticDataset:
+    """Model resampling yang di-fit dari dataset asli."""
+
+    def __init__(self, dataset_dir, seed=42):
+        self.rng = np.random.default_rng(seed)
+        self.source = {table: read_source(dataset_dir, table) for table in EMPLOYEE_TABLES}
+
+        df_emp = self.source['employees']
+        self.employee_columns = [c for c in df_emp.columns if c not in ('employee_id', 'fullname', 'nip')]
+        names = df_emp['fullname'].str.split()
+        self.first_names = names.str[0].to_numpy()
+        self.last_names = names.str[1:].str.join(' ').replace('', np.nan).dropna().to_numpy()
+
+        # Nilai per sel grid, urut sesuai kemunculan di CSV asli
+        self.grids = {}
+        for table, keys in GRID_KEYS.items():
+            df = self.source[table]
+            value_col = [c for c in df.columns if c not in keys and c != 'employee_id'][0]
+            cells = df.groupby(keys, sort=False)[value_col].apply(lambda s: s.to_numpy())
+            self.grids[table] = (keys, value_col, cells)
+
+        df_str = self.source['strengths']
+        df_str = df_str.assign(rank_order=df_str['rank'].astype(int)).sort_values(['employee_id', 'rank_order'])
+        self.strength_ranks = df_str.groupby('employee_id')['rank'].apply(lambda s: s.to_numpy())
+        self.strength_themes = df_str.groupby('employee_id')['theme'].apply(lambda s: s.to_numpy())
+
+    def employees(self, ids):
+        n = len(ids)
+        df_emp = self.source['employees']
+        columns = {'employee_id': ids}
+        first = self.rng.choice(self.first_names, n)
+        last = self.rng.choice(self.last_names, n)
+        columns['fullname'] = pd.Series(first).str.cat(last, sep=' ').to_numpy()
+        columns['nip'] = self.rng.integers(100000, 1000000, n).astype(str)
+        for col in self.employee_columns:
+            columns[col] = self.rng.choice(df_emp[col].to_numpy(), n)
+        return pd.DataFrame(columns, columns=df_emp.columns)
+
+    def grid_table(self, table, ids):
+        keys, value_col, cells = self.grids[table]
+        frames = []
+        for key, values in cells.items():
+            key = key if isinstance(key, tuple) else (key,)
+            frame = {'employee_id': ids, value_col: self.rng.choice(values, len(ids))}
+            frame.update({k: v for k, v in zip(keys, key)})
+            frames.append(pd.DataFrame(frame))
+        return pd.concat(frames, ignore_index=True)[self.source[table].columns]
+
+    def profiles_psych(self, ids):
+        df = self.source['profiles_psych']
+        columns = {'employee_id': ids}
+        for group in PSYCH_GROUPS:
+            picked = self.rng.integers(0, len(df), len(ids))
+            for col in group:
+                columns[col] = df[col].to_numpy()[picked]
+        return pd.DataFrame(columns, columns=df.columns)
+
+    def strengths(self, ids):
+        donors = self.rng.integers(0, len(self.strength_themes), len(ids))
+        ranks = np.concatenate(self.strength_ranks.to_numpy()[donors])
+        themes = np.concatenate(self.strength_themes.to_numpy()[donors])
+        counts = [len(r) for r in self.strength_ranks.to_numpy()[donors]]
+        return pd.DataFrame({'employee_id': np.repeat(ids, counts), 'rank': ranks, 'theme': themes})
+
+    def batch(self, ids):
+        """Frame semua tabel karyawan untuk satu batch employee_id."""
+        return {
+            'employees': self.employees(ids),
+            'performance_yearly': self.grid_table('performance_yearly', ids),
+            'competencies_yearly': self.grid_table('competencies_yearly', ids),
+            'papi_scores': self.grid_table('papi_scores', ids),
+            'profiles_psych': self.profiles_psych(ids),
+            'strengths': self.strengths(ids),
+        }
+
+
+def typed_frame(table, df):
+    """Konversi kolom string mentah ke tipe `TABLE_SCHEMAS` (untuk Parquet)."""
+    df = df.replace('', None)
+    return df.astype({col: PANDAS_TYPES[sql_type] for col, sql_type in TABLE_SCHEMAS[table].items()})
+
+
+def generate(dataset_dir, out_dir, n_employees, file_format='csv', batch_size=50000, seed=42):
+    """Tulis dataset sintetis berisi `n_employees` karyawan ke `out_dir`."""
+    os.makedirs(out_dir, exist_ok=True)
+    model = SyntheticDataset(dataset_dir, seed)
+
+    for table in TABLE_SCHEMAS:
+        if table not in EMPLOYEE_TABLES:
+            shutil.copy(os.path.join(dataset_dir, f'{CSV_PREFIX}{table}.csv'), out_dir)
+
+    if file_format == 'parquet':
+        # pyarrow hanya dibutuhkan untuk output Parquet
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+
+    writers = {}
+    try:
+        for start in range(0, n_employees, batch_size):
+            ids = np.array([f'SYN{i:07d}' for i in range(start, min(start + batch_size, n_employees))])
+            for table, df in model.batch(ids).items():
+                path = os.path.join(out_dir, f'{CSV_PREFIX}{table}.{file_format}')
+                if file_format == 'csv':
+                    df.to_csv(path, mode='w' if start == 0 else 'a', header=start == 0, index=False)
+                else:
+                    arrow_table = pa.Table.from_pandas(typed_frame(table, df), preserve_index=False)
+                    if table not in writers:
+                        writers[table] = pq.ParquetWriter(path, arrow_table.schema)
+                    writers[table].write_table(arrow_table)
+    finally:
+        for writer in writers.values():
+            writer.close()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Generator data sintetis skala besar.")
+    parser.add_argument('--employees', type=int, required=True)
+    parser.add_argument('--out', required=True)
+    parser.add_argument('--dataset-dir', default='dataset')
+    parser.add_argument('--format', choices=['csv', 'parquet'], default='csv')
+    parser.add_argument('--batch-size', type=int, default=50000)
+    parser.add_argument('--seed', type=int, default=42)
+    args = parser.parse_args()
+
+    generate(args.dataset_dir, args.out, args.employees, args.format, args.batch_size, args.seed)
+    print(f"{args.employees} karyawan sintetis ditulis ke {args.out} ({args.format}).")
+
+
+if __name__ == '__main__':
+    main()
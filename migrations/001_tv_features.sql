@@ -0,0 +1,210 @@
+-- =====================================================================
+-- Feature store TV: flag 10 TV per karyawan yang disimpan permanen.
+--
+-- CTE 2-7 di task2.sql (latest_performance s/d tv_scores_wide) hanya berubah
+-- saat data tahunan baru dimuat, jadi hasilnya disimpan di tabel `tv_features`.
+-- Trigger pada tabel sumber mencatat employee_id yang berubah ke
+-- `tv_features_dirty`, lalu `refresh_tv_features()` hanya menghitung ulang
+-- karyawan tersebut.
+--
+-- Jalankan sekali:   psql "$DATABASE_URL" -f migrations/001_tv_features.sql
+-- Refresh inkremental: SELECT refresh_tv_features();
+-- Refresh penuh:       SELECT refresh_tv_features(TRUE);
+-- =====================================================================
+
+-- 1. Index pendukung untuk tabel sumber
+CREATE INDEX IF NOT EXISTS idx_performance_yearly_emp_year
+    ON performance_yearly (employee_id, year DESC);
+CREATE INDEX IF NOT EXISTS idx_competencies_yearly_emp_pillar_year
+    ON competencies_yearly (employee_id, pillar_code, year DESC);
+CREATE INDEX IF NOT EXISTS idx_papi_scores_emp_scale
+    ON papi_scores (employee_id, scale_code);
+CREATE INDEX IF NOT EXISTS idx_strengths_emp_theme_top5
+    ON strengths (employee_id, theme) WHERE rank <= 5;
+
+-- 2. Definisi rule engine TV (sama dengan CTE 2-7 task2.sql).
+--    View di bawah dihasilkan dari talent_match/rules.py (TV_RULES), jangan diedit
+--    manual. Jika rule berubah, ganti seluruh statement dengan output
+--    `python -m talent_match.rule_engine --view` (dicek oleh tests/test_rule_parity.py).
+CREATE OR REPLACE VIEW tv_features_source AS
+WITH
+latest_performance AS (
+    SELECT DISTINCT ON (employee_id)
+        employee_id, rating
+    FROM performance_yearly
+    WHERE rating BETWEEN 1 AND 5
+    ORDER BY employee_id, year DESC
+),
+
+latest_competencies AS (
+    SELECT DISTINCT ON (employee_id, pillar_code)
+        employee_id, pillar_code, CAST(NULLIF(CAST(score AS TEXT), '') AS DOUBLE PRECISION) AS score
+    FROM competencies_yearly
+    WHERE NULLIF(CAST(score AS TEXT), '') IS NOT NULL
+    ORDER BY employee_id, pillar_code, year DESC
+),
+
+pivot_competencies AS (
+    SELECT
+        employee_id,
+        MAX(CASE WHEN pillar_code = 'LIE' THEN score ELSE NULL END) AS "LIE",
+        MAX(CASE WHEN pillar_code = 'SEA' THEN score ELSE NULL END) AS "SEA",
+        MAX(CASE WHEN pillar_code = 'STO' THEN score ELSE NULL END) AS "STO",
+        MAX(CASE WHEN pillar_code = 'GDR' THEN score ELSE NULL END) AS "GDR"
+    FROM latest_competencies
+    GROUP BY employee_id
+),
+
+pivot_papi AS (
+    SELECT
+        employee_id,
+        MAX(CASE WHEN scale_code = 'Papi_L' THEN score ELSE NULL END) AS "Papi_L",
+        MAX(CASE WHEN scale_code = 'Papi_A' THEN score ELSE NULL END) AS "Papi_A",
+        MAX(CASE WHEN scale_code = 'Papi_B' THEN score ELSE NULL END) AS "Papi_B",
+        MAX(CASE WHEN scale_code = 'Papi_C' THEN score ELSE NULL END) AS "Papi_C"
+    FROM papi_scores
+    WHERE score IS NOT NULL
+    GROUP BY employee_id
+)
+
+-- Tema strengths top 5 ditulis langsung di EXISTS agar memakai idx_strengths_emp_theme_top5
+SELECT
+    e.employee_id,
+    CASE WHEN pc."LIE" >= 2.0 AND pc."SEA" >= 1.8 THEN 1 ELSE 0 END AS "tv_lie_skill",
+    CASE WHEN pp."Papi_L" > 5 AND pp."Papi_A" > 4 THEN 1 ELSE 0 END AS "tv_leadership_drive",
+    CASE WHEN EXISTS (SELECT 1 FROM strengths s WHERE s.employee_id = e.employee_id AND s.rank <= 5 AND s.theme = 'Command') THEN 1 ELSE 0 END AS "tv_command_talent",
+    CASE WHEN pc."STO" >= 1.8 THEN 1 ELSE 0 END AS "tv_sto_skill",
+    CASE WHEN pp."Papi_B" < 5 AND pp."Papi_C" < 6 THEN 1 ELSE 0 END AS "tv_agility_profile",
+    CASE WHEN EXISTS (SELECT 1 FROM strengths s WHERE s.employee_id = e.employee_id AND s.rank <= 5 AND s.theme = 'Strategic') THEN 1 ELSE 0 END AS "tv_strategic_talent",
+    CASE WHEN EXISTS (SELECT 1 FROM strengths s WHERE s.employee_id = e.employee_id AND s.rank <= 5 AND s.theme = 'Achiever') THEN 1 ELSE 0 END AS "tv_achiever_talent",
+    CASE WHEN pc."GDR" > 1.0 THEN 1 ELSE 0 END AS "tv_gdr_skill",
+    CASE WHEN g.name IN ('IV', 'V') AND e.years_of_service_months > 49 THEN 1 ELSE 0 END AS "tv_context_filter",
+    CASE WHEN ps.iq > 101 THEN 1 ELSE 0 END AS "tv_cognitive_filter"
+FROM employees e
+LEFT JOIN latest_performance lp ON e.employee_id = lp.employee_id
+LEFT JOIN pivot_competencies pc ON e.employee_id = pc.employee_id
+LEFT JOIN pivot_papi pp ON e.employee_id = pp.employee_id
+LEFT JOIN profiles_psych ps ON e.employee_id = ps.employee_id
+LEFT JOIN dim_grades g ON e.grade_id = g.grade_id
+WHERE lp.rating IS NOT NULL
+ORDER BY e.employee_id;
+
+-- 3. Tabel feature store dan antrian karyawan yang berubah
+CREATE TABLE IF NOT EXISTS tv_features (
+    employee_id TEXT PRIMARY KEY,
+    tv_lie_skill SMALLINT NOT NULL,
+    tv_leadership_drive SMALLINT NOT NULL,
+    tv_command_talent SMALLINT NOT NULL,
+    tv_sto_skill SMALLINT NOT NULL,
+    tv_agility_profile SMALLINT NOT NULL,
+    tv_strategic_talent SMALLINT NOT NULL,
+    tv_achiever_talent SMALLINT NOT NULL,
+    tv_gdr_skill SMALLINT NOT NULL,
+    tv_context_filter SMALLINT NOT NULL,
+    tv_cognitive_filter SMALLINT NOT NULL,
+    refreshed_at TIMESTAMPTZ NOT NULL DEFAULT now()
+);
+
+CREATE TABLE IF NOT EXISTS tv_features_dirty (
+    employee_id TEXT PRIMARY KEY
+);
+
+-- 4. Trigger: catat employee_id yang berubah di tabel sumber
+CREATE OR REPLACE FUNCTION mark_tv_features_dirty()
+RETURNS TRIGGER LANGUAGE plpgsql AS $$
+BEGIN
+    IF TG_OP IN ('INSERT', 'UPDATE') THEN
+        INSERT INTO tv_features_dirty (employee_id)
+        SELECT DISTINCT employee_id FROM new_rows
+        ON CONFLICT DO NOTHING;
+    END IF;
+    IF TG_OP IN ('UPDATE', 'DELETE') THEN
+        INSERT INTO tv_features_dirty (employee_id)
+        SELECT DISTINCT employee_id FROM old_rows
+        ON CONFLICT DO NOTHING;
+    END IF;
+    RETURN NULL;
+END;
+$$;
+
+DO $$
+DECLARE
+    source_table TEXT;
+BEGIN
+    -- Transition table hanya boleh untuk satu event per trigger
+    FOREACH source_table IN ARRAY ARRAY[
+        'employees', 'performance_yearly', 'competencies_yearly',
+        'papi_scores', 'strengths', 'profiles_psych'
+    ] LOOP
+        EXECUTE format('DROP TRIGGER IF EXISTS %I ON %I', source_table || '_tv_dirty_ins', source_table);
+        EXECUTE format('DROP TRIGGER IF EXISTS %I ON %I', source_table || '_tv_dirty_upd', source_table);
+        EXECUTE format('DROP TRIGGER IF EXISTS %I ON %I', source_table || '_tv_dirty_del', source_table);
+        EXECUTE format(
+            'CREATE TRIGGER %I AFTER INSERT ON %I REFERENCING NEW TABLE AS new_rows '
+            'FOR EACH STATEMENT EXECUTE FUNCTION mark_tv_features_dirty()',
+            source_table || '_tv_dirty_ins', source_table);
+        EXECUTE format(
+            'CREATE TRIGGER %I AFTER UPDATE ON %I REFERENCING OLD TABLE AS old_rows NEW TABLE AS new_rows '
+            'FOR EACH STATEMENT EXECUTE FUNCTION mark_tv_features_dirty()',
+            source_table || '_tv_dirty_upd', source_table);
+        EXECUTE format(
+            'CREATE TRIGGER %I AFTER DELETE ON %I REFERENCING OLD TABLE AS old_rows '
+            'FOR EACH STATEMENT EXECUTE FUNCTION mark_tv_features_dirty()',
+            source_table || '_tv_dirty_del', source_table);
+    END LOOP;
+END;
+$$;
+
+-- 5. Refresh: hanya karyawan di tv_features_dirty, atau semua jika full_refresh
+--    (perubahan pada dim_grades memerlukan refresh penuh)
+CREATE OR REPLACE FUNCTION refresh_tv_features(full_refresh BOOLEAN DEFAULT FALSE)
+RETURNS INTEGER LANGUAGE plpgsql AS $$
+DECLARE
+    changed_ids TEXT[];
+    n_refreshed INTEGER;
+BEGIN
+    IF full_refresh THEN
+        DELETE FROM tv_features_dirty;
+        DELETE FROM tv_features;
+        INSERT INTO tv_features (
+            employee_id, tv_lie_skill, tv_leadership_drive, tv_command_talent,
+            tv_sto_skill, tv_agility_profile, tv_strategic_talent,
+            tv_achiever_talent, tv_gdr_skill, tv_context_filter, tv_cognitive_filter
+        )
+        SELECT
+            employee_id, tv_lie_skill, tv_leadership_drive, tv_command_talent,
+            tv_sto_skill, tv_agility_profile, tv_strategic_talent,
+            tv_achiever_talent, tv_gdr_skill, tv_context_filter, tv_cognitive_filter
+        FROM tv_features_source;
+        GET DIAGNOSTICS n_refreshed = ROW_COUNT;
+        RETURN n_refreshed;
+    END IF;
+
+    WITH claimed AS (
+        DELETE FROM tv_features_dirty RETURNING employee_id
+    )
+    SELECT COALESCE(array_agg(employee_id), '{}') INTO changed_ids FROM claimed;
+
+    IF cardinality(changed_ids) = 0 THEN
+        RETURN 0;
+    END IF;
+
+    DELETE FROM tv_features WHERE employee_id = ANY(changed_ids);
+    INSERT INTO tv_features (
+        employee_id, tv_lie_skill, tv_leadership_drive, tv_command_talent,
+        tv_sto_skill, tv_agility_profile, tv_strategic_talent,
+        tv_achiever_talent, tv_gdr_skill, tv_context_filter, tv_cognitive_filter
+    )
+    SELECT
+        employee_id, tv_lie_skill, tv_leadership_drive, tv_command_talent,
+        tv_sto_skill, tv_agility_profile, tv_strategic_talent,
+        tv_achiever_talent, tv_gdr_skill, tv_context_filter, tv_cognitive_filter
+    FROM tv_features_source
+    WHERE employee_id = ANY(changed_ids);
+
+    RETURN cardinality(changed_ids);
+END;
+$$;
+
+-- 6. Isi awal
+SELECT refresh_tv_features(TRUE);
@@ -0,0 +1,49 @@
+-- =====================================================================
+-- Versi data per tabel: dinaikkan oleh trigger setiap kali tabel sumber
+-- berubah (INSERT/UPDATE/DELETE/TRUNCATE, satu kali per statement).
+--
+-- Dashboard membaca tabel ini sebagai probe murah (talent_match/data_version.py)
+-- dan hanya membangun ulang cache yang bergantung pada tabel yang berubah.
+-- Tanpa migrasi ini dashboard memakai COUNT(*)/MAX(year) per tabel, yang
+-- tidak mendeteksi UPDATE yang tidak mengubah jumlah baris.
+--
+-- Jalankan sekali (setelah 001): psql "$DATABASE_URL" -f migrations/002_data_versions.sql
+-- =====================================================================
+
+-- 1. Tabel versi
+CREATE TABLE IF NOT EXISTS data_versions (
+    table_name TEXT PRIMARY KEY,
+    version BIGINT NOT NULL DEFAULT 0,
+    updated_at TIMESTAMPTZ NOT NULL DEFAULT now()
+);
+
+-- 2. Trigger: naikkan versi tabel yang berubah
+CREATE OR REPLACE FUNCTION bump_data_version()
+RETURNS TRIGGER LANGUAGE plpgsql AS $$
+BEGIN
+    INSERT INTO data_versions (table_name, version, updated_at)
+    VALUES (TG_TABLE_NAME, 1, now())
+    ON CONFLICT (table_name) DO UPDATE
+        SET version = data_versions.version + 1, updated_at = now();
+    RETURN NULL;
+END;
+$$;
+
+DO $$
+DECLARE
+    source_table TEXT;
+BEGIN
+    FOREACH source_table IN ARRAY ARRAY[
+        'employees', 'performance_yearly', 'competencies_yearly', 'papi_scores',
+        'strengths', 'profiles_psych', 'dim_grades', 'dim_directorates',
+        'dim_positions', 'tv_features'
+    ] LOOP
+        INSERT INTO data_versions (table_name) VALUES (source_table) ON CONFLICT DO NOTHING;
+        EXECUTE format('DROP TRIGGER IF EXISTS %I ON %I', source_table || '_data_version', source_table);
+        EXECUTE format(
+            'CREATE TRIGGER %I AFTER INSERT OR UPDATE OR DELETE OR TRUNCATE ON %I '
+            'FOR EACH STATEMENT EXECUTE FUNCTION bump_data_version()',
+            source_table || '_data_version', source_table);
+    END LOOP;
+END;
+$$;
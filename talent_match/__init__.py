@@ -0,0 +1 @@
+"""Inti perhitungan Talent Match yang dipakai oleh dashboard `app.py`."""
@@ -0,0 +1,126 @@
+"""
+Profil pekerjaan dari LLM (endpoint OpenAI-compatible, default OpenRouter).
+
+`stream_ai_profile` mengembalikan potongan teks satu per satu (streaming API),
+dan `ProfileStreamParser` mem-parsing teks parsial tersebut secara inkremental:
+bagian `###` yang sudah lengkap hanya di-parse sekali. `stream_alongside`
+membaca stream di worker terpisah sambil menunggu pekerjaan lain (query
+talenta), sehingga hasil pekerjaan itu bisa ditampilkan sebelum stream selesai.
+"""
+
+import queue
+import re
+from concurrent.futures import FIRST_COMPLETED, wait
+
+DEFAULT_BASE_URL = "https://openrouter.ai/api/v1"
+DEFAULT_MODEL = "z-ai/glm-4.5-air:free"
+
+PROMPT_TEMPLATE = """
+Anda adalah asisten HR yang membantu manajer membuat profil pekerjaan.
+Buat profil pekerjaan untuk lowongan baru di perusahaan kami.
+Nama Peran: {role_name}
+Level Pekerjaan: {job_level}
+Tujuan Peran: {role_purpose}
+
+Format output dalam 3 bagian (GUNAKAN MARKDOWN):
+### Deskripsi Pekerjaan
+[Buat deskripsi singkat 2-3 kalimat]
+
+### Persyaratan Kunci
+[Buat 5-7 bullet points persyaratan]
+
+### Kompetensi Kunci
+[Buat 5-7 bullet points kompetensi]
+"""
+
+# Pola regex yang lebih fleksibel (menggunakan \s+ bukan \s*\n)
+SECTION_PATTERN = re.compile(r'###\s*(.*?)\s+(.*?)(?=\n###|\Z)', re.DOTALL | re.IGNORECASE)
+
+
+def build_prompt(role_name, job_level, role_purpose):
+    return PROMPT_TEMPLATE.format(role_name=role_name, job_level=job_level, role_purpose=role_purpose)
+
+
+def stream_ai_profile(client, role_name, job_level, role_purpose, model=DEFAULT_MODEL):
+    """Generator potongan teks markdown dari chat completion streaming."""
+    stream = client.chat.completions.create(
+        model=model,
+        messages=[{"role": "user", "content": build_prompt(role_name, job_level, role_purpose)}],
+        extra_headers={"HTTP-Referer": "http://localhost:8501"},
+        stream=True,
+    )
+    for event in stream:
+        if event.choices and event.choices[0].delta and event.choices[0].delta.content:
+            yield event.choices[0].delta.content
+
+
+def section_label(category):
+    """Ubah nama kategori agar sesuai dengan PDF."""
+    if "deskripsi" in category.lower():
+        return "Job description"
+    if "persyaratan" in category.lower():
+        return "Job requirements"
+    if "kompetensi" in category.lower():
+        return "key competencies"
+    return category
+
+
+def parse_profile_sections(ai_text_response):
+    """Daftar baris {"Column", "Desc"} untuk setiap bagian `###` di teks."""
+    return [
+        {"Column": section_label(category.strip()), "Desc": description.strip()}
+        for category, description in SECTION_PATTERN.findall(ai_text_response)
+    ]
+
+
+class ProfileStreamParser:
+    """Parser inkremental untuk teks profil yang datang sepotong-sepotong."""
+
+    def __init__(self):
+        self.text = ""
+        self._complete_rows = []
+        self._open_from = 0
+
+    def feed(self, chunk):
+        self.text += chunk
+        # Bagian sebelum '\n###' terakhir sudah lengkap; parse sekali lalu simpan
+        boundary = self.text.rfind('\n###', self._open_from)
+        if boundary > self._open_from:
+            self._complete_rows.extend(parse_profile_sections(self.text[self._open_from:boundary]))
+            self._open_from = boundary + 1
+
+    def rows(self):
+        """Baris hasil parsing sejauh ini, termasuk bagian terakhir yang belum lengkap."""
+        return self._complete_rows + parse_profile_sections(self.text[self._open_from:])
+
+
+def stream_alongside(executor, chunks, future, on_chunks, on_result, poll_interval=0.05):
+    """
+    Baca iterator `chunks` di `executor` sambil menunggu `future`. Di thread
+    pemanggil: `on_chunks(teks)` untuk potongan yang sudah masuk (digabung per
+    putaran) dan `on_result(hasil)` begitu `future` selesai, mana pun yang
+    lebih dulu. Kembali setelah stream habis dan `future` selesai.
+    """
+    received = queue.Queue()
+
+    def read_stream():
+        for chunk in chunks:
+            received.put(chunk)
+
+    stream_future = executor.submit(read_stream)
+    result_pending = True
+    while True:
+        batch = []
+        while not received.empty():
+            batch.append(received.get_nowait())
+        if batch:
+            on_chunks(''.join(batch))
+        if result_pending and future.done():
+            result_pending = False
+            on_result(future.result())
+        if stream_future.done() and received.empty() and not result_pending:
+            break
+        # Bangun saat salah satu selesai; timeout agar potongan baru tetap ditampilkan
+        wait([f for f in (future, stream_future) if not f.done()] or [stream_future],
+             timeout=poll_interval, return_when=FIRST_COMPLETED)
+    stream_future.result()
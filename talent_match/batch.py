@@ -0,0 +1,176 @@
+"""
+Batch scoring tanpa Streamlit: banyak set benchmark sekaligus (mis. top
+performer setiap posisi untuk succession planning), hasil ke Parquet.
+
+    python -m talent_match.batch --benchmarks sets.csv --out .cache/batch --dataset-dir dataset
+    DATABASE_URL=postgresql://... python -m talent_match.batch --benchmarks sets.jsonl --out out/ --workers 8
+
+File benchmark berupa CSV dengan kolom `set_id,benchmark_ids` (ID dipisah
+`;`) atau JSON lines `{"set_id": ..., "benchmark_ids": [...]}`.
+
+Matriks TV dimuat sekali di proses utama. Worker dibuat dengan fork, jadi
+array skor dan index pola dibaca bersama (read-only, copy-on-write) tanpa
+disalin ke setiap proses. Set dengan baseline yang sama dihitung sekali.
+Setiap worker menulis potongan hasilnya sendiri (`part-XXXXX.parquet`)
+sehingga hasil ranking tidak dikirim balik antar proses dan memori tetap
+terbatas per potongan.
+"""
+
+import argparse
+import json
+import multiprocessing
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+import numpy as np
+import pandas as pd
+from sqlalchemy import create_engine
+
+from .cache import baseline_key
+from .embedded import embedded_url, prepare_embedded_database
+from .matching import read_talent_matrix
+from .pattern_index import PatternIndex
+
+# Index pola milik worker (diisi oleh `_init_worker`)
+_worker_index = None
+
+
+def read_benchmark_sets(path):
+    """Daftar (set_id, [employee_id, ...]) dari file CSV atau JSON lines."""
+    if path.endswith(('.jsonl', '.json')):
+        with open(path) as f:
+            records = [json.loads(line) for line in f if line.strip()]
+        return [(str(r['set_id']), [str(emp_id) for emp_id in r['benchmark_ids']]) for r in records]
+
+    df_sets = pd.read_csv(path, dtype=str, keep_default_na=False)
+    return [
+        (set_id, [emp_id.strip() for emp_id in ids.split(';') if emp_id.strip()])
+        for set_id, ids in zip(df_sets['set_id'].tolist(), df_sets['benchmark_ids'].tolist())
+    ]
+
+
+def group_by_baseline(talent_matrix, benchmark_sets):
+    """
+    Kelompokkan set per baseline: ([(baseline, [set_id, ...]), ...], set_id
+    yang dilewati karena tidak ada benchmark yang dikenal).
+    """
+    groups, skipped = {}, []
+    for set_id, benchmark_ids in benchmark_sets:
+        baseline = talent_matrix.baseline(benchmark_ids)
+        if baseline is None:
+            skipped.append(set_id)
+            continue
+        groups.setdefault(baseline_key(baseline), (baseline, []))[1].append(set_id)
+    return list(groups.values()), skipped
+
+
+def _init_worker(pattern_index):
+    global _worker_index
+    _worker_index = pattern_index
+
+
+def ranked_frame(pattern_index, baseline, top_k):
+    """Ranking wide untuk satu baseline: top-K lewat index pola, atau semua karyawan jika top_k = 0."""
+    if top_k > 0:
+        return pattern_index.top_k(baseline, top_k)
+    talent_matrix = pattern_index.matrix
+    order, tgv_match, final_match = talent_matrix.rank(baseline)
+    return talent_matrix.wide_frame(order, baseline, tgv_match, final_match)
+
+
+def score_chunk(part, tasks, out_dir, top_k):
+    """Hitung satu potongan (baseline, set_id) dan tulis ke Parquet; kembalikan (jumlah set, jumlah baris)."""
+    frames = []
+    for baseline, set_ids in tasks:
+        df_ranked = ranked_frame(_worker_index, baseline, top_k)
+        df_ranked.attrs = {}
+        ranks = np.arange(1, len(df_ranked) + 1, dtype=np.int32)
+        for set_id in set_ids:
+            frames.append(df_ranked.assign(set_id=set_id, rank=ranks))
+
+    df_part = pd.concat(frames, ignore_index=True)
+    df_part = df_part[['set_id', 'rank'] + [col for col in df_part.columns if col not in ('set_id', 'rank')]]
+    df_part.to_parquet(os.path.join(out_dir, f'part-{part:05d}.parquet'), index=False)
+    return sum(len(set_ids) for _, set_ids in tasks), len(df_part)
+
+
+def run_batch(pattern_index, benchmark_sets, out_dir, top_k=200, workers=None, chunk_size=16, progress=None):
+    """
+    Skor semua `benchmark_sets` dan tulis dataset Parquet ke `out_dir`.
+    Kembalikan ringkasan (jumlah set, baseline unik, baris, set dilewati, worker, detik).
+    """
+    start = time.perf_counter()
+    os.makedirs(out_dir, exist_ok=True)
+    # Potongan dari run sebelumnya tidak boleh tercampur di dataset output
+    for name in os.listdir(out_dir):
+        if name.startswith('part-') and name.endswith('.parquet'):
+            os.remove(os.path.join(out_dir, name))
+    tasks, skipped = group_by_baseline(pattern_index.matrix, benchmark_sets)
+    chunks = [tasks[i:i + chunk_size] for i in range(0, len(tasks), chunk_size)]
+    workers = workers or os.cpu_count() or 1
+
+    n_sets = n_rows = 0
+    if workers == 1:
+        _init_worker(pattern_index)
+        for part, chunk in enumerate(chunks):
+            sets_done, rows_done = score_chunk(part, chunk, out_dir, top_k)
+            n_sets, n_rows = n_sets + sets_done, n_rows + rows_done
+            if progress:
+                progress(n_sets)
+    else:
+        # Fork: worker mewarisi index dari proses utama tanpa pickle
+        context = multiprocessing.get_context('fork' if 'fork' in multiprocessing.get_all_start_methods() else None)
+        with ProcessPoolExecutor(workers, mp_context=context, initializer=_init_worker, initargs=(pattern_index,)) as pool:
+            futures = [pool.submit(score_chunk, part, chunk, out_dir, top_k) for part, chunk in enumerate(chunks)]
+            for future in as_completed(futures):
+                sets_done, rows_done = future.result()
+                n_sets, n_rows = n_sets + sets_done, n_rows + rows_done
+                if progress:
+                    progress(n_sets)
+
+    return {
+        'sets': n_sets,
+        'baselines': len(tasks),
+        'rows': n_rows,
+        'skipped': skipped,
+        'workers': workers,
+        'seconds': time.perf_counter() - start,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Batch scoring set benchmark ke Parquet.")
+    parser.add_argument('--benchmarks', required=True, help="file set benchmark (.csv atau .jsonl)")
+    parser.add_argument('--out', required=True, help="folder output dataset Parquet")
+    parser.add_argument('--dataset-dir', help="pakai backend embedded dari folder CSV/Parquet ini (default: DATABASE_URL)")
+    parser.add_argument('--cache-dir', default='.cache/embedded')
+    parser.add_argument('--top-k', type=int, default=200, help="kandidat per set (0 = semua karyawan)")
+    parser.add_argument('--workers', type=int, default=None, help="jumlah proses (default: jumlah core)")
+    parser.add_argument('--chunk-size', type=int, default=16, help="baseline per potongan/file Parquet")
+    args = parser.parse_args()
+
+    if args.dataset_dir:
+        db_path = prepare_embedded_database(args.dataset_dir, args.cache_dir)
+        engine = create_engine(embedded_url(db_path), connect_args={'read_only': True})
+    else:
+        engine = create_engine(os.environ['DATABASE_URL'])
+    talent_matrix = read_talent_matrix(engine)
+    # Koneksi ditutup sebelum fork agar tidak diwarisi worker
+    engine.dispose()
+
+    pattern_index = PatternIndex(talent_matrix)
+    benchmark_sets = read_benchmark_sets(args.benchmarks)
+    summary = run_batch(pattern_index, benchmark_sets, args.out, args.top_k, args.workers, args.chunk_size)
+
+    print(
+        f"{summary['sets']} set ({summary['baselines']} baseline unik) -> {summary['rows']} baris di {args.out} "
+        f"dalam {summary['seconds']:.2f} s dengan {summary['workers']} worker "
+        f"({summary['sets'] / max(summary['seconds'], 1e-9):.1f} set/detik)"
+    )
+    if summary['skipped']:
+        print(f"{len(summary['skipped'])} set dilewati (benchmark tidak dikenal): {', '.join(summary['skipped'][:10])}")
+
+
+if __name__ == '__main__':
+    main()
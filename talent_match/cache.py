@@ -0,0 +1,132 @@
+"""
+Cache hasil ranking berdasarkan vektor baseline, bukan employee_id benchmark.
+
+Baseline adalah median 10 flag TV dari 1-3 benchmark, jadi setiap nilainya
+hanya 0, 0.5 atau 1 (paling banyak 3^10 kombinasi). Banyak set benchmark yang
+berbeda menghasilkan baseline yang sama, sehingga hasilnya bisa dipakai ulang.
+
+Layer disk menyimpan hasil sebagai parquet (bukan pickle), sehingga membaca
+folder cache bersama tidak bisa mengeksekusi kode. `attrs` berupa DataFrame
+(histogram, baris benchmark) ditulis ke file parquet terpisah, sedangkan
+vektor (baseline) disimpan di metadata parquet.
+"""
+
+import hashlib
+import os
+import threading
+from collections import OrderedDict
+
+import numpy as np
+import pandas as pd
+
+
+def baseline_key(baseline):
+    """Kunci cache dari vektor baseline, mis. '1-0.5-0-...'."""
+    key = '-'.join(f'{float(value):.6g}' for value in baseline)
+    # Baseline panjang (mode similarity) di-hash agar tetap valid sebagai nama file
+    return key if len(key) <= 128 else hashlib.sha1(key.encode()).hexdigest()
+
+
+class BaselineResultCache:
+    """LRU in-memory (opsional juga di disk) untuk hasil `fetch_talent_data` per baseline."""
+
+    def __init__(self, maxsize=256, disk_dir=None, namespace='default'):
+        self.maxsize = maxsize
+        self.disk_dir = os.path.join(disk_dir, namespace) if disk_dir else None
+        self.hits = 0
+        self.misses = 0
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+        if self.disk_dir:
+            os.makedirs(self.disk_dir, exist_ok=True)
+
+    def __len__(self):
+        with self._lock:
+            return len(self._entries)
+
+    def __contains__(self, baseline):
+        key = baseline_key(baseline)
+        with self._lock:
+            if key in self._entries:
+                return True
+        return self.disk_dir is not None and os.path.exists(self._disk_path(key))
+
+    def _disk_path(self, key, attr=None):
+        name = key if attr is None else f'{key}.{attr}'
+        return os.path.join(self.disk_dir, f'{name}.parquet')
+
+    def _write_parquet(self, df, path):
+        # Tulis ke file sementara dulu agar pembaca lain tidak melihat file setengah jadi
+        tmp_path = f'{path}.{os.getpid()}.{threading.get_ident()}.tmp'
+        df.to_parquet(tmp_path)
+        os.replace(tmp_path, path)
+
+    def _write_disk(self, key, df_results):
+        frames, arrays = [], {}
+        for name, value in df_results.attrs.items():
+            if isinstance(value, pd.DataFrame):
+                self._write_parquet(value, self._disk_path(key, name))
+                frames.append(name)
+            else:
+                arrays[name] = np.asarray(value, dtype=float).tolist()
+        df_plain = df_results.copy(deep=False)
+        df_plain.attrs = {'frames': frames, 'arrays': arrays}
+        # File utama ditulis terakhir: keberadaannya menandakan entri lengkap
+        self._write_parquet(df_plain, self._disk_path(key))
+
+    def _read_disk(self, key):
+        df_results = pd.read_parquet(self._disk_path(key))
+        stored = df_results.attrs
+        attrs = {name: np.asarray(values, dtype=float) for name, values in stored.get('arrays', {}).items()}
+        for name in stored.get('frames', []):
+            attrs[name] = pd.read_parquet(self._disk_path(key, name))
+        df_results.attrs = attrs
+        return df_results
+
+    def _remember(self, key, df_results):
+        with self._lock:
+            self._entries[key] = df_results
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def get(self, baseline):
+        """Hasil untuk baseline ini, atau None jika belum ada."""
+        key = baseline_key(baseline)
+        with self._lock:
+            if key in self._entries:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return self._entries[key]
+
+        if self.disk_dir and os.path.exists(self._disk_path(key)):
+            df_results = self._read_disk(key)
+            self._remember(key, df_results)
+            with self._lock:
+                self.hits += 1
+            return df_results
+
+        with self._lock:
+            self.misses += 1
+        return None
+
+    def put(self, baseline, df_results):
+        key = baseline_key(baseline)
+        self._remember(key, df_results)
+        if self.disk_dir:
+            self._write_disk(key, df_results)
+
+    def get_or_compute(self, baseline, compute):
+        """Ambil dari cache, atau panggil `compute()` lalu simpan hasilnya."""
+        df_results = self.get(baseline)
+        if df_results is None:
+            df_results = compute()
+            if not df_results.empty:
+                self.put(baseline, df_results)
+        return df_results
+
+    def warm(self, baselines, compute_baseline):
+        """Pre-compute hasil untuk daftar baseline (mis. saat startup)."""
+        for baseline in baselines:
+            if baseline not in self:
+                self.put(baseline, compute_baseline(baseline))
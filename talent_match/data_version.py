@@ -0,0 +1,155 @@
+"""
+Versi data per tabel sumber, untuk mengikat cache dashboard ke isi database.
+
+`DataVersionProbe` membaca versi dengan satu query murah:
+- tabel `data_versions` (dinaikkan oleh trigger, lihat
+  `migrations/002_data_versions.sql`), atau
+- jika tabel itu tidak ada (mis. backend embedded): COUNT(*) dan MAX kolom
+  penanda (`year`, `refreshed_at`) per tabel.
+
+Setiap cache hanya bergantung pada tabel di `CACHE_DEPENDENCIES`, jadi
+perubahan `strengths` misalnya tidak membuang daftar karyawan.
+`VersionTracker` tetap menyajikan versi lama selama versi baru dibangun di
+background; versi yang build-nya gagal baru dicoba lagi setelah backoff.
+"""
+
+import hashlib
+import logging
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from sqlalchemy import inspect, text
+
+logger = logging.getLogger(__name__)
+
+VERSION_TABLE = 'data_versions'
+
+# Tabel sumber setiap cache (lihat queries.py dan rule_engine.py)
+CACHE_DEPENDENCIES = {
+    'employee_list': ['employees', 'dim_directorates', 'dim_positions', 'dim_grades'],
+    'talent_matrix': ['tv_features', 'employees', 'dim_directorates', 'dim_positions', 'dim_grades'],
+    'raw_features': [
+        'employees', 'performance_yearly', 'competencies_yearly', 'papi_scores',
+        'profiles_psych', 'strengths', 'dim_grades',
+    ],
+    'similarity': [
+        'employees', 'performance_yearly', 'competencies_yearly', 'papi_scores',
+        'profiles_psych', 'dim_directorates', 'dim_positions', 'dim_grades',
+    ],
+}
+
+# Kolom penanda untuk probe fallback, jika ada di tabel
+MARKER_COLUMNS = ['refreshed_at', 'year']
+
+
+def version_key(versions, tables):
+    """Kunci pendek dari versi `tables` (berubah hanya jika salah satunya berubah)."""
+    digest = hashlib.sha1(';'.join(f'{table}={versions.get(table, "")}' for table in sorted(tables)).encode())
+    return digest.hexdigest()[:12]
+
+
+class DataVersionProbe:
+    """Query probe versi, dibangun sekali per engine dari skema database."""
+
+    def __init__(self, engine, tables=None):
+        self.engine = engine
+        tables = sorted(tables or {t for deps in CACHE_DEPENDENCIES.values() for t in deps})
+        inspector = inspect(engine)
+        if inspector.has_table(VERSION_TABLE):
+            self.mode = 'table'
+            self.query = f"SELECT table_name, CAST(version AS TEXT) FROM {VERSION_TABLE}"
+            return
+
+        self.mode = 'count'
+        selects = []
+        for table in tables:
+            if not inspector.has_table(table):
+                continue
+            # Nama kolom lewat SELECT kosong: inspector.get_columns tidak didukung semua dialect
+            with engine.connect() as conn:
+                columns = set(conn.execute(text(f"SELECT * FROM {table} LIMIT 0")).keys())
+            marker = next((col for col in MARKER_COLUMNS if col in columns), None)
+            marker_sql = f"CAST(MAX({marker}) AS TEXT)" if marker else "''"
+            selects.append(
+                f"SELECT '{table}' AS table_name, CAST(COUNT(*) AS TEXT) || ':' || COALESCE({marker_sql}, '') FROM {table}"
+            )
+        self.query = '\nUNION ALL '.join(selects)
+
+    def versions(self):
+        """{tabel: versi} saat ini."""
+        if not self.query:
+            return {}
+        with self.engine.connect() as conn:
+            return dict(conn.execute(text(self.query)).fetchall())
+
+
+class VersionTracker:
+    """
+    Versi yang sedang disajikan per cache. Jika versi terbaru berbeda,
+    `build(versi_baru)` dijalankan di background; versi lama tetap dipakai
+    sampai build selesai (build yang mengembalikan None dianggap gagal).
+    Build versi yang gagal tidak diulang sebelum `retry_after` detik; jeda ini
+    berlipat dua setiap kegagalan berikutnya, maksimal `max_retry_after`.
+    """
+
+    def __init__(self, max_workers=1, retry_after=60, max_retry_after=3600):
+        self.retry_after = retry_after
+        self.max_retry_after = max_retry_after
+        self._served = {}
+        self._building = {}
+        # {name: (versi, jumlah gagal berturut-turut, waktu monotonic boleh dicoba lagi)}
+        self._failed = {}
+        self._lock = threading.Lock()
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix='data_version')
+
+    def served(self):
+        with self._lock:
+            return dict(self._served)
+
+    def building(self):
+        with self._lock:
+            return dict(self._building)
+
+    def failed(self):
+        """{name: (versi, jumlah gagal)} untuk build yang sedang menunggu backoff."""
+        with self._lock:
+            return {name: (version, failures) for name, (version, failures, _) in self._failed.items()}
+
+    def resolve(self, name, latest, build):
+        """Kunci versi yang boleh dipakai sekarang untuk cache `name`."""
+        with self._lock:
+            current = self._served.get(name)
+            if current is None or latest is None:
+                # Pemakaian pertama dibangun langsung oleh pemanggil
+                self._served.setdefault(name, latest or 'unversioned')
+                return self._served[name]
+            if current == latest or self._building.get(name) == latest:
+                return current
+            failed_version, failures, retry_at = self._failed.get(name, (None, 0, 0))
+            if failed_version == latest and time.monotonic() < retry_at:
+                return current
+            self._building[name] = latest
+
+        def rebuild():
+            try:
+                result = build(latest)
+            except Exception:
+                logger.exception("Build ulang cache %s versi %s gagal", name, latest)
+                result = None
+            with self._lock:
+                if self._building.get(name) != latest:
+                    return
+                del self._building[name]
+                if result is not None:
+                    self._served[name] = latest
+                    self._failed.pop(name, None)
+                    return
+                n_failed = failures + 1 if failed_version == latest else 1
+                delay = min(self.retry_after * 2 ** (n_failed - 1), self.max_retry_after)
+                self._failed[name] = (latest, n_failed, time.monotonic() + delay)
+                logger.warning("Cache %s versi %s gagal dibangun (%d kali), dicoba lagi dalam %s detik",
+                               name, latest, n_failed, delay)
+
+        self._executor.submit(rebuild)
+        return current
@@ -0,0 +1,191 @@
+"""
+Engine SQLAlchemy dengan pool yang dikonfigurasi dan diukur.
+
+- Ukuran pool/overflow, timeout checkout, `pool_pre_ping` (koneksi mati
+  terdeteksi sebelum dipakai) dan `pool_recycle` (koneksi lebih tua dari N
+  detik dibuka ulang, sebelum ditutup oleh pooler/server).
+- `statement_timeout` Postgres di-set sekali per koneksi baru.
+- `MeteredQueuePool` mencatat waktu checkout (menunggu slot, membuka koneksi
+  baru dan pre-ping) serta jumlah koneksi aktif, lihat `pool_metrics()`.
+- `prime_pool()` membuka koneksi di awal agar request pertama tidak
+  membayar reconnect dan TLS.
+
+Cek terhadap Postgres lokal (warm-up, query paralel, lalu backend diputus
+untuk menguji pre-ping):
+
+    DATABASE_URL=postgresql://... python -m talent_match.db --check
+"""
+
+import argparse
+import os
+import threading
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+from sqlalchemy import create_engine, event, text
+from sqlalchemy.pool import QueuePool
+
+
+class PoolMetrics:
+    """Waktu checkout (ring buffer) dan counter event pool."""
+
+    def __init__(self, maxlen=1000):
+        self.checkouts = 0
+        self.connects = 0
+        self.invalidations = 0
+        self._waits = deque(maxlen=maxlen)
+        self._lock = threading.Lock()
+
+    def record_checkout(self, seconds):
+        with self._lock:
+            self.checkouts += 1
+            self._waits.append(seconds * 1000)
+
+    def record_connect(self):
+        with self._lock:
+            self.connects += 1
+
+    def record_invalidation(self):
+        with self._lock:
+            self.invalidations += 1
+
+    def summary(self):
+        with self._lock:
+            waits = np.array(self._waits) if self._waits else np.zeros(1)
+            return {
+                'checkouts': self.checkouts,
+                'connects': self.connects,
+                'invalidations': self.invalidations,
+                'checkout_p50_ms': round(float(np.percentile(waits, 50)), 3),
+                'checkout_p95_ms': round(float(np.percentile(waits, 95)), 3),
+                'checkout_max_ms': round(float(waits.max()), 3),
+            }
+
+
+class MeteredQueuePool(QueuePool):
+    """QueuePool yang mengukur durasi setiap checkout."""
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.metrics = PoolMetrics()
+        event.listen(self, 'connect', self._on_connect)
+        event.listen(self, 'invalidate', self._on_invalidate)
+
+    def _on_connect(self, dbapi_connection, connection_record):
+        self.metrics.record_connect()
+
+    def _on_invalidate(self, dbapi_connection, connection_record, exception):
+        self.metrics.record_invalidation()
+
+    def connect(self):
+        start = time.perf_counter()
+        try:
+            return super().connect()
+        finally:
+            self.metrics.record_checkout(time.perf_counter() - start)
+
+
+def set_statement_timeout(engine, timeout_ms):
+    """Set `statement_timeout` Postgres pada setiap koneksi DBAPI baru."""
+    @event.listens_for(engine, 'connect')
+    def on_connect(dbapi_connection, connection_record):
+        cursor = dbapi_connection.cursor()
+        cursor.execute(f"SET statement_timeout = {int(timeout_ms)}")
+        cursor.close()
+        # Di-commit agar tidak dibatalkan oleh rollback saat koneksi kembali ke pool
+        dbapi_connection.commit()
+
+
+def create_pooled_engine(url, pool_size=5, max_overflow=10, pool_timeout=30, pool_recycle=1800,
+                         pre_ping=True, statement_timeout_ms=None, connect_args=None):
+    """`create_engine` dengan `MeteredQueuePool` dan setelan pool di atas."""
+    engine = create_engine(
+        url,
+        poolclass=MeteredQueuePool,
+        pool_size=pool_size,
+        max_overflow=max_overflow,
+        pool_timeout=pool_timeout,
+        pool_recycle=pool_recycle,
+        pool_pre_ping=pre_ping,
+        connect_args=connect_args or {},
+    )
+    if statement_timeout_ms and engine.dialect.name == 'postgresql':
+        set_statement_timeout(engine, statement_timeout_ms)
+    return engine
+
+
+def pool_metrics(engine):
+    """Status pool (ukuran, koneksi aktif, overflow) dan statistik checkout."""
+    pool = engine.pool
+    metrics = {
+        'pool_size': pool.size(),
+        'checked_out': pool.checkedout(),
+        'checked_in': pool.checkedin(),
+        'overflow': max(pool.overflow(), 0),
+    }
+    if isinstance(pool, MeteredQueuePool):
+        metrics.update(pool.metrics.summary())
+    return metrics
+
+
+def prime_pool(engine, n_connections):
+    """Buka `n_connections` koneksi sekaligus (SELECT 1) lalu kembalikan ke pool."""
+    connections = []
+    try:
+        for _ in range(n_connections):
+            conn = engine.connect()
+            connections.append(conn)
+            conn.execute(text("SELECT 1"))
+    finally:
+        for conn in connections:
+            conn.close()
+    return len(connections)
+
+
+def check_pool(engine, n_queries=50, workers=8):
+    """Warm-up, query paralel, lalu putus backend pool dan query lagi (uji pre-ping)."""
+    def query(_):
+        with engine.connect() as conn:
+            return conn.execute(text("SELECT pg_backend_pid()")).scalar()
+
+    print(f"warm-up: {prime_pool(engine, engine.pool.size())} koneksi", pool_metrics(engine))
+    with ThreadPoolExecutor(workers) as executor:
+        pids = set(executor.map(query, range(n_queries)))
+    print(f"{n_queries} query paralel, {len(pids)} backend", pool_metrics(engine))
+
+    # Koneksi terpisah (di luar pool) memutus semua backend milik pool
+    admin_engine = create_engine(engine.url, poolclass=QueuePool)
+    with admin_engine.connect() as admin:
+        admin.execute(text("SELECT pg_terminate_backend(pid) FROM unnest(CAST(:pids AS INT[])) AS pid"), {'pids': list(pids)})
+    admin_engine.dispose()
+    with ThreadPoolExecutor(workers) as executor:
+        new_pids = set(executor.map(query, range(n_queries)))
+    print(f"setelah backend diputus: {len(new_pids & pids)} backend lama dipakai ulang", pool_metrics(engine))
+    return not (new_pids & pids)
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Cek pool koneksi Postgres (warm-up, pre-ping, metrics).")
+    parser.add_argument('--check', action='store_true', help="jalankan cek warm-up dan pre-ping")
+    parser.add_argument('--pool-size', type=int, default=5)
+    parser.add_argument('--max-overflow', type=int, default=10)
+    parser.add_argument('--statement-timeout-ms', type=int, default=30000)
+    args = parser.parse_args()
+
+    engine = create_pooled_engine(
+        os.environ['DATABASE_URL'], args.pool_size, args.max_overflow, statement_timeout_ms=args.statement_timeout_ms
+    )
+    if args.check:
+        ok = check_pool(engine)
+        with engine.connect() as conn:
+            print("statement_timeout:", conn.execute(text("SHOW statement_timeout")).scalar())
+        print("pre-ping ok" if ok else "pre-ping GAGAL: koneksi mati dipakai ulang")
+    else:
+        prime_pool(engine, args.pool_size)
+        print(pool_metrics(engine))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,136 @@
+"""
+Backend embedded (DuckDB) yang dimuat dari `dataset/Study Case DA - *.csv`
+(atau `*.parquet`, mis. dari `benchmarks/synth_data.py`).
+
+Dipakai untuk development, CI dan load test tanpa Supabase. Semua CSV dimuat
+dengan tipe kolom eksplisit (termasuk `competencies_yearly.score` yang langsung
+di-parse sebagai angka), lalu disimpan sebagai file DuckDB (format kolumnar).
+Startup berikutnya langsung membuka file tersebut selama CSV tidak berubah.
+
+Nama tabel dan kolom sama dengan database Postgres, dan tabel `tv_features`
+ikut dibangun, sehingga `load_employee_list` dan `fetch_talent_data` berjalan
+tanpa perubahan lewat SQLAlchemy (`duckdb:///...`).
+"""
+
+import hashlib
+import json
+import os
+
+import duckdb
+
+from .rule_engine import tv_features_sql
+
+CSV_PREFIX = 'Study Case DA - '
+
+# Tipe kolom eksplisit per tabel (urutan sesuai header CSV)
+TABLE_SCHEMAS = {
+    'employees': {
+        'employee_id': 'VARCHAR', 'fullname': 'VARCHAR', 'nip': 'VARCHAR',
+        'company_id': 'INTEGER', 'area_id': 'INTEGER', 'position_id': 'INTEGER',
+        'department_id': 'INTEGER', 'division_id': 'INTEGER', 'directorate_id': 'INTEGER',
+        'grade_id': 'INTEGER', 'education_id': 'INTEGER', 'major_id': 'INTEGER',
+        'years_of_service_months': 'INTEGER',
+    },
+    'performance_yearly': {'employee_id': 'VARCHAR', 'rating': 'DOUBLE', 'year': 'INTEGER'},
+    'competencies_yearly': {
+        'employee_id': 'VARCHAR', 'score': 'DOUBLE', 'pillar_code': 'VARCHAR', 'year': 'INTEGER',
+    },
+    'papi_scores': {'employee_id': 'VARCHAR', 'scale_code': 'VARCHAR', 'score': 'DOUBLE'},
+    'profiles_psych': {
+        'employee_id': 'VARCHAR', 'pauli': 'INTEGER', 'faxtor': 'INTEGER', 'disc': 'VARCHAR',
+        'disc_word': 'VARCHAR', 'mbti': 'VARCHAR', 'iq': 'DOUBLE', 'gtq': 'DOUBLE', 'tiki': 'INTEGER',
+    },
+    'strengths': {'employee_id': 'VARCHAR', 'rank': 'INTEGER', 'theme': 'VARCHAR'},
+    'dim_areas': {'area_id': 'INTEGER', 'name': 'VARCHAR'},
+    'dim_companies': {'company_id': 'INTEGER', 'name': 'VARCHAR'},
+    'dim_competency_pillars': {'pillar_code': 'VARCHAR', 'pillar_label': 'VARCHAR'},
+    'dim_departments': {'department_id': 'INTEGER', 'name': 'VARCHAR'},
+    'dim_directorates': {'directorate_id': 'INTEGER', 'name': 'VARCHAR'},
+    'dim_divisions': {'division_id': 'INTEGER', 'name': 'VARCHAR'},
+    'dim_education': {'education_id': 'INTEGER', 'name': 'VARCHAR'},
+    'dim_grades': {'grade_id': 'INTEGER', 'name': 'VARCHAR'},
+    'dim_majors': {'major_id': 'INTEGER', 'name': 'VARCHAR'},
+    'dim_positions': {'position_id': 'INTEGER', 'name': 'VARCHAR'},
+}
+
+# Rule engine TV dikompilasi dari rules.TV_RULES (sama dengan view tv_features_source
+# di migrations/001_tv_features.sql)
+TV_FEATURES_BUILD_QUERY = "CREATE TABLE tv_features AS" + tv_features_sql()
+
+
+def csv_path(dataset_dir, table):
+    return os.path.join(dataset_dir, f'{CSV_PREFIX}{table}.csv')
+
+
+def table_path(dataset_dir, table):
+    """File sumber tabel: Parquet jika ada, selain itu CSV."""
+    parquet_path = os.path.join(dataset_dir, f'{CSV_PREFIX}{table}.parquet')
+    return parquet_path if os.path.exists(parquet_path) else csv_path(dataset_dir, table)
+
+
+def dataset_manifest(dataset_dir):
+    """Ukuran dan mtime setiap file sumber; jika berubah, file DuckDB dibangun ulang."""
+    manifest = {}
+    for table in TABLE_SCHEMAS:
+        stat = os.stat(table_path(dataset_dir, table))
+        manifest[table] = [stat.st_size, stat.st_mtime_ns]
+    return manifest
+
+
+def load_tables(conn, dataset_dir, tables=None):
+    """Muat tabel sumber (default semua) ke koneksi DuckDB dengan tipe kolom eksplisit."""
+    for table in tables or TABLE_SCHEMAS:
+        columns = TABLE_SCHEMAS[table]
+        path = table_path(dataset_dir, table)
+        if path.endswith('.parquet'):
+            casts = ', '.join(f'CAST("{col}" AS {col_type}) AS "{col}"' for col, col_type in columns.items())
+            conn.execute(f"CREATE TABLE {table} AS SELECT {casts} FROM read_parquet(?)", [path])
+        else:
+            conn.execute(
+                f"CREATE TABLE {table} AS SELECT * FROM read_csv(?, header = true, columns = ?)",
+                [path, columns],
+            )
+
+
+def build_embedded_database(dataset_dir, db_path):
+    """Muat semua tabel sumber ke file DuckDB baru dan bangun tabel `tv_features`."""
+    tmp_path = f'{db_path}.{os.getpid()}.tmp'
+    if os.path.exists(tmp_path):
+        os.remove(tmp_path)
+
+    conn = duckdb.connect(tmp_path)
+    try:
+        load_tables(conn, dataset_dir)
+        conn.execute(TV_FEATURES_BUILD_QUERY)
+        conn.execute("CHECKPOINT")
+    finally:
+        conn.close()
+    os.replace(tmp_path, db_path)
+
+
+def prepare_embedded_database(dataset_dir='dataset', cache_dir='.cache/embedded'):
+    """
+    Kembalikan path file DuckDB untuk `dataset_dir`, membangunnya dulu jika
+    belum ada atau file sumbernya berubah sejak build terakhir.
+    """
+    os.makedirs(cache_dir, exist_ok=True)
+    db_path = os.path.join(cache_dir, 'talent.duckdb')
+    manifest_path = f'{db_path}.manifest.json'
+    manifest = dataset_manifest(dataset_dir)
+    # Rule TV yang berubah (rules.TV_RULES) juga memicu build ulang
+    manifest['tv_rules'] = hashlib.sha1(TV_FEATURES_BUILD_QUERY.encode()).hexdigest()
+
+    if os.path.exists(db_path) and os.path.exists(manifest_path):
+        with open(manifest_path) as f:
+            if json.load(f) == manifest:
+                return db_path
+
+    build_embedded_database(dataset_dir, db_path)
+    with open(manifest_path, 'w') as f:
+        json.dump(manifest, f)
+    return db_path
+
+
+def embedded_url(db_path):
+    """URL SQLAlchemy (dialek duckdb-engine) untuk file DuckDB."""
+    return f'duckdb:///{os.path.abspath(db_path)}'
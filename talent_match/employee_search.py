@@ -0,0 +1,178 @@
+"""
+Index pencarian karyawan untuk pemilih benchmark (search-as-you-type).
+
+Setiap kata di `fullname`, `employee_id` dan `nip` disimpan di daftar token
+terurut, sehingga pencarian prefix cukup dengan binary search. Query minimal
+3 huruf juga dicari sebagai substring lewat index trigram: posting list
+trigram query di-intersect, lalu kandidatnya dicek dengan `in`. Trigram
+dikodekan sebagai int64 dari 3 code point, jadi index dibangun dengan NumPy
+tanpa loop per karyawan.
+
+Urutan hasil: ID/NIP, lalu awal nama, lalu awal kata lain di nama, lalu
+substring. Hasil yang setara diurutkan berdasarkan nama. Filter direktorat,
+posisi dan grade diterapkan sebelum top-N diambil.
+"""
+
+from bisect import bisect_left
+
+import numpy as np
+import pandas as pd
+
+# Kolom filter: nama kolom di frame karyawan -> label di UI
+SEARCH_FILTERS = {'directorate': 'Direktorat', 'role': 'Posisi', 'grade': 'Grade'}
+
+# Jenis token, juga prioritas hasil (kecil = lebih relevan)
+KIND_ID, KIND_FIRST_NAME, KIND_NAME, KIND_SUBSTRING = 0, 1, 2, 3
+
+
+def normalize(value):
+    return str(value).casefold().strip()
+
+
+def trigram_codes(codepoints):
+    """Kode int64 setiap trigram (3 code point berurutan) per baris matriks code point."""
+    codepoints = codepoints.astype(np.int64)
+    return (codepoints[:, :-2] << 42) | (codepoints[:, 1:-1] << 21) | codepoints[:, 2:]
+
+
+class EmployeeSearchIndex:
+    """Index prefix + trigram di atas frame `employee_id, fullname, nip, directorate, role, grade`."""
+
+    def __init__(self, df_employees):
+        df_employees = df_employees.reset_index(drop=True)
+        self.employee_ids = df_employees['employee_id'].astype(str).to_numpy(dtype=object)
+        fullnames = df_employees['fullname'].fillna('').astype(str)
+        nips = df_employees['nip'].fillna('').astype(str) if 'nip' in df_employees else pd.Series('', index=df_employees.index)
+        self.fullnames = fullnames.to_numpy(dtype=object)
+        self.row_of_id = {emp_id: row for row, emp_id in enumerate(self.employee_ids)}
+
+        # Urutan tampilan hasil setara: nama lalu employee_id
+        rank = pd.DataFrame({'fullname': self.fullnames, 'employee_id': self.employee_ids}).sort_values(
+            ['fullname', 'employee_id']).index.to_numpy()
+        self.name_rank = np.empty(len(rank), dtype=np.int64)
+        self.name_rank[rank] = np.arange(len(rank))
+
+        # Filter sebagai kode kategori (-1 = kosong)
+        self.filter_codes, self.filter_values = {}, {}
+        for column in SEARCH_FILTERS:
+            if column in df_employees:
+                codes, values = pd.factorize(df_employees[column], sort=True)
+                self.filter_codes[column] = codes
+                self.filter_values[column] = [str(value) for value in values]
+
+        # Token prefix: ID dan NIP utuh, kata-kata nama (kata pertama diprioritaskan)
+        rows = pd.Series(np.arange(len(df_employees)))
+        words = fullnames.str.casefold().str.split().explode().dropna()
+        word_rows = words.index.to_numpy()
+        first_word = np.diff(word_rows, prepend=-1) != 0
+        df_tokens = pd.concat([
+            pd.DataFrame({'token': pd.Series(self.employee_ids).str.casefold(), 'row': rows, 'kind': KIND_ID}),
+            pd.DataFrame({'token': nips.str.casefold(), 'row': rows, 'kind': KIND_ID})[nips.to_numpy() != ''],
+            pd.DataFrame({
+                'token': words.to_numpy(), 'row': word_rows,
+                'kind': np.where(first_word, KIND_FIRST_NAME, KIND_NAME),
+            }),
+        ], ignore_index=True).sort_values(['token', 'row'], kind='stable')
+        self.tokens = df_tokens['token'].tolist()
+        self.token_rows = df_tokens['row'].to_numpy(dtype=np.int64)
+        self.token_kinds = df_tokens['kind'].to_numpy(dtype=np.int8)
+
+        # Index trigram atas "nama id nip" (huruf kecil)
+        self.haystack = (fullnames + ' ' + pd.Series(self.employee_ids) + ' ' + nips).map(normalize).tolist()
+        width = max((len(text) for text in self.haystack), default=0)
+        if width >= 3:
+            codepoints = np.array(self.haystack, dtype=f'U{width}').view(np.uint32).reshape(len(self.haystack), width)
+            codes = trigram_codes(codepoints)
+            valid = codepoints[:, 2:] != 0
+            rows = np.broadcast_to(np.arange(len(self.haystack))[:, None], codes.shape)[valid]
+            codes = codes[valid]
+            order = np.lexsort((rows, codes))
+            codes, rows = codes[order], rows[order]
+            keep = np.r_[True, (np.diff(codes) != 0) | (np.diff(rows) != 0)]
+            codes, rows = codes[keep], rows[keep]
+            self.trigrams, starts = np.unique(codes, return_index=True)
+            self.trigram_starts = np.r_[starts, len(codes)]
+            self.trigram_rows = rows
+        else:
+            self.trigrams = np.zeros(0, dtype=np.int64)
+            self.trigram_starts = np.zeros(1, dtype=np.int64)
+            self.trigram_rows = np.zeros(0, dtype=np.int64)
+
+    def __len__(self):
+        return len(self.employee_ids)
+
+    def values(self, column):
+        """Nilai filter yang tersedia untuk `column`."""
+        return self.filter_values.get(column, [])
+
+    def label(self, employee_id):
+        row = self.row_of_id.get(employee_id)
+        return f"{self.fullnames[row]} ({employee_id})" if row is not None else str(employee_id)
+
+    def _prefix_rows(self, term):
+        """(baris, jenis token terbaik) untuk token yang diawali `term`."""
+        lo = bisect_left(self.tokens, term)
+        hi = bisect_left(self.tokens, term + '\U0010ffff', lo)
+        rows, kinds = self.token_rows[lo:hi], self.token_kinds[lo:hi]
+        order = np.lexsort((kinds, rows))
+        rows, kinds = rows[order], kinds[order]
+        first = np.diff(rows, prepend=-1) != 0
+        return rows[first], kinds[first]
+
+    def _substring_rows(self, term):
+        """Baris yang mengandung `term` (minimal 3 huruf) di nama/ID/NIP."""
+        codepoints = np.array([term], dtype=f'U{len(term)}').view(np.uint32).reshape(1, -1)
+        codes = np.unique(trigram_codes(codepoints))
+        positions = np.searchsorted(self.trigrams, codes)
+        if np.any(positions >= len(self.trigrams)) or np.any(self.trigrams[np.minimum(positions, len(self.trigrams) - 1)] != codes):
+            return np.zeros(0, dtype=np.int64)
+        postings = sorted(
+            (self.trigram_rows[self.trigram_starts[p]:self.trigram_starts[p + 1]] for p in positions), key=len
+        )
+        candidates = postings[0]
+        for posting in postings[1:]:
+            candidates = np.intersect1d(candidates, posting, assume_unique=True)
+            if len(candidates) == 0:
+                break
+        haystack = self.haystack
+        return np.array([row for row in candidates.tolist() if term in haystack[row]], dtype=np.int64)
+
+    def _term_rows(self, term, enough=None):
+        rows, kinds = self._prefix_rows(term)
+        # Hasil substring selalu di bawah hasil prefix: tidak perlu dicari jika prefix sudah cukup
+        if len(term) >= 3 and (enough is None or len(rows) < enough):
+            substring_rows = np.setdiff1d(self._substring_rows(term), rows, assume_unique=True)
+            rows = np.r_[rows, substring_rows]
+            kinds = np.r_[kinds, np.full(len(substring_rows), KIND_SUBSTRING, dtype=np.int8)]
+        return rows, kinds.astype(np.int64)
+
+    def search(self, query, limit=50, **filters):
+        """
+        employee_id terbaik untuk `query` (setiap kata harus cocok), maksimal
+        `limit`. `filters` berisi nilai kolom di `SEARCH_FILTERS` (None = semua).
+        """
+        terms = normalize(query).split()
+        filtered = any(value is not None for value in filters.values())
+        if terms:
+            rows, scores = self._term_rows(terms[0], limit if len(terms) == 1 and not filtered else None)
+            for term in terms[1:]:
+                term_rows, term_kinds = self._term_rows(term)
+                rows, left, right = np.intersect1d(rows, term_rows, assume_unique=True, return_indices=True)
+                scores = scores[left] + term_kinds[right]
+        else:
+            rows = np.arange(len(self), dtype=np.int64)
+            scores = np.zeros(len(self), dtype=np.int64)
+
+        for column, value in filters.items():
+            if value is None or column not in self.filter_codes:
+                continue
+            values = self.filter_values[column]
+            code = values.index(value) if value in values else -2
+            mask = self.filter_codes[column][rows] == code
+            rows, scores = rows[mask], scores[mask]
+
+        if len(rows) > limit:
+            top = np.argpartition(scores * len(self) + self.name_rank[rows], limit - 1)[:limit]
+            rows, scores = rows[top], scores[top]
+        order = np.lexsort((self.name_rank[rows], scores))
+        return self.employee_ids[rows[order]].tolist()
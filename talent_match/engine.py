@@ -0,0 +1,204 @@
+"""
+Engine Talent Match in-memory (tanpa query per-request).
+
+Matriks karyawan x TV (0/1) dimuat sekali dari `TV_FEATURES_QUERY`, lalu
+baseline (median benchmark), TV/TGV match rate dan final_match_rate dihitung
+dengan operasi NumPy. Output `match()` sama dengan FINAL SELECT di `task2.sql`;
+`match_baseline_wide()` memberi format ringkas satu baris per karyawan.
+"""
+
+import copy
+import hashlib
+
+import numpy as np
+import pandas as pd
+
+from .rules import (
+    DETAIL_COLUMNS, RESULT_COLUMNS, TGV_ORDER, TGV_RATE_COLUMNS, TGV_WEIGHTS, TV_COLUMNS,
+    WIDE_RESULT_COLUMNS,
+)
+
+TV_SCORE_COLUMNS = [col for col, _, _ in TV_COLUMNS]
+
+# Kolom dimensi yang disimpan sebagai categorical
+CATEGORY_COLUMNS = ['directorate', 'role', 'grade']
+
+
+def median_baseline(benchmark_scores):
+    """Median skor TV benchmark (PERCENTILE_CONT(0.5)), atau None jika tidak ada benchmark."""
+    benchmark_scores = np.asarray(benchmark_scores)
+    if len(benchmark_scores) == 0:
+        return None
+    return np.median(benchmark_scores, axis=0)
+
+
+class TalentMatrix:
+    """Matriks skor TV semua karyawan beserta detailnya."""
+
+    def __init__(self, employee_ids, scores, details):
+        self.employee_ids = np.asarray(employee_ids, dtype=object)
+        self.scores = np.asarray(scores, dtype=np.int8)
+        self.details = details.reset_index(drop=True).astype({col: 'category' for col in CATEGORY_COLUMNS})
+        self._row_of = {emp_id: i for i, emp_id in enumerate(self.employee_ids)}
+        # TV_FEATURES_QUERY sudah ORDER BY employee_id; jika urut, tie-breaker
+        # employee_id cukup dengan sort stabil (tanpa lexsort string)
+        self._ids_sorted = bool(len(self.employee_ids) < 2 or (self.employee_ids[:-1] < self.employee_ids[1:]).all())
+
+        # Matriks rata-rata TV -> TGV (10 x 4), tiap kolom berjumlah 1
+        tgv_index = [TGV_ORDER.index(tgv) for _, tgv, _ in TV_COLUMNS]
+        self._tv_to_tgv = np.zeros((len(TV_COLUMNS), len(TGV_ORDER)))
+        self._tv_to_tgv[np.arange(len(TV_COLUMNS)), tgv_index] = 1.0
+        self._tv_to_tgv /= self._tv_to_tgv.sum(axis=0)
+        self._tgv_weights = np.array([TGV_WEIGHTS[tgv] for tgv in TGV_ORDER])
+
+        # Urutan TV di output: urutan TGV, lalu tv_name
+        self._tv_order = np.array(sorted(
+            range(len(TV_COLUMNS)),
+            key=lambda j: (TGV_ORDER.index(TV_COLUMNS[j][1]), TV_COLUMNS[j][2]),
+        ))
+        self._tv_tgv_index = np.array(tgv_index)
+
+    @classmethod
+    def from_frame(cls, df_features):
+        """Bangun matriks dari hasil `TV_FEATURES_QUERY` (satu baris per karyawan)."""
+        df = df_features.drop_duplicates(subset=['employee_id']).reset_index(drop=True)
+        scores = df[TV_SCORE_COLUMNS].fillna(0).to_numpy(dtype=np.int8)
+        return cls(df['employee_id'].to_numpy(), scores, df[DETAIL_COLUMNS])
+
+    def __len__(self):
+        return len(self.employee_ids)
+
+    def with_scores(self, scores):
+        """Salinan ringan dengan matriks flag TV lain (mis. hasil rule dengan threshold baru)."""
+        tuned = copy.copy(self)
+        tuned.scores = np.asarray(scores, dtype=np.int8)
+        return tuned
+
+    def with_weights(self, tgv_weights):
+        """Salinan ringan dengan bobot TGV lain ({tgv_name: bobot})."""
+        tuned = copy.copy(self)
+        tuned._tgv_weights = np.array([tgv_weights[tgv] for tgv in TGV_ORDER], dtype=float)
+        return tuned
+
+    def sort_rows(self, key):
+        """Urutan baris berdasarkan `key` naik, lalu employee_id."""
+        if self._ids_sorted:
+            return np.argsort(key, kind='stable')
+        return np.lexsort((self.employee_ids, key))
+
+    def benchmark_rows(self, benchmark_ids):
+        """Indeks baris benchmark yang ada di matriks (yang tanpa rating diabaikan)."""
+        return np.array(
+            sorted({self._row_of[b] for b in benchmark_ids if b in self._row_of}),
+            dtype=np.intp,
+        )
+
+    def baseline(self, benchmark_ids):
+        """Median skor TV benchmark (PERCENTILE_CONT(0.5)), atau None jika kosong."""
+        return median_baseline(self.scores[self.benchmark_rows(benchmark_ids)])
+
+    def common_baselines(self, n):
+        """`n` pola TV yang paling sering muncul, sebagai baseline untuk pre-compute."""
+        patterns, counts = np.unique(self.scores, axis=0, return_counts=True)
+        top = np.argsort(-counts, kind='stable')[:n]
+        return [patterns[i].astype(float) for i in top]
+
+    def fingerprint(self):
+        """Hash isi matriks; berubah jika data feature store berubah."""
+        digest = hashlib.sha1()
+        digest.update('\x1f'.join(map(str, self.employee_ids)).encode())
+        digest.update(np.ascontiguousarray(self.scores).tobytes())
+        return digest.hexdigest()[:16]
+
+    def score(self, baseline, scores=None):
+        """
+        Hitung (tv_match_rate, tgv_match_rate, final_match_rate) untuk semua
+        karyawan, atau untuk matriks `scores` lain (mis. pola TV unik).
+        """
+        scores = self.scores if scores is None else scores
+        tv_match = np.where(scores == baseline, 100.0, 0.0)
+        tgv_match = tv_match @ self._tv_to_tgv
+        # Dibulatkan agar urutan ranking stabil terhadap galat floating point
+        final_match = np.round(tgv_match @ self._tgv_weights, 10)
+        return tv_match, tgv_match, final_match
+
+    def match(self, benchmark_ids):
+        """Hasil long-format (10 baris per karyawan) seperti path SQL."""
+        baseline = self.baseline(benchmark_ids)
+        if baseline is None:
+            return pd.DataFrame(columns=RESULT_COLUMNS)
+        return self.match_baseline(baseline)
+
+    def _ranking(self, final_match):
+        # ORDER BY final_match_rate DESC, employee_id
+        return self.sort_rows(-final_match)
+
+    def match_baseline(self, baseline):
+        """Seperti `match()`, tetapi langsung dari vektor baseline."""
+        baseline = np.asarray(baseline, dtype=float)
+        tv_match, tgv_match, final_match = self.score(baseline)
+
+        order = self._ranking(final_match)
+        n_emp, n_tv = len(order), len(self._tv_order)
+        emp_rows = np.repeat(order, n_tv)
+        tv_cols = np.tile(self._tv_order, n_emp)
+
+        tv_meta = np.array(TV_COLUMNS, dtype=object)
+        details = self.details.iloc[emp_rows].reset_index(drop=True)
+
+        df_results = pd.DataFrame({
+            'employee_id': self.employee_ids[emp_rows],
+            'fullname': details['fullname'].to_numpy(),
+            'directorate': details['directorate'].to_numpy(dtype=object),
+            'role': details['role'].to_numpy(dtype=object),
+            'grade': details['grade'].to_numpy(dtype=object),
+            'tgv_name': tv_meta[tv_cols, 1],
+            'tv_name': tv_meta[tv_cols, 2],
+            'baseline_score': baseline[tv_cols],
+            'user_score': self.scores[emp_rows, tv_cols].astype(np.int64),
+            'tv_match_rate': tv_match[emp_rows, tv_cols],
+            'tgv_match_rate': tgv_match[emp_rows, self._tv_tgv_index[tv_cols]],
+            'final_match_rate': final_match[emp_rows],
+        })
+        return df_results[RESULT_COLUMNS]
+
+    def match_wide(self, benchmark_ids):
+        """Hasil format wide (satu baris per karyawan), lihat `match_baseline_wide()`."""
+        baseline = self.baseline(benchmark_ids)
+        if baseline is None:
+            return pd.DataFrame(columns=WIDE_RESULT_COLUMNS)
+        return self.match_baseline_wide(baseline)
+
+    def match_baseline_wide(self, baseline):
+        """
+        Satu baris per karyawan: skor TV (int8), match rate per TGV (float32),
+        final_match_rate, dan dimensi sebagai categorical. Baseline disimpan di
+        `attrs['baseline']` sehingga detail per TV bisa dihitung saat dibutuhkan.
+        """
+        baseline = np.asarray(baseline, dtype=float)
+        order, tgv_match, final_match = self.rank(baseline)
+        return self.wide_frame(order, baseline, tgv_match, final_match)
+
+    def rank(self, baseline):
+        """Urutan ranking (indeks baris) beserta tgv_match/final_match yang sejajar dengannya."""
+        _, tgv_match, final_match = self.score(np.asarray(baseline, dtype=float))
+        order = self._ranking(final_match)
+        return order, tgv_match[order], final_match[order]
+
+    def wide_frame(self, rows, baseline, tgv_match, final_match):
+        """Bangun frame wide untuk baris `rows`; tgv_match/final_match sejajar dengan `rows`."""
+        rows = np.asarray(rows, dtype=np.intp)
+        details = self.details.iloc[rows]
+
+        columns = {'employee_id': self.employee_ids[rows]}
+        for col in DETAIL_COLUMNS:
+            columns[col] = details[col].to_numpy() if col not in CATEGORY_COLUMNS else details[col].array
+        for j, col in enumerate(TV_SCORE_COLUMNS):
+            columns[col] = self.scores[rows, j]
+        for g, tgv in enumerate(TGV_ORDER):
+            columns[TGV_RATE_COLUMNS[tgv]] = np.asarray(tgv_match)[:, g].astype(np.float32)
+        columns['final_match_rate'] = np.asarray(final_match, dtype=float)
+
+        df_results = pd.DataFrame(columns, columns=WIDE_RESULT_COLUMNS)
+        df_results.attrs['baseline'] = baseline
+        return df_results
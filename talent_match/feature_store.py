@@ -0,0 +1,42 @@
+"""
+Refresh feature store TV (`tv_features`) di Postgres.
+
+Skema, trigger dan fungsi `refresh_tv_features()` dibuat oleh
+`migrations/001_tv_features.sql`. Jalankan setelah memuat data tahunan baru:
+
+    DATABASE_URL=postgresql://... python -m talent_match.feature_store [--full]
+"""
+
+import argparse
+import os
+
+from sqlalchemy import create_engine, text
+
+
+def refresh_tv_features(engine, full_refresh=False):
+    """Hitung ulang flag TV karyawan yang berubah (atau semua); kembalikan jumlahnya."""
+    with engine.begin() as conn:
+        return conn.execute(
+            text("SELECT refresh_tv_features(:full_refresh)"),
+            {"full_refresh": full_refresh},
+        ).scalar()
+
+
+def pending_tv_features(engine):
+    """Jumlah karyawan yang menunggu refresh."""
+    with engine.connect() as conn:
+        return conn.execute(text("SELECT COUNT(*) FROM tv_features_dirty")).scalar()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Refresh feature store TV (tv_features).")
+    parser.add_argument("--full", action="store_true", help="hitung ulang semua karyawan")
+    args = parser.parse_args()
+
+    engine = create_engine(os.environ["DATABASE_URL"])
+    n_refreshed = refresh_tv_features(engine, full_refresh=args.full)
+    print(f"tv_features: {n_refreshed} karyawan di-refresh.")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,311 @@
+"""
+Build master analysis table (satu baris per karyawan, kolom sama dengan
+`dataset/master_analysis_table_from_sql.csv`) dari file mentah `dataset/`.
+
+    python -m talent_match.master_table --dataset-dir dataset --out .cache/master
+    python -m talent_match.master_table --dataset-dir dataset --out .cache/master --full
+
+Aturan sama dengan `task2.sql`: rating dari tahun terakhir dengan rating 1-5,
+skor kompetensi dari tahun terakhir yang skornya terisi (per pilar), PAPI
+di-pivot per skala, dan hanya karyawan dengan rating valid yang ikut.
+
+Tabel sumber dimuat ke file DuckDB sementara (bertipe, lihat
+`embedded.TABLE_SCHEMAS`) dengan `memory_limit`, lalu karyawan dibagi ke
+`partitions` bucket (hash employee_id). Setiap bucket dihitung sebagai satu
+potongan dan ditulis ke `part-XXXXX.parquet`, jadi memori terbatas per
+potongan. Fingerprint per karyawan (hash semua barisnya di tabel sumber)
+disimpan di `_fingerprints.parquet`; build berikutnya hanya menghitung ulang
+karyawan yang berubah dan hanya menulis ulang bucket mereka. Dimensi, query
+atau jumlah partisi yang berubah memicu build penuh.
+
+Baca hasilnya dengan `pd.read_parquet('.cache/master')`.
+"""
+
+import argparse
+import hashlib
+import json
+import os
+import time
+
+import duckdb
+
+from .embedded import TABLE_SCHEMAS, load_tables
+from .rules import COMPETENCY_PILLARS
+
+# Urutan skala PAPI di master analysis table
+PAPI_SCALES = [
+    'Papi_N', 'Papi_G', 'Papi_A', 'Papi_L', 'Papi_P', 'Papi_I', 'Papi_T', 'Papi_V', 'Papi_X', 'Papi_S',
+    'Papi_B', 'Papi_O', 'Papi_R', 'Papi_D', 'Papi_C', 'Papi_Z', 'Papi_E', 'Papi_K', 'Papi_F', 'Papi_W',
+]
+
+# Tabel per karyawan (masuk fingerprint) dan tabel dimensi yang di-join
+EMPLOYEE_TABLES = ['employees', 'performance_yearly', 'competencies_yearly', 'papi_scores', 'profiles_psych']
+DIMENSION_TABLES = ['dim_grades', 'dim_education', 'dim_majors', 'dim_positions', 'dim_departments', 'dim_directorates']
+
+# Kolom output: (ekspresi SQL, tipe DuckDB)
+MASTER_COLUMNS = {
+    'employee_id': ('e.employee_id', 'VARCHAR'),
+    'fullname': ('e.fullname', 'VARCHAR'),
+    'years_of_service_months': ('e.years_of_service_months', 'INTEGER'),
+    'rating': ('lp.rating', 'DOUBLE'),
+    'is_high_performer': ('CASE WHEN lp.rating = 5 THEN 1 ELSE 0 END', 'TINYINT'),
+    'performance_group': ("CASE WHEN lp.rating = 5 THEN 'High Performer' ELSE 'Others' END", 'VARCHAR'),
+    'grade_name': ('g.name', 'VARCHAR'),
+    'education_name': ('ed.name', 'VARCHAR'),
+    'major_name': ('m.name', 'VARCHAR'),
+    'position_name': ('p.name', 'VARCHAR'),
+    'department_name': ('d.name', 'VARCHAR'),
+    'directorate_name': ('dr.name', 'VARCHAR'),
+    'iq': ('ps.iq', 'DOUBLE'),
+    'pauli': ('ps.pauli', 'INTEGER'),
+    'gtq': ('ps.gtq', 'DOUBLE'),
+    'tiki': ('ps.tiki', 'INTEGER'),
+    'mbti': ('ps.mbti', 'VARCHAR'),
+    'disc': ('ps.disc', 'VARCHAR'),
+    **{pillar: (f'pc."{pillar}"', 'DOUBLE') for pillar in COMPETENCY_PILLARS},
+    **{scale: (f'pp."{scale}"', 'DOUBLE') for scale in PAPI_SCALES},
+}
+
+# Query satu potongan: karyawan di tabel `chunk_ids`. Urutan kedua di
+# DISTINCT ON hanya berlaku untuk baris ganda (karyawan, tahun) dan membuat
+# hasilnya deterministik.
+MASTER_TABLE_TEMPLATE = """
+WITH
+latest_performance AS (
+    SELECT DISTINCT ON (employee_id)
+        employee_id, rating
+    FROM performance_yearly
+    WHERE rating BETWEEN 1 AND 5
+      AND employee_id IN (SELECT employee_id FROM chunk_ids)
+    ORDER BY employee_id, year DESC, rating DESC
+),
+
+latest_competencies AS (
+    SELECT DISTINCT ON (employee_id, pillar_code)
+        employee_id, pillar_code, score
+    FROM competencies_yearly
+    WHERE score IS NOT NULL
+      AND employee_id IN (SELECT employee_id FROM chunk_ids)
+    ORDER BY employee_id, pillar_code, year DESC, score DESC
+),
+
+pivot_competencies AS (
+    SELECT
+        employee_id,
+{pillar_columns}
+    FROM latest_competencies
+    GROUP BY employee_id
+),
+
+pivot_papi AS (
+    SELECT
+        employee_id,
+{papi_columns}
+    FROM papi_scores
+    WHERE score IS NOT NULL
+      AND employee_id IN (SELECT employee_id FROM chunk_ids)
+    GROUP BY employee_id
+)
+
+SELECT
+{select_list}
+FROM employees e
+LEFT JOIN dim_grades g ON e.grade_id = g.grade_id
+LEFT JOIN dim_education ed ON e.education_id = ed.education_id
+LEFT JOIN dim_majors m ON e.major_id = m.major_id
+LEFT JOIN dim_positions p ON e.position_id = p.position_id
+LEFT JOIN dim_departments d ON e.department_id = d.department_id
+LEFT JOIN dim_directorates dr ON e.directorate_id = dr.directorate_id
+LEFT JOIN profiles_psych ps ON e.employee_id = ps.employee_id
+LEFT JOIN latest_performance lp ON e.employee_id = lp.employee_id
+LEFT JOIN pivot_competencies pc ON e.employee_id = pc.employee_id
+LEFT JOIN pivot_papi pp ON e.employee_id = pp.employee_id
+WHERE lp.rating IS NOT NULL
+  AND e.employee_id IN (SELECT employee_id FROM chunk_ids)
+"""
+
+
+def master_table_sql():
+    """Query master analysis table untuk karyawan di tabel `chunk_ids`."""
+    return MASTER_TABLE_TEMPLATE.format(
+        pillar_columns=',\n'.join(
+            f"        MAX(CASE WHEN pillar_code = '{pillar}' THEN score ELSE NULL END) AS \"{pillar}\""
+            for pillar in COMPETENCY_PILLARS
+        ),
+        papi_columns=',\n'.join(
+            f"        MAX(CASE WHEN scale_code = '{scale}' THEN score ELSE NULL END) AS \"{scale}\""
+            for scale in PAPI_SCALES
+        ),
+        select_list=',\n'.join(
+            f'    CAST({sql} AS {col_type}) AS "{name}"' for name, (sql, col_type) in MASTER_COLUMNS.items()
+        ),
+    )
+
+
+def fingerprint_sql(partitions):
+    """Tabel `fingerprints` (employee_id, bucket, fingerprint) dari semua baris karyawan di tabel sumber."""
+    source_rows = '\n    UNION ALL\n'.join(
+        f"    SELECT employee_id, hash('{table}', "
+        + ', '.join(f'"{col}"' for col in TABLE_SCHEMAS[table] if col != 'employee_id')
+        + f") AS row_hash FROM {table}"
+        for table in EMPLOYEE_TABLES
+    )
+    return f"""
+CREATE TABLE fingerprints AS
+WITH source_rows AS (
+{source_rows}
+)
+SELECT
+    employee_id,
+    CAST(hash(employee_id) % {partitions} AS INTEGER) AS bucket,
+    CAST(SUM(row_hash) AS VARCHAR) || ':' || CAST(COUNT(*) AS VARCHAR) AS fingerprint
+FROM source_rows
+GROUP BY employee_id
+"""
+
+
+def sql_path(path):
+    return "'" + path.replace("'", "''") + "'"
+
+
+def part_path(out_dir, bucket):
+    return os.path.join(out_dir, f'part-{bucket:05d}.parquet')
+
+
+def build_manifest(conn, partitions):
+    """Yang harus sama dengan build sebelumnya agar build inkremental valid."""
+    dimensions = {
+        table: conn.execute(
+            f"SELECT CAST(SUM(hash({', '.join(TABLE_SCHEMAS[table])})) AS VARCHAR) || ':' || CAST(COUNT(*) AS VARCHAR) "
+            f"FROM {table}"
+        ).fetchone()[0]
+        for table in DIMENSION_TABLES
+    }
+    query = master_table_sql() + fingerprint_sql(partitions)
+    return {
+        'partitions': partitions,
+        # hash() DuckDB tidak dijamin sama antar versi (bucket dan fingerprint)
+        'duckdb': duckdb.__version__,
+        'query': hashlib.sha1(query.encode()).hexdigest(),
+        'dimensions': dimensions,
+    }
+
+
+def build_master_table(dataset_dir, out_dir, partitions=16, memory_limit='1GB', threads=None, full=False,
+                       progress=None):
+    """
+    Tulis master analysis table ke `out_dir` (satu file Parquet per bucket).
+    Kembalikan ringkasan (mode, karyawan berubah, bucket ditulis, baris, detik).
+    """
+    start = time.perf_counter()
+    os.makedirs(out_dir, exist_ok=True)
+    manifest_path = os.path.join(out_dir, '_manifest.json')
+    fingerprints_path = os.path.join(out_dir, '_fingerprints.parquet')
+    staging_path = os.path.join(out_dir, '_staging.duckdb')
+    if os.path.exists(staging_path):
+        os.remove(staging_path)
+
+    conn = duckdb.connect(staging_path)
+    try:
+        conn.execute(f"SET memory_limit = {sql_path(memory_limit)}")
+        conn.execute(f"SET temp_directory = {sql_path(os.path.join(out_dir, '_spill'))}")
+        if threads:
+            conn.execute(f"SET threads = {int(threads)}")
+        load_tables(conn, dataset_dir, EMPLOYEE_TABLES + DIMENSION_TABLES)
+        conn.execute(fingerprint_sql(partitions))
+        manifest = build_manifest(conn, partitions)
+
+        previous = None
+        if not full and os.path.exists(manifest_path) and os.path.exists(fingerprints_path):
+            with open(manifest_path) as f:
+                previous = json.load(f)
+        incremental = previous == manifest
+
+        if incremental:
+            # Karyawan baru/berubah, plus karyawan yang hilang dari sumber (baris lamanya dibuang)
+            conn.execute(f"""
+                CREATE TABLE stale AS
+                SELECT f.employee_id, f.bucket
+                FROM fingerprints f
+                LEFT JOIN read_parquet({sql_path(fingerprints_path)}) old ON f.employee_id = old.employee_id
+                WHERE old.fingerprint IS DISTINCT FROM f.fingerprint
+                UNION ALL
+                SELECT old.employee_id, old.bucket
+                FROM read_parquet({sql_path(fingerprints_path)}) old
+                WHERE NOT EXISTS (SELECT 1 FROM fingerprints f WHERE f.employee_id = old.employee_id)
+            """)
+            buckets = [row[0] for row in conn.execute("SELECT DISTINCT bucket FROM stale ORDER BY bucket").fetchall()]
+        else:
+            conn.execute("CREATE TABLE stale AS SELECT employee_id, bucket FROM fingerprints")
+            buckets = list(range(partitions))
+            for name in os.listdir(out_dir):
+                if name.startswith('part-') and name.endswith('.parquet'):
+                    os.remove(os.path.join(out_dir, name))
+        n_stale = conn.execute("SELECT COUNT(*) FROM stale").fetchone()[0]
+
+        master_sql = master_table_sql()
+        for done, bucket in enumerate(buckets, start=1):
+            conn.execute("CREATE OR REPLACE TEMP TABLE chunk_ids AS SELECT employee_id FROM stale WHERE bucket = ?", [bucket])
+            path = part_path(out_dir, bucket)
+            select_sql = master_sql
+            if incremental and os.path.exists(path):
+                # Baris lama karyawan yang tidak berubah disalin apa adanya
+                select_sql = (
+                    f"SELECT * FROM read_parquet({sql_path(path)}) "
+                    f"WHERE employee_id NOT IN (SELECT employee_id FROM chunk_ids)\nUNION ALL\nSELECT * FROM ({master_sql})"
+                )
+            tmp_path = f'{path}.tmp'
+            conn.execute(
+                f"COPY (SELECT * FROM ({select_sql}) ORDER BY employee_id) TO {sql_path(tmp_path)} (FORMAT PARQUET)"
+            )
+            os.replace(tmp_path, path)
+            if progress:
+                progress(done, len(buckets))
+
+        # Fingerprint dan manifest ditulis terakhir: build yang terputus diulang dari awal
+        conn.execute(
+            f"COPY (SELECT * FROM fingerprints ORDER BY employee_id) TO {sql_path(fingerprints_path + '.tmp')} (FORMAT PARQUET)"
+        )
+        os.replace(fingerprints_path + '.tmp', fingerprints_path)
+        with open(manifest_path, 'w') as f:
+            json.dump(manifest, f)
+
+        n_rows = conn.execute(
+            f"SELECT COUNT(*) FROM read_parquet({sql_path(os.path.join(out_dir, 'part-*.parquet'))})"
+        ).fetchone()[0]
+    finally:
+        conn.close()
+        os.remove(staging_path)
+
+    return {
+        'mode': 'incremental' if incremental else 'full',
+        'changed': n_stale,
+        'partitions_written': len(buckets),
+        'rows': n_rows,
+        'seconds': time.perf_counter() - start,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Build master analysis table (Parquet) dari dataset mentah.")
+    parser.add_argument('--dataset-dir', default='dataset', help="folder CSV/Parquet `Study Case DA - *`")
+    parser.add_argument('--out', default='.cache/master', help="folder output dataset Parquet")
+    parser.add_argument('--partitions', type=int, default=16, help="jumlah bucket/file Parquet")
+    parser.add_argument('--memory-limit', default='1GB', help="batas memori DuckDB (sisanya di-spill ke disk)")
+    parser.add_argument('--threads', type=int, default=None)
+    parser.add_argument('--full', action='store_true', help="bangun ulang semua karyawan")
+    args = parser.parse_args()
+
+    summary = build_master_table(
+        args.dataset_dir, args.out, args.partitions, args.memory_limit, args.threads, args.full,
+        progress=lambda done, total: print(f"\r{done}/{total} partisi", end='', flush=True),
+    )
+    print(
+        f"\nBuild {summary['mode']}: {summary['changed']} karyawan dihitung ulang, "
+        f"{summary['partitions_written']} partisi ditulis, {summary['rows']} baris di {args.out} "
+        f"dalam {summary['seconds']:.2f} s"
+    )
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,141 @@
+"""
+Logika pencocokan talenta tanpa Streamlit (dipakai `app.py` dan CLI batch).
+
+`TalentMatcher` menentukan baseline dari ID benchmark, lalu mengambil hasil
+dari cache per baseline atau menghitungnya dengan `SimilarityIndex` (fitur
+kontinu, top-K), `PatternIndex` (top-K), `TalentMatrix` (in-memory) atau query
+SQL Task 2. Konfigurasi (mode, format,
+ukuran ranked list) diberikan sebagai argumen, bukan dibaca dari `st.secrets`.
+"""
+
+from contextlib import nullcontext
+
+import pandas as pd
+from sqlalchemy import text
+
+from .engine import TV_SCORE_COLUMNS, TalentMatrix, median_baseline
+from .queries import TV_BENCHMARK_QUERY, TV_FEATURES_QUERY
+from .results import long_to_wide
+from .talent_query import execute_talent_match, talent_match_frame
+
+RESULT_FORMATS = ('wide', 'long', 'topk')
+
+
+def read_talent_matrix(engine):
+    """Muat matriks TV semua karyawan dari `tv_features`."""
+    with engine.connect() as conn:
+        df_features = pd.read_sql_query(text(TV_FEATURES_QUERY), conn)
+    return TalentMatrix.from_frame(df_features)
+
+
+def no_span(name, **attrs):
+    return nullcontext({})
+
+
+class TalentMatcher:
+    """
+    Hasil pencocokan untuk set benchmark. Tanpa `talent_matrix` semua hasil
+    dihitung dengan query SQL; `pattern_index` hanya dipakai untuk format
+    "topk". Dengan `similarity_index` baseline dan hasil (top-K long-format)
+    berasal dari fitur kontinu, bukan flag TV. `span(name, **attrs)` opsional
+    untuk timing (lihat `timing.SpanLog`).
+    """
+
+    def __init__(self, engine, talent_matrix=None, pattern_index=None, result_format='wide',
+                 ranked_list_size=200, result_cache=None, span=no_span, similarity_index=None):
+        if result_format not in RESULT_FORMATS:
+            raise ValueError(f"Format hasil tidak dikenal: {result_format}")
+        self.engine = engine
+        self.talent_matrix = talent_matrix
+        self.pattern_index = pattern_index if result_format == 'topk' else None
+        self.result_format = result_format
+        self.ranked_list_size = ranked_list_size
+        self.result_cache = result_cache
+        self.span = span
+        self.similarity_index = similarity_index
+
+    def resolve_baseline(self, benchmark_ids):
+        """Median flag TV benchmark, atau None jika tidak ada benchmark yang dikenal."""
+        if self.similarity_index is not None:
+            return self.similarity_index.baseline(benchmark_ids)
+        if self.talent_matrix is not None:
+            return self.talent_matrix.baseline(benchmark_ids)
+
+        with self.engine.connect() as conn:
+            df_benchmark = pd.read_sql_query(text(TV_BENCHMARK_QUERY), conn, params={"benchmark_ids": list(benchmark_ids)})
+        return median_baseline(df_benchmark[TV_SCORE_COLUMNS].to_numpy())
+
+    def compute(self, benchmark_ids, baseline):
+        """Hitung hasil tanpa cache. Span dipisah antara eksekusi query/ranking dan pembentukan DataFrame."""
+        if self.similarity_index is not None:
+            with self.span("fetch_talent_data.query", source="similarity"):
+                rows, _ = self.similarity_index.nearest(baseline, self.ranked_list_size)
+            with self.span("fetch_talent_data.materialize", source="similarity"):
+                df_top = self.similarity_index.frame(rows, baseline)
+                df_top.attrs['histogram'] = self.similarity_index.histogram(baseline)
+            return df_top
+
+        if self.pattern_index is not None:
+            with self.span("fetch_talent_data.query", source="topk"):
+                df_top = self.pattern_index.top_k(baseline, self.ranked_list_size)
+                df_top.attrs['histogram'] = self.pattern_index.histogram(baseline)
+            return df_top
+
+        if self.talent_matrix is not None:
+            if self.result_format == 'long':
+                with self.span("fetch_talent_data.query", source="engine"):
+                    return self.talent_matrix.match_baseline(baseline)
+            with self.span("fetch_talent_data.query", source="engine"):
+                order, tgv_match, final_match = self.talent_matrix.rank(baseline)
+            with self.span("fetch_talent_data.materialize", source="engine"):
+                return self.talent_matrix.wide_frame(order, baseline, tgv_match, final_match)
+
+        df_results = self.compute_sql(benchmark_ids)
+        if self.result_format == 'long':
+            return df_results
+        with self.span("fetch_talent_data.materialize", source="long_to_wide"):
+            return long_to_wide(df_results)
+
+    def compute_sql(self, benchmark_ids):
+        """Query SQL Task 2 (prepared statement di Postgres), hasil long-format."""
+        with self.engine.connect() as conn:
+            with self.span("fetch_talent_data.query", source="sql") as record:
+                columns, rows = execute_talent_match(conn, benchmark_ids)
+                record['rows'] = len(rows)
+        with self.span("fetch_talent_data.materialize", source="sql"):
+            return talent_match_frame(columns, rows)
+
+    def fetch(self, benchmark_ids, baseline):
+        """Hasil untuk `benchmark_ids` (baseline sudah ditentukan), lewat cache jika ada."""
+        if self.similarity_index is not None:
+            mode = 'similarity'
+        else:
+            mode = 'engine' if self.talent_matrix is not None else 'sql'
+        with self.span("fetch_talent_data", mode=mode, format=self.result_format, cache="hit") as record:
+            def compute():
+                record['cache'] = 'miss'
+                return self.compute(benchmark_ids, baseline)
+
+            if self.result_cache is None:
+                df_results = compute()
+            else:
+                df_results = self.result_cache.get_or_compute(baseline, compute)
+
+        top_index = self.similarity_index if self.similarity_index is not None else self.pattern_index
+        if top_index is not None:
+            # Baris benchmark tidak ikut di-cache: set benchmark lain bisa punya baseline yang sama
+            df_results = df_results.copy(deep=False)
+            df_results.attrs['benchmarks'] = top_index.rows_frame(benchmark_ids, baseline)
+        return df_results
+
+    def warm(self, baselines):
+        """Pre-compute hasil (dalam format matcher ini) untuk `baselines` ke cache hasil."""
+        if self.result_cache is not None:
+            self.result_cache.warm(baselines, lambda baseline: self.compute(None, baseline))
+
+    def match(self, benchmark_ids):
+        """Baseline lalu hasil; DataFrame kosong jika tidak ada benchmark yang dikenal."""
+        baseline = self.resolve_baseline(benchmark_ids) if benchmark_ids else None
+        if baseline is None:
+            return pd.DataFrame()
+        return self.fetch(benchmark_ids, baseline)
@@ -0,0 +1,106 @@
+"""
+Index karyawan per pola TV untuk ranking top-K.
+
+Profil TV setiap karyawan adalah pola 10-bit, jadi paling banyak ada 1024
+pola berbeda. Karyawan dikelompokkan per pola (bucket), sehingga match rate
+cukup dihitung sekali per pola untuk setiap baseline. Top-K (atau satu
+halaman) diambil dengan heap di atas bucket, tanpa membangun baris untuk
+semua karyawan.
+"""
+
+import copy
+import heapq
+from itertools import islice
+
+import numpy as np
+import pandas as pd
+
+
+class PatternIndex:
+    """Bucket karyawan per pola TV di atas sebuah `TalentMatrix`."""
+
+    def __init__(self, talent_matrix):
+        self.matrix = talent_matrix
+        n_tv = talent_matrix.scores.shape[1]
+
+        # Kode pola < 2^n_tv, jadi bucket cukup dihitung dengan bincount (O(n)).
+        # Kode int16 membuat sort stabil per bucket memakai radix sort.
+        code_dtype = np.int16 if n_tv < 16 else np.int64
+        codes = np.zeros(len(talent_matrix), dtype=code_dtype)
+        for j in range(n_tv):
+            codes |= talent_matrix.scores[:, j].astype(code_dtype) << j
+        code_counts = np.bincount(codes, minlength=1 << n_tv)
+        self.codes = np.flatnonzero(code_counts)
+        self.counts = code_counts[self.codes]
+        pattern_of_code = np.zeros(len(code_counts), dtype=code_dtype)
+        pattern_of_code[self.codes] = np.arange(len(self.codes))
+        self.row_pattern = pattern_of_code[codes]
+        self.patterns = ((self.codes[:, None] >> np.arange(n_tv)) & 1).astype(np.int8)
+
+        # Baris per bucket, urut employee_id (tie-breaker ranking)
+        order = talent_matrix.sort_rows(self.row_pattern)
+        self.bucket_rows = np.split(order, np.cumsum(self.counts)[:-1])
+
+    def __len__(self):
+        return len(self.codes)
+
+    def with_weights(self, tgv_weights):
+        """Index yang sama dengan bobot TGV lain (bucket tidak dibangun ulang)."""
+        reweighted = copy.copy(self)
+        reweighted.matrix = self.matrix.with_weights(tgv_weights)
+        return reweighted
+
+    def score_patterns(self, baseline):
+        """(tgv_match_rate, final_match_rate) untuk setiap pola."""
+        _, tgv_match, final_match = self.matrix.score(np.asarray(baseline, dtype=float), self.patterns)
+        return tgv_match, final_match
+
+    def top_k(self, baseline, k, offset=0):
+        """
+        Frame wide berisi karyawan peringkat `offset` s/d `offset + k`
+        (ORDER BY final_match_rate DESC, employee_id).
+        """
+        baseline = np.asarray(baseline, dtype=float)
+        tgv_match, final_match = self.score_patterns(baseline)
+        employee_ids = self.matrix.employee_ids
+
+        # Kelompokkan pola dengan final_match_rate yang sama, urut menurun.
+        # Kelompok yang seluruhnya sebelum `offset` dilewati tanpa dibuka.
+        pattern_order = np.argsort(-final_match, kind='stable')
+        group_starts = np.flatnonzero(np.r_[True, np.diff(final_match[pattern_order]) != 0])
+        groups = np.split(pattern_order, group_starts[1:])
+
+        rows, seen, end = [], 0, offset + k
+        for group in groups:
+            group_size = int(self.counts[group].sum())
+            if seen + group_size > offset:
+                # Gabungkan bucket dalam kelompok dengan heap, urut employee_id
+                merged = heapq.merge(*(
+                    ((employee_ids[row], row) for row in self.bucket_rows[p]) for p in group
+                ))
+                taken = islice(merged, max(offset - seen, 0), end - seen)
+                rows.extend(row for _, row in taken)
+            seen += group_size
+            if seen >= end:
+                break
+
+        rows = np.array(rows, dtype=np.intp)
+        pattern_of_rows = self.row_pattern[rows]
+        return self.matrix.wide_frame(rows, baseline, tgv_match[pattern_of_rows], final_match[pattern_of_rows])
+
+    def rows_frame(self, employee_ids, baseline):
+        """Frame wide untuk karyawan tertentu (mis. benchmark), tanpa ranking."""
+        baseline = np.asarray(baseline, dtype=float)
+        tgv_match, final_match = self.score_patterns(baseline)
+        rows = self.matrix.benchmark_rows(employee_ids)
+        pattern_of_rows = self.row_pattern[rows]
+        return self.matrix.wide_frame(rows, baseline, tgv_match[pattern_of_rows], final_match[pattern_of_rows])
+
+    def histogram(self, baseline):
+        """Jumlah karyawan per nilai final_match_rate (untuk seluruh perusahaan)."""
+        _, final_match = self.score_patterns(baseline)
+        df_hist = pd.DataFrame({'final_match_rate': final_match, 'count': self.counts})
+        return (
+            df_hist.groupby('final_match_rate', as_index=False)['count'].sum()
+            .sort_values(by='final_match_rate', ascending=False, ignore_index=True)
+        )
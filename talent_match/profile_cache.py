@@ -0,0 +1,165 @@
+"""
+Cache disk untuk profil pekerjaan dari LLM.
+
+Kunci cache adalah tuple (role_name, job_level, role_purpose, model) yang
+dinormalisasi (huruf kecil, spasi dirapikan), jadi input yang hanya berbeda
+kapitalisasi/spasi memakai hasil yang sama. Entri kedaluwarsa setelah `ttl`
+detik, dan entri tertua dihapus jika total ukuran file melebihi `max_bytes`.
+
+Request identik yang berjalan bersamaan digabung (single-flight): hanya satu
+yang memanggil LLM, yang lain menunggu hasilnya.
+"""
+
+import hashlib
+import json
+import os
+import threading
+import time
+from concurrent.futures import Future
+
+
+def normalize_text(value):
+    return ' '.join(str(value).split()).casefold()
+
+
+def profile_key(role_name, job_level, role_purpose, model):
+    """Hash SHA-256 dari input yang sudah dinormalisasi."""
+    parts = [normalize_text(role_name), normalize_text(job_level), normalize_text(role_purpose), str(model).strip()]
+    return hashlib.sha256(json.dumps(parts).encode()).hexdigest()
+
+
+class ProfileCache:
+    """Cache teks profil di disk dengan TTL, batas ukuran dan single-flight."""
+
+    def __init__(self, cache_dir, ttl=7 * 24 * 3600, max_bytes=10 * 1024 * 1024):
+        self.cache_dir = cache_dir
+        self.ttl = ttl
+        self.max_bytes = max_bytes
+        self.hits = 0
+        self.misses = 0
+        self.coalesced = 0
+        self._in_flight = {}
+        self._lock = threading.Lock()
+        os.makedirs(cache_dir, exist_ok=True)
+
+    def _path(self, key):
+        return os.path.join(self.cache_dir, f'{key}.json')
+
+    def stats(self):
+        with self._lock:
+            return {'hits': self.hits, 'misses': self.misses, 'coalesced': self.coalesced}
+
+    def get(self, key):
+        """Teks profil untuk kunci ini, atau None jika belum ada/kedaluwarsa."""
+        try:
+            with open(self._path(key)) as f:
+                entry = json.load(f)
+        except (OSError, ValueError):
+            return None
+        if time.time() - entry['created'] > self.ttl:
+            try:
+                os.remove(self._path(key))
+            except OSError:
+                pass
+            return None
+        return entry['text']
+
+    def put(self, key, text):
+        # Tulis ke file sementara dulu agar pembaca lain tidak melihat file setengah jadi
+        tmp_path = f'{self._path(key)}.{os.getpid()}.{threading.get_ident()}.tmp'
+        with open(tmp_path, 'w') as f:
+            json.dump({'created': time.time(), 'text': text}, f)
+        os.replace(tmp_path, self._path(key))
+        self._evict()
+
+    def _evict(self):
+        """Hapus entri kedaluwarsa, lalu entri tertua sampai total ukuran <= max_bytes."""
+        now = time.time()
+        entries = []
+        for entry in os.scandir(self.cache_dir):
+            if not entry.name.endswith('.json'):
+                continue
+            try:
+                stat = entry.stat()
+            except OSError:
+                continue
+            if now - stat.st_mtime > self.ttl:
+                self._remove(entry.path)
+            else:
+                entries.append((stat.st_mtime, stat.st_size, entry.path))
+
+        total = sum(size for _, size, _ in entries)
+        for _, size, path in sorted(entries):
+            if total <= self.max_bytes:
+                break
+            self._remove(path)
+            total -= size
+
+    @staticmethod
+    def _remove(path):
+        try:
+            os.remove(path)
+        except OSError:
+            pass
+
+    def _lookup_or_lead(self, key):
+        """
+        (teks, None) jika ada di cache, (None, future) jika pemanggil ini yang
+        harus memanggil LLM, atau (None, None) setelah menunggu request lain gagal.
+        """
+        text = self.get(key)
+        if text is not None:
+            with self._lock:
+                self.hits += 1
+            return text, None
+
+        with self._lock:
+            flight = self._in_flight.get(key)
+            if flight is None:
+                flight = self._in_flight[key] = Future()
+                self.misses += 1
+                return None, flight
+            self.coalesced += 1
+
+        try:
+            return flight.result(), None
+        except Exception:
+            # Request yang ditunggu gagal/dibatalkan; coba lagi sebagai pemimpin
+            return None, None
+
+    def _finish(self, key, flight, text=None, error=None):
+        with self._lock:
+            self._in_flight.pop(key, None)
+        if error is not None:
+            flight.set_exception(error)
+        else:
+            flight.set_result(text)
+
+    def stream_or_fetch(self, key, stream):
+        """
+        Ambil dari cache, atau panggil `stream()` (sekali untuk request identik).
+        Potongan dari `stream()` diteruskan apa adanya dan teks lengkapnya
+        disimpan. Hit cache (atau request identik yang sedang berjalan)
+        menghasilkan teks lengkap sebagai satu potongan.
+        """
+        while True:
+            text, flight = self._lookup_or_lead(key)
+            if text is not None:
+                yield text
+                return
+            if flight is not None:
+                break
+
+        chunks = []
+        try:
+            for chunk in stream():
+                chunks.append(chunk)
+                yield chunk
+        except BaseException as e:
+            # Termasuk GeneratorExit saat stream dihentikan di tengah jalan
+            self._finish(key, flight, error=e if isinstance(e, Exception) else RuntimeError('stream dibatalkan'))
+            raise
+        text = ''.join(chunks)
+        if text:
+            self.put(key, text)
+        self._finish(key, flight, text)
@@ -0,0 +1,185 @@
+"""
+Query SQL yang dipakai oleh engine in-memory.
+
+Semua query memakai bound parameter (`= ANY(:benchmark_ids)`), tidak ada nilai
+yang disisipkan ke string SQL. Flag 10 TV per karyawan dibaca dari feature
+store `tv_features`
+(lihat `migrations/001_tv_features.sql`), bukan dihitung ulang dari tabel
+mentah. `TV_FEATURES_QUERY` menghasilkan satu baris per karyawan (yang punya
+rating valid) berisi flag TV plus detail karyawan (CTE 13 di `task2.sql`).
+
+Bobot TGV di `TALENT_MATCH_QUERY` dan `TV_RAW_FEATURES_QUERY` dikompilasi dari
+konfigurasi di `rules.py` (lihat `rule_engine`).
+"""
+
+from .rule_engine import raw_features_sql, tgv_weight_case_sql
+from .similarity import similarity_features_sql
+
+TV_FEATURES_QUERY = """
+SELECT
+    e.employee_id,
+    e.fullname,
+    dir.name AS directorate,
+    pos.name AS role,
+    g.name AS grade,
+    tv.tv_lie_skill,
+    tv.tv_leadership_drive,
+    tv.tv_command_talent,
+    tv.tv_sto_skill,
+    tv.tv_agility_profile,
+    tv.tv_strategic_talent,
+    tv.tv_achiever_talent,
+    tv.tv_gdr_skill,
+    tv.tv_context_filter,
+    tv.tv_cognitive_filter
+FROM tv_features tv
+JOIN employees e ON tv.employee_id = e.employee_id
+LEFT JOIN dim_directorates dir ON e.directorate_id = dir.directorate_id
+LEFT JOIN dim_positions pos ON e.position_id = pos.position_id
+LEFT JOIN dim_grades g ON e.grade_id = g.grade_id
+ORDER BY e.employee_id;
+"""
+
+# Semua karyawan untuk pencarian benchmark (talent_match/employee_search.py)
+EMPLOYEE_SEARCH_QUERY = """
+SELECT
+    e.employee_id,
+    e.fullname,
+    CAST(e.nip AS TEXT) AS nip,
+    dir.name AS directorate,
+    pos.name AS role,
+    g.name AS grade
+FROM employees e
+LEFT JOIN dim_directorates dir ON e.directorate_id = dir.directorate_id
+LEFT JOIN dim_positions pos ON e.position_id = pos.position_id
+LEFT JOIN dim_grades g ON e.grade_id = g.grade_id
+ORDER BY e.fullname, e.employee_id;
+"""
+
+# Flag TV benchmark saja, untuk menentukan baseline tanpa memuat seluruh matriks.
+TV_BENCHMARK_QUERY = """
+SELECT
+    employee_id,
+    tv_lie_skill,
+    tv_leadership_drive,
+    tv_command_talent,
+    tv_sto_skill,
+    tv_agility_profile,
+    tv_strategic_talent,
+    tv_achiever_talent,
+    tv_gdr_skill,
+    tv_context_filter,
+    tv_cognitive_filter
+FROM tv_features
+WHERE employee_id = ANY(:benchmark_ids);
+"""
+
+# Fitur mentah yang dipakai rule TV (untuk tuning threshold tanpa query ulang)
+TV_RAW_FEATURES_QUERY = raw_features_sql()
+
+# Fitur kontinu semua karyawan untuk mode similarity (lihat similarity.py)
+SIMILARITY_FEATURES_QUERY = similarity_features_sql()
+
+# Query lengkap Task 2 (path SQL / fallback) dengan benchmark sebagai array TEXT.
+# Dieksekusi sebagai prepared statement oleh `talent_query.read_talent_match`.
+TALENT_MATCH_QUERY = """
+WITH
+-- 1. Tentukan Benchmark (parameter :benchmark_ids, array TEXT)
+benchmark_selection AS (
+    SELECT employee_id FROM employees WHERE employee_id = ANY(:benchmark_ids)
+),
+
+-- 2. Ambil Flag TV dari feature store (lihat migrations/001_tv_features.sql)
+tv_scores_wide AS (
+    SELECT * FROM tv_features
+),
+
+-- 3. Unpivot TV Scores...
+unpivoted_tv_scores AS (
+    SELECT employee_id, 'Leadership' AS tgv_name, 'LIE_Skill' AS tv_name, "tv_lie_skill" AS user_score FROM tv_scores_wide
+    UNION ALL SELECT employee_id, 'Leadership', 'Leadership_Drive', "tv_leadership_drive" FROM tv_scores_wide
+    UNION ALL SELECT employee_id, 'Leadership', 'Command_Talent', "tv_command_talent" FROM tv_scores_wide
+    UNION ALL SELECT employee_id, 'Strategic', 'STO_Skill', "tv_sto_skill" FROM tv_scores_wide
+    UNION ALL SELECT employee_id, 'Strategic', 'Agility_Profile', "tv_agility_profile" FROM tv_scores_wide
+    UNION ALL SELECT employee_id, 'Strategic', 'Strategic_Talent', "tv_strategic_talent" FROM tv_scores_wide
+    UNION ALL SELECT employee_id, 'Drive', 'Achiever_Talent', "tv_achiever_talent" FROM tv_scores_wide
+    UNION ALL SELECT employee_id, 'Drive', 'GDR_Skill', "tv_gdr_skill" FROM tv_scores_wide
+    UNION ALL SELECT employee_id, 'Foundation', 'Context_Filter', "tv_context_filter" FROM tv_scores_wide
+    UNION ALL SELECT employee_id, 'Foundation', 'Cognitive_Filter', "tv_cognitive_filter" FROM tv_scores_wide
+),
+
+-- 4. Hitung Baseline (MEDIAN) dari Benchmark
+baseline_scores AS (
+    SELECT
+        tv_name,
+        PERCENTILE_CONT(0.5) WITHIN GROUP (ORDER BY user_score) AS baseline_score
+    FROM unpivoted_tv_scores
+    WHERE employee_id IN (SELECT employee_id FROM benchmark_selection)
+    GROUP BY tv_name
+),
+
+-- 5. Hitung TV Match Rate...
+tv_match_rates AS (
+    SELECT
+        u.employee_id, u.tgv_name, u.tv_name,
+        b.baseline_score, u.user_score,
+        CASE WHEN u.user_score = b.baseline_score THEN 100.0 ELSE 0.0 END AS tv_match_rate
+    FROM unpivoted_tv_scores u
+    JOIN baseline_scores b ON u.tv_name = b.tv_name
+),
+
+-- 6. Hitung TGV Match Rate...
+tgv_match_rates AS (
+    SELECT employee_id, tgv_name, AVG(tv_match_rate) AS tgv_match_rate
+    FROM tv_match_rates
+    GROUP BY employee_id, tgv_name
+),
+
+-- 7. Hitung Final Match Rate...
+final_match_rate AS (
+    SELECT
+        employee_id,
+        SUM(
+            tgv_match_rate * {tgv_weight_case}
+        ) AS final_match_rate
+    FROM tgv_match_rates
+    GROUP BY employee_id
+),
+
+-- 8. Dapatkan Detail Karyawan...
+employee_details AS (
+    SELECT
+        e.employee_id, e.fullname,
+        dir.name AS directorate,
+        pos.name AS role,
+        g.name AS grade
+    FROM employees e
+    LEFT JOIN dim_directorates dir ON e.directorate_id = dir.directorate_id
+    LEFT JOIN dim_positions pos ON e.position_id = pos.position_id
+    LEFT JOIN dim_grades g ON e.grade_id = g.grade_id
+)
+
+-- 9. FINAL SELECT
+SELECT
+    t.employee_id, d.fullname,
+    d.directorate, d.role, d.grade,
+    t.tgv_name, t.tv_name,
+    t.baseline_score, t.user_score,
+    t.tv_match_rate,
+    g.tgv_match_rate,
+    f.final_match_rate
+FROM tv_match_rates AS t
+JOIN tgv_match_rates AS g ON t.employee_id = g.employee_id AND t.tgv_name = g.tgv_name
+JOIN final_match_rate AS f ON t.employee_id = f.employee_id
+JOIN employee_details AS d ON t.employee_id = d.employee_id
+ORDER BY
+    f.final_match_rate DESC,
+    t.employee_id,
+    CASE
+        WHEN t.tgv_name = 'Leadership' THEN 1
+        WHEN t.tgv_name = 'Strategic' THEN 2
+        WHEN t.tgv_name = 'Drive' THEN 3
+        WHEN t.tgv_name = 'Foundation' THEN 4
+    END,
+    t.tv_name;
+""".replace("{tgv_weight_case}", tgv_weight_case_sql())
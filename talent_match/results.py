@@ -0,0 +1,163 @@
+"""
+Helper untuk membaca hasil `fetch_talent_data` di dashboard.
+
+Hasil bisa berformat long (10 baris per karyawan, sama dengan `task2.sql`) atau
+wide (satu baris per karyawan, lihat `TalentMatrix.match_baseline_wide`).
+Fungsi di sini menerima keduanya, sehingga dashboard tidak perlu tahu formatnya.
+
+Frame hasil top-K (`PatternIndex.top_k`, wide, dan mode similarity,
+long) hanya berisi sebagian karyawan; histogram seluruh perusahaan ada di
+`attrs['histogram']` dan baris benchmark di `attrs['benchmarks']`.
+"""
+
+import numpy as np
+import pandas as pd
+
+from .engine import CATEGORY_COLUMNS, TV_SCORE_COLUMNS
+from .rules import DETAIL_COLUMNS, TGV_ORDER, TGV_RATE_COLUMNS, TV_COLUMNS, WIDE_RESULT_COLUMNS
+
+
+def is_wide(df_results):
+    return 'tv_name' not in df_results.columns
+
+
+def ranked_list(df_results):
+    """Satu baris per karyawan, urut final_match_rate tertinggi."""
+    if is_wide(df_results):
+        return df_results
+    return df_results.drop_duplicates(subset=['employee_id']).sort_values(by='final_match_rate', ascending=False)
+
+
+def match_rate_histogram(df_results):
+    """Jumlah karyawan per nilai final_match_rate (kolom final_match_rate, count)."""
+    if 'histogram' in df_results.attrs:
+        return df_results.attrs['histogram']
+    df_counts = ranked_list(df_results)['final_match_rate'].value_counts()
+    return df_counts.rename_axis('final_match_rate').reset_index(name='count')
+
+
+def tgv_profile(df_results, employee_ids):
+    """Rata-rata tgv_match_rate per TGV untuk sekumpulan karyawan (urut TGV_ORDER)."""
+    if is_wide(df_results):
+        df_subset = df_results[df_results['employee_id'].isin(employee_ids)]
+        df_benchmarks = df_results.attrs.get('benchmarks')
+        if df_benchmarks is not None:
+            df_extra = df_benchmarks[~df_benchmarks['employee_id'].isin(df_subset['employee_id'])]
+            df_subset = pd.concat([df_subset, df_extra[df_extra['employee_id'].isin(employee_ids)]])
+        rates = [df_subset[TGV_RATE_COLUMNS[tgv]].astype(float).mean() for tgv in TGV_ORDER]
+        return pd.DataFrame({'tgv_name': TGV_ORDER, 'tgv_match_rate': rates}).dropna()
+
+    df_subset = df_results[df_results['employee_id'].isin(employee_ids)]
+    df_benchmarks = df_results.attrs.get('benchmarks')
+    if df_benchmarks is not None:
+        df_extra = df_benchmarks[~df_benchmarks['employee_id'].isin(df_subset['employee_id'])]
+        df_subset = pd.concat([df_subset, df_extra[df_extra['employee_id'].isin(employee_ids)]])
+    # Rata-rata per karyawan dulu: di mode similarity jumlah baris per TGV berbeda-beda
+    df_tgv = df_subset.drop_duplicates(['employee_id', 'tgv_name']).groupby('tgv_name')['tgv_match_rate'].mean()
+    return df_tgv.reindex(TGV_ORDER).dropna().rename_axis('tgv_name').reset_index()
+
+
+def tv_detail(df_results, employee_id):
+    """
+    Baris per TV untuk satu karyawan (tgv_name, tv_name, baseline_score,
+    user_score, tv_match_rate). Untuk format wide dihitung dari skor TV
+    karyawan dan `attrs['baseline']`.
+    """
+    if not is_wide(df_results):
+        return df_results[df_results['employee_id'] == employee_id].drop_duplicates(subset=['tv_name'])
+
+    row = df_results[df_results['employee_id'] == employee_id]
+    if row.empty:
+        return pd.DataFrame(columns=['tgv_name', 'tv_name', 'baseline_score', 'user_score', 'tv_match_rate'])
+
+    baseline = np.asarray(df_results.attrs['baseline'], dtype=float)
+    user_scores = row[TV_SCORE_COLUMNS].to_numpy()[0].astype(np.int64)
+    return pd.DataFrame({
+        'tgv_name': [tgv for _, tgv, _ in TV_COLUMNS],
+        'tv_name': [tv for _, _, tv in TV_COLUMNS],
+        'baseline_score': baseline,
+        'user_score': user_scores,
+        'tv_match_rate': np.where(user_scores == baseline, 100.0, 0.0),
+    })
+
+
+def long_to_wide(df_long):
+    """Ubah hasil long-format (path SQL) menjadi format wide."""
+    if df_long.empty:
+        return pd.DataFrame(columns=WIDE_RESULT_COLUMNS)
+
+    tv_column_of = {tv: col for col, _, tv in TV_COLUMNS}
+    df_ranked = df_long.drop_duplicates(subset=['employee_id'])[['employee_id'] + DETAIL_COLUMNS + ['final_match_rate']]
+
+    df_tv = df_long.pivot(index='employee_id', columns='tv_name', values='user_score').rename(columns=tv_column_of)
+    df_tgv = (
+        df_long.drop_duplicates(subset=['employee_id', 'tgv_name'])
+        .pivot(index='employee_id', columns='tgv_name', values='tgv_match_rate')
+        .rename(columns=TGV_RATE_COLUMNS)
+    )
+
+    df_wide = df_ranked.join(df_tv[TV_SCORE_COLUMNS].astype(np.int8), on='employee_id')
+    df_wide = df_wide.join(df_tgv[list(TGV_RATE_COLUMNS.values())].astype(np.float32), on='employee_id')
+    df_wide = df_wide.astype({col: 'category' for col in CATEGORY_COLUMNS})
+    df_wide['final_match_rate'] = df_wide['final_match_rate'].astype(float)
+    df_wide = df_wide[WIDE_RESULT_COLUMNS].reset_index(drop=True)
+
+    baseline = df_long.drop_duplicates(subset=['tv_name']).set_index('tv_name')['baseline_score']
+    df_wide.attrs['baseline'] = baseline.reindex([tv for _, _, tv in TV_COLUMNS]).to_numpy(dtype=float)
+    return df_wide
+
+
+class ResultView:
+    """
+    Turunan `df_results` yang dihitung sekali per hasil dan disimpan di
+    session state: ranked list, histogram, peta id→nama, profil TGV benchmark
+    dan (secara lazy) view TGV/TV per kandidat. Rerun dashboard hanya membaca
+    view ini, tanpa memfilter ulang seluruh frame.
+    """
+
+    def __init__(self, df_results, benchmark_ids):
+        self.df_results = df_results
+        self.benchmark_ids = list(benchmark_ids)
+        self.ranked = ranked_list(df_results)
+        self.histogram = match_rate_histogram(df_results)
+        self.n_candidates = int(self.histogram['count'].sum())
+        self.names = dict(zip(self.ranked['employee_id'].tolist(), self.ranked['fullname'].tolist()))
+        self.benchmark_tgv = tgv_profile(df_results, self.benchmark_ids)
+
+        # Posisi baris per employee_id (1 baris di format wide, 10 di format long, 1 per fitur di mode similarity)
+        codes, uniques = pd.factorize(df_results['employee_id'])
+        self._code_of = dict(zip(uniques.tolist(), range(len(uniques))))
+        self._row_order = np.argsort(codes, kind='stable')
+        self._row_offsets = np.r_[0, np.cumsum(np.bincount(codes, minlength=len(uniques)))]
+        self._candidate_tgv = {}
+        self._candidate_tv = {}
+        self._ranked_display = {}
+
+    def label(self, employee_id):
+        return f"{self.names.get(employee_id, employee_id)} ({employee_id})"
+
+    def ranked_display(self, limit=None):
+        """`limit` baris teratas ranked list (None = semua), final_match_rate diformat sebagai persen."""
+        if limit not in self._ranked_display:
+            df_ranked = self.ranked if limit is None else self.ranked.head(limit)
+            df_display = df_ranked[['employee_id', 'fullname', 'role', 'final_match_rate']].copy()
+            df_display['final_match_rate'] = ['{:,.1f}%'.format(rate) for rate in df_display['final_match_rate'].tolist()]
+            self._ranked_display[limit] = df_display
+        return self._ranked_display[limit]
+
+    def _candidate_frame(self, employee_id):
+        code = self._code_of.get(employee_id)
+        rows = self._row_order[self._row_offsets[code]:self._row_offsets[code + 1]] if code is not None else []
+        df_candidate = self.df_results.iloc[rows]
+        df_candidate.attrs = self.df_results.attrs
+        return df_candidate
+
+    def candidate_tgv(self, employee_id):
+        if employee_id not in self._candidate_tgv:
+            self._candidate_tgv[employee_id] = tgv_profile(self._candidate_frame(employee_id), [employee_id])
+        return self._candidate_tgv[employee_id]
+
+    def candidate_tv(self, employee_id):
+        if employee_id not in self._candidate_tv:
+            self._candidate_tv[employee_id] = tv_detail(self._candidate_frame(employee_id), employee_id)
+        return self._candidate_tv[employee_id]
@@ -0,0 +1,235 @@
+"""
+Kompilasi rule TV deklaratif (`rules.TV_RULES`) ke SQL dan ke evaluator NumPy.
+
+- `tv_features_sql()` menghasilkan query flag TV per karyawan (dipakai untuk
+  membangun `tv_features` di backend embedded). View `tv_features_source` di
+  `migrations/001_tv_features.sql` adalah `tv_features_view_sql()` apa adanya;
+  jika rule berubah, cetak ulang dengan `python -m talent_match.rule_engine --view`.
+- `raw_features_sql()` membaca fitur mentah yang dipakai rule (skor
+  kompetensi, PAPI, IQ, grade, masa kerja, tema strengths top 5) sekali saja.
+- `RuleEvaluator` mengevaluasi rule (dengan threshold yang bisa diubah) di
+  atas fitur mentah tersebut secara vektor, tanpa query ulang ke database.
+
+Nilai threshold berasal dari konfigurasi, bukan dari input request.
+"""
+
+import argparse
+import threading
+
+import numpy as np
+import pandas as pd
+
+from .rules import RAW_FEATURES, TGV_ORDER, TGV_WEIGHTS, TV_RULES
+
+# CTE sumber fitur TV (CTE 2-7 task2.sql). Skor kompetensi dibaca lewat TEXT
+# agar query yang sama berjalan di Postgres (kolom TEXT) dan DuckDB (DOUBLE).
+TV_SOURCE_TEMPLATE = """
+WITH
+latest_performance AS (
+    SELECT DISTINCT ON (employee_id)
+        employee_id, rating
+    FROM performance_yearly
+    WHERE rating BETWEEN 1 AND 5
+    ORDER BY employee_id, year DESC
+),
+
+latest_competencies AS (
+    SELECT DISTINCT ON (employee_id, pillar_code)
+        employee_id, pillar_code, CAST(NULLIF(CAST(score AS TEXT), '') AS DOUBLE PRECISION) AS score
+    FROM competencies_yearly
+    WHERE NULLIF(CAST(score AS TEXT), '') IS NOT NULL
+    ORDER BY employee_id, pillar_code, year DESC
+),
+
+pivot_competencies AS (
+    SELECT
+        employee_id,
+        MAX(CASE WHEN pillar_code = 'LIE' THEN score ELSE NULL END) AS "LIE",
+        MAX(CASE WHEN pillar_code = 'SEA' THEN score ELSE NULL END) AS "SEA",
+        MAX(CASE WHEN pillar_code = 'STO' THEN score ELSE NULL END) AS "STO",
+        MAX(CASE WHEN pillar_code = 'GDR' THEN score ELSE NULL END) AS "GDR"
+    FROM latest_competencies
+    GROUP BY employee_id
+),
+
+pivot_papi AS (
+    SELECT
+        employee_id,
+        MAX(CASE WHEN scale_code = 'Papi_L' THEN score ELSE NULL END) AS "Papi_L",
+        MAX(CASE WHEN scale_code = 'Papi_A' THEN score ELSE NULL END) AS "Papi_A",
+        MAX(CASE WHEN scale_code = 'Papi_B' THEN score ELSE NULL END) AS "Papi_B",
+        MAX(CASE WHEN scale_code = 'Papi_C' THEN score ELSE NULL END) AS "Papi_C"
+    FROM papi_scores
+    WHERE score IS NOT NULL
+    GROUP BY employee_id
+)
+
+-- Tema strengths top 5 ditulis langsung di EXISTS agar memakai idx_strengths_emp_theme_top5
+SELECT
+    e.employee_id,
+{select_list}
+FROM employees e
+LEFT JOIN latest_performance lp ON e.employee_id = lp.employee_id
+LEFT JOIN pivot_competencies pc ON e.employee_id = pc.employee_id
+LEFT JOIN pivot_papi pp ON e.employee_id = pp.employee_id
+LEFT JOIN profiles_psych ps ON e.employee_id = ps.employee_id
+LEFT JOIN dim_grades g ON e.grade_id = g.grade_id
+WHERE lp.rating IS NOT NULL
+ORDER BY e.employee_id
+"""
+
+COMPARISONS = {'>=': np.greater_equal, '>': np.greater, '<=': np.less_equal, '<': np.less}
+
+
+def sql_literal(value):
+    if isinstance(value, str):
+        return "'" + value.replace("'", "''") + "'"
+    if isinstance(value, (list, tuple)):
+        return '(' + ', '.join(sql_literal(v) for v in value) + ')'
+    return repr(value)
+
+
+def top5_sql(theme):
+    return (
+        "EXISTS (SELECT 1 FROM strengths s WHERE s.employee_id = e.employee_id "
+        f"AND s.rank <= 5 AND s.theme = {sql_literal(theme)})"
+    )
+
+
+def condition_sql(feature, op, value):
+    if op == 'top5':
+        return top5_sql(value)
+    if op == 'in':
+        return f"{RAW_FEATURES[feature]['sql']} IN {sql_literal(value)}"
+    if op in COMPARISONS:
+        return f"{RAW_FEATURES[feature]['sql']} {op} {sql_literal(value)}"
+    raise ValueError(f"Operator rule tidak dikenal: {op}")
+
+
+def tv_features_sql(rules=TV_RULES):
+    """Query satu baris per karyawan berisi flag 0/1 setiap TV."""
+    select_list = ',\n'.join(
+        f"    CASE WHEN {' AND '.join(condition_sql(*cond) for cond in conditions)} "
+        f"THEN 1 ELSE 0 END AS \"{column}\""
+        for column, _, _, conditions in rules
+    )
+    return TV_SOURCE_TEMPLATE.format(select_list=select_list)
+
+
+def tv_features_view_sql(rules=TV_RULES):
+    """DDL view `tv_features_source` untuk migrasi Postgres (body = `tv_features_sql()`)."""
+    return f"CREATE OR REPLACE VIEW tv_features_source AS{tv_features_sql(rules).rstrip()};\n"
+
+
+def top5_themes(rules=TV_RULES):
+    return sorted({value for *_, conditions in rules for feature, op, value in conditions if op == 'top5'})
+
+
+def raw_features_sql(rules=TV_RULES):
+    """Query fitur mentah (satu kolom per fitur, plus `top5_<tema>` 0/1)."""
+    columns = [f"    {spec['sql']} AS \"{name}\"" for name, spec in RAW_FEATURES.items()]
+    columns += [f"    CASE WHEN {top5_sql(theme)} THEN 1 ELSE 0 END AS \"top5_{theme}\"" for theme in top5_themes(rules)]
+    return TV_SOURCE_TEMPLATE.format(select_list=',\n'.join(columns))
+
+
+def tgv_weight_case_sql(weights=TGV_WEIGHTS, column='tgv_name'):
+    """CASE bobot TGV untuk final_match_rate (CTE 7 di TALENT_MATCH_QUERY)."""
+    whens = '\n'.join(f"                WHEN {column} = {sql_literal(tgv)} THEN {weights[tgv]!r}" for tgv in TGV_ORDER)
+    return f"CASE\n{whens}\n            END"
+
+
+def tunable_conditions(rules=TV_RULES):
+    """Daftar ((kolom TV, indeks kondisi), fitur, operator, nilai default) untuk slider."""
+    return [
+        ((column, i), feature, op, value)
+        for column, _, _, conditions in rules
+        for i, (feature, op, value) in enumerate(conditions)
+        if op in COMPARISONS
+    ]
+
+
+def tune_rules(thresholds, rules=TV_RULES):
+    """Salinan `rules` dengan threshold {(kolom TV, indeks kondisi): nilai} diganti."""
+    return [
+        (column, tgv, tv, [
+            (feature, op, thresholds.get((column, i), value)) for i, (feature, op, value) in enumerate(conditions)
+        ])
+        for column, tgv, tv, conditions in rules
+    ]
+
+
+class RuleEvaluator:
+    """
+    Fitur mentah karyawan (urut sesuai `employee_ids`) untuk evaluasi rule
+    vektor. Mask per kondisi di-memo, sehingga mengubah satu threshold hanya
+    menghitung ulang kondisi tersebut.
+    """
+
+    MAX_CACHED_MASKS = 64
+
+    def __init__(self, df_raw, employee_ids=None):
+        if employee_ids is not None:
+            # Karyawan yang tidak ada di df_raw mendapat fitur NULL (semua flag 0)
+            df_raw = df_raw.set_index('employee_id').reindex(pd.Index(employee_ids, name='employee_id')).reset_index()
+        self.employee_ids = df_raw['employee_id'].to_numpy()
+        self.features = {}
+        self.categories = {}
+        for name in df_raw.columns.drop('employee_id'):
+            if name == 'grade':
+                # Fitur teks disimpan sebagai kode kategori (-1 = NULL)
+                self.features[name], self.categories[name] = pd.factorize(df_raw[name])
+            else:
+                self.features[name] = pd.to_numeric(df_raw[name]).to_numpy(dtype=float, na_value=np.nan)
+        self._masks = {}
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self.employee_ids)
+
+    def _compute_mask(self, feature, op, value):
+        if op == 'top5':
+            return self.features[f'top5_{value}'] == 1
+        if op == 'in':
+            lookup = np.append(np.isin(np.asarray(self.categories[feature], dtype=object), list(value)), False)
+            return lookup[self.features[feature]]
+        # Perbandingan dengan NaN (NULL) selalu False, sama dengan CASE WHEN di SQL
+        return COMPARISONS[op](self.features[feature], value)
+
+    def condition_mask(self, feature, op, value):
+        key = (feature, op, tuple(value) if isinstance(value, (list, tuple)) else value)
+        mask = self._masks.get(key)
+        if mask is None:
+            mask = self._compute_mask(feature, op, value)
+            with self._lock:
+                if len(self._masks) >= self.MAX_CACHED_MASKS:
+                    self._masks.clear()
+                self._masks[key] = mask
+        return mask
+
+    def scores(self, rules=TV_RULES):
+        """Matriks flag TV (int8, karyawan x TV) untuk `rules`."""
+        scores = np.empty((len(self), len(rules)), dtype=np.int8)
+        for j, (_, _, _, conditions) in enumerate(rules):
+            mask = np.ones(len(self), dtype=bool)
+            for condition in conditions:
+                mask &= self.condition_mask(*condition)
+            scores[:, j] = mask
+        return scores
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Cetak SQL hasil kompilasi rule TV.")
+    group = parser.add_mutually_exclusive_group()
+    group.add_argument('--raw', action='store_true', help="query fitur mentah, bukan flag TV")
+    group.add_argument('--view', action='store_true', help="DDL view tv_features_source (migrasi 001)")
+    args = parser.parse_args()
+    if args.raw:
+        print(raw_features_sql())
+    elif args.view:
+        print(tv_features_view_sql(), end='')
+    else:
+        print(tv_features_sql())
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,93 @@
+"""
+Definisi Talent Variable (TV) dan Talent Group Variable (TGV).
+
+Urutan `TV_COLUMNS` sama dengan urutan unpivot di `task2.sql` (CTE 8).
+"""
+
+# Bobot tiap TGV untuk final_match_rate (CTE 12)
+TGV_WEIGHTS = {
+    'Leadership': 0.35,
+    'Strategic': 0.35,
+    'Drive': 0.15,
+    'Foundation': 0.15,
+}
+
+# Urutan TGV di output (ORDER BY pada FINAL SELECT)
+TGV_ORDER = list(TGV_WEIGHTS)
+
+# Fitur mentah per karyawan yang dipakai rule TV: ekspresi SQL (alias CTE di
+# `rule_engine.TV_SOURCE_TEMPLATE`) serta rentang dan langkah slider dashboard
+RAW_FEATURES = {
+    'LIE': {'sql': 'pc."LIE"', 'range': (0.0, 5.0), 'step': 0.1},
+    'SEA': {'sql': 'pc."SEA"', 'range': (0.0, 5.0), 'step': 0.1},
+    'STO': {'sql': 'pc."STO"', 'range': (0.0, 5.0), 'step': 0.1},
+    'GDR': {'sql': 'pc."GDR"', 'range': (0.0, 5.0), 'step': 0.1},
+    'Papi_L': {'sql': 'pp."Papi_L"', 'range': (1, 9), 'step': 1},
+    'Papi_A': {'sql': 'pp."Papi_A"', 'range': (1, 9), 'step': 1},
+    'Papi_B': {'sql': 'pp."Papi_B"', 'range': (1, 9), 'step': 1},
+    'Papi_C': {'sql': 'pp."Papi_C"', 'range': (1, 9), 'step': 1},
+    'iq': {'sql': 'ps.iq', 'range': (80, 140), 'step': 1},
+    'years_of_service_months': {'sql': 'e.years_of_service_months', 'range': (0, 150), 'step': 1},
+    'grade': {'sql': 'g.name'},
+}
+
+# Rule TV (CTE 2-7 task2.sql) dalam bentuk deklaratif:
+# (kolom di tv_scores_wide, tgv_name, tv_name, kondisi). TV bernilai 1 jika
+# SEMUA kondisi (fitur, operator, nilai) terpenuhi; fitur NULL = tidak terpenuhi.
+# Operator: '>=', '>', '<=', '<', 'in' (daftar nilai), 'top5' (tema strengths
+# di peringkat 1-5). Lihat `rule_engine` untuk kompilasi ke SQL dan NumPy.
+TV_RULES = [
+    ('tv_lie_skill', 'Leadership', 'LIE_Skill', [('LIE', '>=', 2.0), ('SEA', '>=', 1.8)]),
+    ('tv_leadership_drive', 'Leadership', 'Leadership_Drive', [('Papi_L', '>', 5), ('Papi_A', '>', 4)]),
+    ('tv_command_talent', 'Leadership', 'Command_Talent', [('strengths', 'top5', 'Command')]),
+    ('tv_sto_skill', 'Strategic', 'STO_Skill', [('STO', '>=', 1.8)]),
+    ('tv_agility_profile', 'Strategic', 'Agility_Profile', [('Papi_B', '<', 5), ('Papi_C', '<', 6)]),
+    ('tv_strategic_talent', 'Strategic', 'Strategic_Talent', [('strengths', 'top5', 'Strategic')]),
+    ('tv_achiever_talent', 'Drive', 'Achiever_Talent', [('strengths', 'top5', 'Achiever')]),
+    ('tv_gdr_skill', 'Drive', 'GDR_Skill', [('GDR', '>', 1.0)]),
+    ('tv_context_filter', 'Foundation', 'Context_Filter', [('grade', 'in', ('IV', 'V')), ('years_of_service_months', '>', 49)]),
+    ('tv_cognitive_filter', 'Foundation', 'Cognitive_Filter', [('iq', '>', 101)]),
+]
+
+# (kolom di tv_scores_wide, tgv_name, tv_name)
+TV_COLUMNS = [(col, tgv, tv) for col, tgv, tv, _ in TV_RULES]
+
+# Kolom detail karyawan yang ikut di hasil akhir (CTE 13)
+DETAIL_COLUMNS = ['fullname', 'directorate', 'role', 'grade']
+
+# Kolom hasil fetch_talent_data, sesuai FINAL SELECT
+RESULT_COLUMNS = [
+    'employee_id', 'fullname',
+    'directorate', 'role', 'grade',
+    'tgv_name', 'tv_name',
+    'baseline_score', 'user_score',
+    'tv_match_rate',
+    'tgv_match_rate',
+    'final_match_rate',
+]
+
+# Format wide (satu baris per karyawan): kolom match rate per TGV
+TGV_RATE_COLUMNS = {tgv: f'{tgv.lower()}_match_rate' for tgv in TGV_ORDER}
+
+# Kolom hasil format wide: detail, skor TV (0/1), match rate per TGV, final
+WIDE_RESULT_COLUMNS = (
+    ['employee_id'] + DETAIL_COLUMNS
+    + [col for col, _, _ in TV_COLUMNS]
+    + list(TGV_RATE_COLUMNS.values())
+    + ['final_match_rate']
+)
+
+# Mode similarity: fitur mentah kontinu per TGV (kolom master analysis table).
+# Fitur distandarisasi (z-score) lalu dibandingkan dengan median benchmark;
+# lihat `similarity`. Pilar kompetensi memakai skor tahun valid terakhir.
+COMPETENCY_PILLARS = ['GDR', 'CEX', 'IDS', 'QDD', 'STO', 'SEA', 'VCU', 'LIE', 'FTC', 'CSI']
+PSYCH_FEATURES = ['iq', 'gtq', 'pauli', 'tiki']
+SIMILARITY_FEATURES = {
+    'Leadership': ['LIE', 'SEA', 'Papi_L', 'Papi_A', 'Papi_P', 'Papi_X', 'Papi_I'],
+    'Strategic': ['STO', 'IDS', 'FTC', 'CSI', 'VCU', 'Papi_B', 'Papi_C', 'Papi_R', 'Papi_D'],
+    'Drive': ['GDR', 'CEX', 'QDD', 'Papi_N', 'Papi_G', 'Papi_T', 'Papi_V', 'Papi_W'],
+    'Foundation': [
+        'iq', 'gtq', 'pauli', 'tiki', 'years_of_service_months',
+        'Papi_S', 'Papi_O', 'Papi_Z', 'Papi_E', 'Papi_K', 'Papi_F',
+    ],
+}
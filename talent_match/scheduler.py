@@ -0,0 +1,136 @@
+"""
+Scheduler bersama untuk request pencocokan dari banyak sesi dashboard.
+
+- Coalescing: request dengan kunci sama (set benchmark terurut + versi data)
+  yang masih berjalan atau mengantri tidak dieksekusi ulang; pemanggil kedua
+  menunggu Future yang sama.
+- Pool worker terbatas (`max_workers`) membatasi query paralel ke database,
+  sehingga burst tidak menghabiskan koneksi pooler.
+- Antrian terbatas (`max_queue` request yang belum mulai). Jika penuh,
+  `submit` menunggu slot paling lama `queue_timeout` detik lalu melempar
+  `QueueFull`; dashboard menampilkan pesan "coba lagi" alih-alih error.
+
+`stats()` berisi kedalaman antrian, jumlah request yang digabung/ditolak dan
+persentil waktu tunggu di antrian. Load test: `benchmarks/load_test.py`.
+"""
+
+import threading
+import time
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
+
+import numpy as np
+
+
+class QueueFull(Exception):
+    """Antrian scheduler penuh sampai batas waktu tunggu."""
+
+
+def request_key(benchmark_ids, *extra):
+    """Kunci coalescing: set benchmark terurut (urutan dan duplikat diabaikan) plus konteks lain."""
+    return (tuple(sorted(set(benchmark_ids))),) + extra
+
+
+class MatchScheduler:
+    """Pool worker terbatas dengan antrian terbatas dan penggabungan request identik."""
+
+    def __init__(self, max_workers=4, max_queue=32, queue_timeout=0.0, maxlen=1000):
+        self.max_workers = max_workers
+        self.max_queue = max_queue
+        self.queue_timeout = queue_timeout
+        self.submitted = 0
+        self.coalesced = 0
+        self.rejected = 0
+        self.failed = 0
+        self.max_depth = 0
+        self._queued = 0
+        self._running = 0
+        self._inflight = {}
+        self._waits = deque(maxlen=maxlen)
+        self._runs = deque(maxlen=maxlen)
+        self._lock = threading.Lock()
+        self._slot_free = threading.Condition(self._lock)
+        self._executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix='match_scheduler')
+
+    def submit(self, key, fn):
+        """
+        Future hasil `fn()` untuk `key`. Jika `key` sedang diproses, Future
+        yang sudah ada dikembalikan. Melempar `QueueFull` jika antrian penuh.
+        """
+        deadline = time.monotonic() + self.queue_timeout
+        with self._lock:
+            while True:
+                future = self._inflight.get(key)
+                if future is not None:
+                    self.coalesced += 1
+                    return future
+                if self._queued < self.max_queue:
+                    break
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    self.rejected += 1
+                    raise QueueFull(f"Antrian penuh ({self._queued} request menunggu)")
+                self._slot_free.wait(remaining)
+
+            self.submitted += 1
+            self._queued += 1
+            self.max_depth = max(self.max_depth, self._queued)
+            future = Future()
+            self._inflight[key] = future
+
+        self._executor.submit(self._run, key, fn, future, time.perf_counter())
+        return future
+
+    def _run(self, key, fn, future, enqueued_at):
+        started_at = time.perf_counter()
+        with self._lock:
+            self._queued -= 1
+            self._running += 1
+            self._waits.append((started_at - enqueued_at) * 1000)
+            self._slot_free.notify()
+
+        try:
+            result = fn()
+        except BaseException as e:
+            with self._lock:
+                self.failed += 1
+            error = e
+        else:
+            error = None
+        finally:
+            with self._lock:
+                self._running -= 1
+                self._runs.append((time.perf_counter() - started_at) * 1000)
+                # Dilepas sebelum hasil di-set: request berikutnya dengan kunci sama dihitung ulang
+                del self._inflight[key]
+
+        if error is not None:
+            future.set_exception(error)
+        else:
+            future.set_result(result)
+
+    def run(self, key, fn, timeout=None):
+        """`submit(key, fn).result(timeout)`."""
+        return self.submit(key, fn).result(timeout)
+
+    def stats(self):
+        """Kedalaman antrian, counter dan persentil waktu tunggu/eksekusi (ms)."""
+        with self._lock:
+            waits = np.array(self._waits) if self._waits else np.zeros(1)
+            runs = np.array(self._runs) if self._runs else np.zeros(1)
+            return {
+                'workers': self.max_workers,
+                'queue_depth': self._queued,
+                'max_queue': self.max_queue,
+                'max_depth': self.max_depth,
+                'running': self._running,
+                'submitted': self.submitted,
+                'coalesced': self.coalesced,
+                'rejected': self.rejected,
+                'failed': self.failed,
+                'wait_p50_ms': round(float(np.percentile(waits, 50)), 3),
+                'wait_p95_ms': round(float(np.percentile(waits, 95)), 3),
+                'wait_max_ms': round(float(waits.max()), 3),
+                'run_p50_ms': round(float(np.percentile(runs, 50)), 3),
+                'run_p95_ms': round(float(np.percentile(runs, 95)), 3),
+            }
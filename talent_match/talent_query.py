@@ -0,0 +1,133 @@
+"""
+Eksekusi `TALENT_MATCH_QUERY` sebagai prepared statement Postgres.
+
+Statement di-PREPARE sekali per koneksi DBAPI (ditandai di `Connection.info`,
+yang ikut tersimpan bersama koneksi di pool), lalu setiap request cukup
+menjalankan `EXECUTE` dengan array benchmark sebagai parameter. Setelah
+beberapa eksekusi Postgres bisa memakai generic plan sehingga tahap planning
+dilewati.
+"""
+
+import json
+
+import pandas as pd
+from sqlalchemy import text
+
+from .queries import TALENT_MATCH_QUERY
+
+PREPARED_NAME = 'talent_match_query'
+
+PREPARE_STATEMENT = (
+    f"PREPARE {PREPARED_NAME} (TEXT[]) AS "
+    + TALENT_MATCH_QUERY.replace(':benchmark_ids', '$1').strip().rstrip(';')
+)
+
+
+def prepare_talent_query(conn):
+    """PREPARE statement pada koneksi ini jika belum pernah."""
+    if not conn.info.get(PREPARED_NAME):
+        conn.exec_driver_sql(PREPARE_STATEMENT)
+        conn.info[PREPARED_NAME] = True
+
+
+def execute_talent_match(conn, benchmark_ids, prepared=True):
+    """Jalankan query Task 2 dan ambil semua baris; kembalikan (kolom, baris)."""
+    params = {'benchmark_ids': list(benchmark_ids)}
+    if not prepared or conn.dialect.name != 'postgresql':
+        result = conn.execute(text(TALENT_MATCH_QUERY), params)
+    else:
+        prepare_talent_query(conn)
+        result = conn.execute(text(f"EXECUTE {PREPARED_NAME}(:benchmark_ids)"), params)
+    return list(result.keys()), result.fetchall()
+
+
+def talent_match_frame(columns, rows):
+    """Baris hasil `execute_talent_match` -> DataFrame (seperti `pd.read_sql_query`)."""
+    return pd.DataFrame.from_records(rows, columns=columns, coerce_float=True)
+
+
+def read_talent_match(conn, benchmark_ids, prepared=True):
+    """Jalankan query Task 2 untuk `benchmark_ids` dan kembalikan DataFrame long-format."""
+    return talent_match_frame(*execute_talent_match(conn, benchmark_ids, prepared))
+
+
+def explain_talent_match(conn, benchmark_ids):
+    """
+    Jalankan query Task 2 di bawah EXPLAIN ANALYZE. Postgres: plan JSON
+    (dengan BUFFERS); backend lain: plan teks.
+    """
+    params = {'benchmark_ids': list(benchmark_ids)}
+    if conn.dialect.name != 'postgresql':
+        rows = conn.execute(text("EXPLAIN ANALYZE " + TALENT_MATCH_QUERY), params).fetchall()
+        return '\n'.join(str(row[-1]) for row in rows)
+    plan = conn.execute(text("EXPLAIN (ANALYZE, BUFFERS, FORMAT JSON) " + TALENT_MATCH_QUERY), params).scalar()
+    return json.loads(plan) if isinstance(plan, str) else plan
+
+
+def _node_ms(node):
+    return node.get('Actual Total Time', 0.0) * node.get('Actual Loops', 1)
+
+
+def _node_blocks(node):
+    return node.get('Shared Hit Blocks', 0) + node.get('Shared Read Blocks', 0)
+
+
+def cte_breakdown(plan):
+    """
+    Waktu eksklusif dan shared buffer per CTE dari plan JSON Postgres, urut
+    terbesar. Node di luar CTE dihitung sebagai "(query utama)".
+
+    CTE dievaluasi lazy oleh CTE Scan pertama yang membacanya, jadi waktu
+    CTE Scan sudah termasuk waktu CTE-nya; bagian itu dikurangkan agar tidak
+    dihitung dua kali. CTE yang di-inline Postgres tidak punya node sendiri
+    dan masuk ke bagian yang memakainya.
+    """
+    root = plan[0]['Plan']
+    cte_ms = {}
+
+    def collect(node):
+        if node.get('Subplan Name', '').startswith('CTE '):
+            cte_ms[node['Subplan Name'][4:]] = _node_ms(node)
+        for child in node.get('Plans', []):
+            collect(child)
+
+    # Total waktu semua CTE Scan per CTE, untuk membagi waktu evaluasi CTE
+    scan_ms = {}
+
+    def collect_scans(node):
+        if node.get('Node Type') == 'CTE Scan':
+            scan_ms[node['CTE Name']] = scan_ms.get(node['CTE Name'], 0.0) + _node_ms(node)
+        for child in node.get('Plans', []):
+            collect_scans(child)
+
+    collect(root)
+    collect_scans(root)
+
+    sections = {}
+
+    def visit(node, section):
+        if node.get('Subplan Name', '').startswith('CTE '):
+            section = node['Subplan Name'][4:]
+        children = node.get('Plans', [])
+        inner = [child for child in children if not child.get('Subplan Name', '').startswith('CTE ')]
+        ms = _node_ms(node) - sum(_node_ms(child) for child in inner)
+        blocks = _node_blocks(node) - sum(_node_blocks(child) for child in inner)
+        cte = node.get('CTE Name')
+        if node.get('Node Type') == 'CTE Scan' and cte in cte_ms:
+            # Sisa setelah waktu evaluasi CTE, dibagi proporsional antar CTE Scan
+            ms *= max(0.0, scan_ms[cte] - cte_ms[cte]) / scan_ms[cte] if scan_ms[cte] > 0 else 0.0
+            blocks = 0
+        total = sections.setdefault(section, {'section': section, 'exclusive_ms': 0.0, 'shared_blocks': 0, 'nodes': 0})
+        total['exclusive_ms'] += max(ms, 0.0)
+        total['shared_blocks'] += max(blocks, 0)
+        total['nodes'] += 1
+        for child in children:
+            visit(child, section)
+
+    visit(root, '(query utama)')
+    execution_ms = plan[0].get('Execution Time') or sum(s['exclusive_ms'] for s in sections.values())
+    rows = sorted(sections.values(), key=lambda s: s['exclusive_ms'], reverse=True)
+    for row in rows:
+        row['exclusive_ms'] = round(row['exclusive_ms'], 3)
+        row['share'] = round(row['exclusive_ms'] / execution_ms, 4) if execution_ms else 0.0
+    return rows
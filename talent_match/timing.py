@@ -0,0 +1,92 @@
+"""
+Span timing terstruktur untuk pipeline dashboard.
+
+Setiap span (nama, durasi, status dan atribut tambahan) disimpan di ring
+buffer in-memory untuk panel Performance, dan ditulis sebagai satu baris JSON
+ke logger `talent_match.timing`:
+
+    {"span": "fetch_talent_data.query", "ms": 41.7, "status": "ok", "source": "sql", ...}
+
+Logger ini tidak punya handler bawaan; aktifkan dengan `configure_span_log()`
+(file JSON lines) atau konfigurasi logging aplikasi.
+"""
+
+import json
+import logging
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager
+
+import numpy as np
+
+logger = logging.getLogger('talent_match.timing')
+
+
+def configure_span_log(path):
+    """Tulis span ke `path` sebagai JSON lines (sekali per proses)."""
+    if any(getattr(handler, 'baseFilename', None) == path for handler in logger.handlers):
+        return
+    handler = logging.FileHandler(path)
+    handler.setFormatter(logging.Formatter('%(message)s'))
+    logger.addHandler(handler)
+    logger.setLevel(logging.INFO)
+
+
+class SpanLog:
+    """Ring buffer span terakhir (thread-safe, dipakai bersama semua sesi)."""
+
+    def __init__(self, maxlen=1000):
+        self._spans = deque(maxlen=maxlen)
+        self._lock = threading.Lock()
+
+    @contextmanager
+    def span(self, name, **attrs):
+        """
+        Ukur blok `with`. Record yang di-yield boleh ditambah atribut
+        (mis. jumlah baris) sebelum blok selesai.
+        """
+        record = {'span': name, 'ts': round(time.time(), 3), **attrs}
+        start = time.perf_counter()
+        try:
+            yield record
+            record.setdefault('status', 'ok')
+        except GeneratorExit:
+            # Generator (mis. stream profil AI) ditutup sebelum selesai
+            record['status'] = 'cancelled'
+            raise
+        except BaseException as e:
+            record['status'] = 'error'
+            record['error'] = type(e).__name__
+            raise
+        finally:
+            record['ms'] = round((time.perf_counter() - start) * 1000, 3)
+            record['thread'] = threading.current_thread().name
+            with self._lock:
+                self._spans.append(record)
+            logger.info(json.dumps(record, default=str))
+
+    def records(self):
+        with self._lock:
+            return list(self._spans)
+
+    def clear(self):
+        with self._lock:
+            self._spans.clear()
+
+    def summary(self):
+        """Statistik per nama span: jumlah, p50, p95, maks dan durasi terakhir (ms)."""
+        durations = {}
+        for record in self.records():
+            durations.setdefault(record['span'], []).append(record['ms'])
+        return [
+            {
+                'span': name,
+                'count': len(values),
+                'p50_ms': round(float(np.percentile(values, 50)), 2),
+                'p95_ms': round(float(np.percentile(values, 95)), 2),
+                'max_ms': round(max(values), 2),
+                'last_ms': round(values[-1], 2),
+            }
+            for name, values in sorted(durations.items())
+        ]
@@ -0,0 +1,13 @@
+import pytest
+from sqlalchemy import create_engine
+
+from talent_match.embedded import embedded_url, prepare_embedded_database
+
+
+@pytest.fixture(scope='session')
+def embedded_engine(tmp_path_factory):
+    """Engine DuckDB read-only yang dibangun dari `dataset/`."""
+    db_path = prepare_embedded_database('dataset', str(tmp_path_factory.mktemp('embedded')))
+    engine = create_engine(embedded_url(db_path), connect_args={'read_only': True})
+    yield engine
+    engine.dispose()
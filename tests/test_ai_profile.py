@@ -0,0 +1,80 @@
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import pytest
+from openai import OpenAI
+
+from benchmarks.stub_llm import STUB_PROFILE, start_stub_server
+from talent_match.ai_profile import ProfileStreamParser, parse_profile_sections, stream_ai_profile, stream_alongside
+
+
+@pytest.fixture
+def slow_stub():
+    """Stub LLM yang baru mengirim token pertama setelah 0.5 s, lalu satu token per 10 ms."""
+    server, state, base_url = start_stub_server(first_token_delay=0.5, token_delay=0.01)
+    yield OpenAI(base_url=base_url, api_key='stub')
+    server.shutdown()
+
+
+def run_alongside(client, talent_seconds):
+    events = []
+    start = time.perf_counter()
+
+    def talent_query():
+        time.sleep(talent_seconds)
+        return 'ranked list'
+
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        future = executor.submit(talent_query)
+        stream_alongside(
+            executor,
+            stream_ai_profile(client, 'Data Analyst', 'V', 'Analisis data', 'stub'),
+            future,
+            lambda text: events.append(('chunk', text, time.perf_counter() - start, threading.get_ident())),
+            lambda result: events.append(('result', result, time.perf_counter() - start, threading.get_ident())),
+        )
+    return events
+
+
+def test_ranked_list_renders_before_stream_ends(slow_stub):
+    events = run_alongside(slow_stub, talent_seconds=0.05)
+
+    kinds = [kind for kind, *_ in events]
+    assert kinds.count('result') == 1
+    # Hasil query tampil sebelum potongan profil pertama, tidak menunggu LLM
+    assert kinds[0] == 'result'
+    assert kinds[-1] == 'chunk'
+    result_at = events[0][2]
+    assert result_at < 0.4
+    assert result_at < events[-1][2] - 0.5
+
+    assert ''.join(text for kind, text, *_ in events if kind == 'chunk') == STUB_PROFILE
+    # Semua callback berjalan di thread pemanggil (thread script Streamlit)
+    assert {thread for *_, thread in events} == {threading.get_ident()}
+
+
+def test_slow_query_result_arrives_after_stream(slow_stub):
+    events = run_alongside(slow_stub, talent_seconds=2.5)
+    assert [kind for kind, *_ in events][-1] == 'result'
+    assert ''.join(text for kind, text, *_ in events if kind == 'chunk') == STUB_PROFILE
+
+
+def test_stream_error_is_raised_after_result():
+    def broken_stream():
+        yield '### Deskripsi'
+        raise ConnectionError("stream putus")
+
+    results = []
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        future = executor.submit(lambda: 'ranked list')
+        with pytest.raises(ConnectionError):
+            stream_alongside(executor, broken_stream(), future, lambda text: None, results.append)
+    assert results == ['ranked list']
+
+
+def test_incremental_parser_matches_full_parse():
+    parser = ProfileStreamParser()
+    for start in range(0, len(STUB_PROFILE), 7):
+        parser.feed(STUB_PROFILE[start:start + 7])
+    assert parser.rows() == parse_profile_sections(STUB_PROFILE)
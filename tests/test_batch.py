@@ -0,0 +1,104 @@
+import json
+
+import pandas as pd
+import pytest
+
+from talent_match.batch import group_by_baseline, read_benchmark_sets, run_batch
+from talent_match.matching import TalentMatcher, read_talent_matrix
+from talent_match.pattern_index import PatternIndex
+
+
+@pytest.fixture(scope='module')
+def talent_matrix(embedded_engine):
+    return read_talent_matrix(embedded_engine)
+
+
+@pytest.fixture(scope='module')
+def benchmark_sets(talent_matrix):
+    ids = sorted(talent_matrix.employee_ids)
+    step = len(ids) // 9
+    return [
+        ('a', ids[:3]),
+        ('b', [ids[step]]),
+        ('c', [ids[2 * step], ids[3 * step]]),
+        # Urutan berbeda, baseline sama dengan 'a'
+        ('d', [ids[2], ids[0], ids[1]]),
+        ('e', ['TIDAK_ADA']),
+        ('f', [ids[4 * step], 'TIDAK_ADA']),
+        ('g', ids[5 * step:5 * step + 4]),
+    ]
+
+
+def test_read_benchmark_sets_csv(tmp_path):
+    path = tmp_path / 'sets.csv'
+    path.write_text("set_id,benchmark_ids\nanalyst,EMP1; EMP2 ;;EMP3\nkosong,\n7,EMP4\n")
+    assert read_benchmark_sets(str(path)) == [
+        ('analyst', ['EMP1', 'EMP2', 'EMP3']),
+        ('kosong', []),
+        ('7', ['EMP4']),
+    ]
+
+
+def test_read_benchmark_sets_jsonl(tmp_path):
+    path = tmp_path / 'sets.jsonl'
+    lines = [json.dumps({'set_id': 1, 'benchmark_ids': ['EMP1', 'EMP2']}), '', json.dumps({'set_id': 'x', 'benchmark_ids': []})]
+    path.write_text('\n'.join(lines) + '\n')
+    assert read_benchmark_sets(str(path)) == [('1', ['EMP1', 'EMP2']), ('x', [])]
+
+
+def test_group_by_baseline_dedups_and_skips_unknown(talent_matrix, benchmark_sets):
+    groups, skipped = group_by_baseline(talent_matrix, benchmark_sets)
+    assert skipped == ['e']
+
+    set_groups = [set_ids for _, set_ids in groups]
+    assert ['a', 'd'] in set_groups
+    assert sorted(set_id for set_ids in set_groups for set_id in set_ids) == ['a', 'b', 'c', 'd', 'f', 'g']
+    for baseline, set_ids in groups:
+        for set_id in set_ids:
+            assert (talent_matrix.baseline(dict(benchmark_sets)[set_id]) == baseline).all()
+
+
+@pytest.mark.parametrize('top_k, result_format', [(50, 'topk'), (0, 'wide')])
+def test_run_batch_matches_matcher_for_any_worker_count(embedded_engine, talent_matrix, benchmark_sets,
+                                                         tmp_path, top_k, result_format):
+    pattern_index = PatternIndex(talent_matrix)
+    matcher = TalentMatcher(embedded_engine, talent_matrix, pattern_index, result_format=result_format,
+                            ranked_list_size=top_k)
+
+    outputs = {}
+    for workers in (1, 2):
+        out_dir = tmp_path / f'workers{workers}'
+        summary = run_batch(pattern_index, benchmark_sets, str(out_dir), top_k, workers=workers, chunk_size=2)
+        assert summary['workers'] == workers
+        assert summary['sets'] == 6
+        assert summary['skipped'] == ['e']
+        df_out = pd.read_parquet(out_dir)
+        assert summary['rows'] == len(df_out)
+        outputs[workers] = df_out.sort_values(['set_id', 'rank'], ignore_index=True)
+
+    pd.testing.assert_frame_equal(outputs[1], outputs[2])
+
+    for set_id, benchmark_ids in benchmark_sets:
+        df_set = outputs[1][outputs[1]['set_id'] == set_id]
+        df_expected = matcher.match(benchmark_ids)
+        if df_expected.empty:
+            assert df_set.empty
+            continue
+        assert df_set['rank'].tolist() == list(range(1, len(df_expected) + 1))
+        pd.testing.assert_frame_equal(
+            df_set.drop(columns=['set_id', 'rank']).reset_index(drop=True),
+            df_expected.reset_index(drop=True),
+            check_dtype=False, check_categorical=False,
+        )
+
+
+def test_run_batch_removes_stale_parts(talent_matrix, benchmark_sets, tmp_path):
+    pattern_index = PatternIndex(talent_matrix)
+    run_batch(pattern_index, benchmark_sets, str(tmp_path), 10, workers=1, chunk_size=1)
+    assert len(list(tmp_path.glob('part-*.parquet'))) == 5
+
+    (tmp_path / 'catatan.txt').write_text('bukan potongan')
+    run_batch(pattern_index, benchmark_sets[:1], str(tmp_path), 10, workers=1, chunk_size=1)
+    assert [path.name for path in tmp_path.glob('part-*.parquet')] == ['part-00000.parquet']
+    assert (tmp_path / 'catatan.txt').exists()
+    assert set(pd.read_parquet(tmp_path / 'part-00000.parquet')['set_id']) == {'a'}
@@ -0,0 +1,43 @@
+import numpy as np
+import pandas as pd
+
+from talent_match.cache import BaselineResultCache
+
+
+def result_frame():
+    df_results = pd.DataFrame({
+        'employee_id': ['E1', 'E2'],
+        'directorate': pd.Categorical(['R&D', 'HR']),
+        'final_match_rate': [91.5, 80.0],
+    })
+    df_results.attrs['baseline'] = np.array([1.0, 0.5, 0.0])
+    df_results.attrs['histogram'] = pd.DataFrame({'final_match_rate': [91.5, 80.0], 'count': [1, 1]})
+    return df_results
+
+
+def test_disk_round_trip_keeps_attrs(tmp_path):
+    baseline = [1.0, 0.5, 0.0]
+    BaselineResultCache(disk_dir=str(tmp_path)).put(baseline, result_frame())
+
+    cache = BaselineResultCache(disk_dir=str(tmp_path))
+    assert baseline in cache
+    df_cached = cache.get(baseline)
+
+    expected = result_frame()
+    pd.testing.assert_frame_equal(df_cached, expected)
+    np.testing.assert_array_equal(df_cached.attrs['baseline'], expected.attrs['baseline'])
+    pd.testing.assert_frame_equal(df_cached.attrs['histogram'], expected.attrs['histogram'])
+    assert not list(tmp_path.rglob('*.pkl'))
+    assert (cache.hits, cache.misses) == (1, 0)
+
+
+def test_counters_and_lru_eviction():
+    cache = BaselineResultCache(maxsize=2)
+    assert cache.get([0.0]) is None
+    for value in (0.0, 0.5, 1.0):
+        cache.put([value], result_frame())
+
+    assert len(cache) == 2
+    assert [0.0] not in cache
+    assert cache.get([1.0]) is not None
+    assert (cache.hits, cache.misses) == (1, 1)
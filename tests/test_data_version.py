@@ -0,0 +1,157 @@
+import threading
+
+import pytest
+from sqlalchemy import create_engine, text
+
+from talent_match import data_version
+from talent_match.data_version import DataVersionProbe, VersionTracker, version_key
+
+
+class FakeProbe:
+    """Versi tabel yang bisa diubah dari test, pengganti `DataVersionProbe`."""
+
+    def __init__(self, **versions):
+        self._versions = versions
+
+    def bump(self, table):
+        self._versions[table] = str(int(self._versions.get(table, 0)) + 1)
+
+    def versions(self):
+        return dict(self._versions)
+
+
+class FakeBuild:
+    """Build yang mencatat versi, bisa ditahan (`gate`) dan bisa dibuat gagal."""
+
+    def __init__(self):
+        self.calls = []
+        self.gate = threading.Event()
+        self.gate.set()
+        self.result = 'cache'
+
+    def __call__(self, version):
+        self.calls.append(version)
+        self.gate.wait(5)
+        if isinstance(self.result, Exception):
+            raise self.result
+        return self.result
+
+
+def wait_idle(tracker):
+    # Executor satu worker: tugas kosong selesai setelah semua build sebelumnya
+    tracker._executor.submit(lambda: None).result(5)
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    now = [1000.0]
+    monkeypatch.setattr(data_version.time, 'monotonic', lambda: now[0])
+    return now
+
+
+def latest(probe, tables=('employees', 'tv_features')):
+    return version_key(probe.versions(), tables)
+
+
+def test_stale_version_served_while_build_runs(clock):
+    tracker, probe, build = VersionTracker(), FakeProbe(employees='1', tv_features='1'), FakeBuild()
+    old = latest(probe)
+    assert tracker.resolve('talent_matrix', old, build) == old
+    assert build.calls == []
+
+    probe.bump('tv_features')
+    new = latest(probe)
+    build.gate.clear()
+    assert tracker.resolve('talent_matrix', new, build) == old
+    # Rerun selama build berjalan: tetap versi lama, tidak ada build kedua
+    assert tracker.resolve('talent_matrix', new, build) == old
+    assert tracker.building() == {'talent_matrix': new}
+
+    build.gate.set()
+    wait_idle(tracker)
+    assert tracker.resolve('talent_matrix', new, build) == new
+    assert build.calls == [new]
+    assert tracker.building() == {}
+
+
+def test_unrelated_table_change_keeps_version(clock):
+    probe = FakeProbe(employees='1', tv_features='1', strengths='1')
+    before = latest(probe)
+    probe.bump('strengths')
+    assert latest(probe) == before
+
+
+@pytest.mark.parametrize('failure', [None, RuntimeError('database down')])
+def test_failed_build_keeps_old_version_and_backs_off(clock, failure):
+    tracker, probe, build = VersionTracker(retry_after=60, max_retry_after=100), FakeProbe(employees='1'), FakeBuild()
+    old = latest(probe, ['employees'])
+    tracker.resolve('employee_list', old, build)
+
+    probe.bump('employees')
+    new = latest(probe, ['employees'])
+    build.result = failure
+    assert tracker.resolve('employee_list', new, build) == old
+    wait_idle(tracker)
+    assert tracker.served() == {'employee_list': old}
+    assert tracker.failed() == {'employee_list': (new, 1)}
+
+    # Sebelum backoff habis, rerun tidak memicu build ulang
+    clock[0] += 59
+    assert tracker.resolve('employee_list', new, build) == old
+    wait_idle(tracker)
+    assert build.calls == [new]
+
+    # Setelah 60 detik dicoba lagi; gagal lagi -> jeda 120 detik, dibatasi 100
+    clock[0] += 1
+    tracker.resolve('employee_list', new, build)
+    wait_idle(tracker)
+    assert build.calls == [new, new]
+    assert tracker.failed() == {'employee_list': (new, 2)}
+    clock[0] += 99
+    tracker.resolve('employee_list', new, build)
+    wait_idle(tracker)
+    assert len(build.calls) == 2
+
+    clock[0] += 1
+    build.result = 'cache'
+    assert tracker.resolve('employee_list', new, build) == old
+    wait_idle(tracker)
+    assert tracker.resolve('employee_list', new, build) == new
+    assert tracker.failed() == {}
+
+
+def test_newer_version_is_built_despite_failed_one(clock):
+    tracker, probe, build = VersionTracker(retry_after=60), FakeProbe(employees='1'), FakeBuild()
+    tracker.resolve('employee_list', latest(probe, ['employees']), build)
+
+    probe.bump('employees')
+    build.result = None
+    tracker.resolve('employee_list', latest(probe, ['employees']), build)
+    wait_idle(tracker)
+
+    probe.bump('employees')
+    newest = latest(probe, ['employees'])
+    build.result = 'cache'
+    tracker.resolve('employee_list', newest, build)
+    wait_idle(tracker)
+    assert tracker.served() == {'employee_list': newest}
+
+
+def test_count_probe_changes_with_table_contents(tmp_path):
+    engine = create_engine(f"duckdb:///{tmp_path / 'versi.duckdb'}")
+    with engine.begin() as conn:
+        conn.execute(text("CREATE TABLE employees (employee_id VARCHAR)"))
+        conn.execute(text("CREATE TABLE performance_yearly (employee_id VARCHAR, year INTEGER)"))
+        conn.execute(text("INSERT INTO performance_yearly VALUES ('EMP1', 2024)"))
+
+    probe = DataVersionProbe(engine, ['employees', 'performance_yearly', 'tidak_ada'])
+    assert probe.mode == 'count'
+    before = probe.versions()
+    assert before == {'employees': '0:', 'performance_yearly': '1:2024'}
+
+    with engine.begin() as conn:
+        conn.execute(text("INSERT INTO performance_yearly VALUES ('EMP1', 2025)"))
+    after = probe.versions()
+    assert after['employees'] == before['employees']
+    assert after['performance_yearly'] == '2:2025'
+    engine.dispose()
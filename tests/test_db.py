@@ -0,0 +1,77 @@
+import threading
+import time
+
+import pytest
+from sqlalchemy import text
+from sqlalchemy.exc import TimeoutError as PoolTimeout
+
+from talent_match.db import create_pooled_engine, pool_metrics, prime_pool
+
+
+@pytest.fixture
+def engine(tmp_path):
+    engine = create_pooled_engine(f"duckdb:///{tmp_path / 'pool.duckdb'}", pool_size=1, max_overflow=0, pool_timeout=5)
+    yield engine
+    engine.dispose()
+
+
+def test_second_checkout_waits_for_the_single_slot(engine):
+    assert prime_pool(engine, 1) == 1
+    assert pool_metrics(engine)['connects'] == 1
+
+    held = threading.Event()
+    metrics_while_held = {}
+
+    def hold():
+        with engine.connect() as conn:
+            conn.execute(text("SELECT 1"))
+            held.set()
+            time.sleep(0.3)
+            metrics_while_held.update(pool_metrics(engine))
+
+    def wait_for_slot():
+        held.wait(5)
+        with engine.connect() as conn:
+            return conn.execute(text("SELECT 2")).scalar()
+
+    holder = threading.Thread(target=hold)
+    holder.start()
+    results = []
+    waiter = threading.Thread(target=lambda: results.append(wait_for_slot()))
+    waiter.start()
+    holder.join()
+    waiter.join()
+
+    assert results == [2]
+    assert metrics_while_held['checked_out'] == 1
+    metrics = pool_metrics(engine)
+    assert metrics['checked_out'] == 0
+    assert metrics['checked_in'] == 1
+    assert metrics['overflow'] == 0
+    # Warm-up + dua checkout, satu koneksi fisik dipakai ulang
+    assert metrics['checkouts'] == 3
+    assert metrics['connects'] == 1
+    assert metrics['invalidations'] == 0
+    # Checkout kedua menunggu koneksi pertama dikembalikan
+    assert metrics['checkout_max_ms'] >= 200
+
+
+def test_checkout_timeout_is_still_recorded(tmp_path):
+    engine = create_pooled_engine(f"duckdb:///{tmp_path / 'pool.duckdb'}", pool_size=1, max_overflow=0, pool_timeout=0.1)
+    with engine.connect():
+        with pytest.raises(PoolTimeout):
+            engine.connect()
+    metrics = pool_metrics(engine)
+    assert metrics['checkouts'] == 2
+    assert metrics['checkout_max_ms'] >= 100
+    engine.dispose()
+
+
+def test_invalidated_connection_is_counted(engine):
+    with engine.connect() as conn:
+        conn.invalidate()
+    with engine.connect() as conn:
+        conn.execute(text("SELECT 1"))
+    metrics = pool_metrics(engine)
+    assert metrics['invalidations'] == 1
+    assert metrics['connects'] == 2
@@ -0,0 +1,100 @@
+import random
+
+import pandas as pd
+import pytest
+from sqlalchemy import text
+
+from talent_match.employee_search import EmployeeSearchIndex
+from talent_match.queries import EMPLOYEE_SEARCH_QUERY
+
+EVERYTHING = 10 ** 9
+
+
+@pytest.fixture(scope='module')
+def df_employees(embedded_engine):
+    with embedded_engine.connect() as conn:
+        return pd.read_sql_query(text(EMPLOYEE_SEARCH_QUERY), conn)
+
+
+@pytest.fixture(scope='module')
+def index(df_employees):
+    return EmployeeSearchIndex(df_employees)
+
+
+def searchable(df_employees):
+    return pd.DataFrame({
+        'employee_id': df_employees['employee_id'].astype(str),
+        'fullname': df_employees['fullname'].fillna('').astype(str).str.casefold(),
+        'id': df_employees['employee_id'].astype(str).str.casefold(),
+        'nip': df_employees['nip'].fillna('').astype(str).str.casefold(),
+    })
+
+
+def naive_matches(df, term):
+    """Substring di nama/ID/NIP (term >= 3 huruf), atau awal kata nama/ID/NIP (term pendek)."""
+    if len(term) >= 3:
+        mask = (df['fullname'].str.contains(term, regex=False) | df['id'].str.contains(term, regex=False)
+                | df['nip'].str.contains(term, regex=False))
+    else:
+        words = df['fullname'].str.split()
+        mask = (words.map(lambda ws: any(w.startswith(term) for w in ws)) | df['id'].str.startswith(term)
+                | (df['nip'].str.startswith(term) & (df['nip'] != '')))
+    return set(df.loc[mask, 'employee_id'])
+
+
+def sample_terms(df, n=40, seed=0):
+    rng = random.Random(seed)
+    sources = df['fullname'].tolist() + df['id'].tolist() + [nip for nip in df['nip'] if nip]
+    terms = set()
+    while len(terms) < n:
+        word = rng.choice(rng.choice(sources).split())
+        length = rng.randint(1, min(6, len(word)))
+        start = rng.randint(0, len(word) - length)
+        terms.add(word[start:start + length])
+    return sorted(terms)
+
+
+def test_single_term_matches_naive_contains(index, df_employees):
+    df = searchable(df_employees)
+    for term in sample_terms(df) + ['dup', 'ZZZQ']:
+        assert set(index.search(term, limit=EVERYTHING)) == naive_matches(df, term.casefold()), term
+
+
+def test_multiple_terms_are_and(index, df_employees):
+    df = searchable(df_employees)
+    rng = random.Random(1)
+    for fullname in rng.sample(df['fullname'].tolist(), 15):
+        words = fullname.split()
+        query = ' '.join(word[:4] for word in words[:2])
+        expected = set.intersection(*(naive_matches(df, word[:4]) for word in words[:2]))
+        result = index.search(query, limit=EVERYTHING)
+        assert set(result) == expected, query
+        assert result
+
+
+def test_limit_returns_prefix_of_full_result(index, df_employees):
+    directorate = index.values('directorate')[0]
+    grade = index.values('grade')[0]
+    for term in ['a', 'an', 'ang', 'dup', 'putri', 'wi']:
+        for filters in ({}, {'directorate': directorate}, {'directorate': directorate, 'grade': grade}):
+            full = index.search(term, limit=EVERYTHING, **filters)
+            for limit in (1, 5, 20):
+                assert index.search(term, limit=limit, **filters) == full[:limit], (term, filters, limit)
+
+
+def test_filters_apply_before_limit(index, df_employees):
+    directorate = index.values('directorate')[0]
+    allowed = set(df_employees.loc[df_employees['directorate'] == directorate, 'employee_id'])
+    result = index.search('a', limit=20, directorate=directorate)
+    assert len(result) == 20
+    assert set(result) <= allowed
+
+
+def test_empty_query_is_ordered_by_name(index, df_employees):
+    df_sorted = df_employees.assign(fullname=df_employees['fullname'].fillna('')).sort_values(['fullname', 'employee_id'])
+    assert index.search('', limit=30) == df_sorted['employee_id'].head(30).tolist()
+    assert index.search('   ', limit=EVERYTHING) == df_sorted['employee_id'].tolist()
+
+    grade = index.values('grade')[-1]
+    expected = df_sorted.loc[df_sorted['grade'] == grade, 'employee_id'].head(10).tolist()
+    assert index.search('', limit=10, grade=grade) == expected
@@ -0,0 +1,76 @@
+import pandas as pd
+import pytest
+from sqlalchemy import text
+
+from benchmarks.query_plan import baseline_statement
+from talent_match.matching import TalentMatcher, read_talent_matrix
+
+KEY = ['employee_id', 'tgv_name', 'tv_name']
+
+
+@pytest.fixture(scope='module')
+def matchers(embedded_engine):
+    sql_matcher = TalentMatcher(embedded_engine, None, result_format='long')
+    engine_matcher = TalentMatcher(embedded_engine, read_talent_matrix(embedded_engine), result_format='long')
+    return sql_matcher, engine_matcher
+
+
+@pytest.fixture(scope='module')
+def employee_ids(embedded_engine):
+    with embedded_engine.connect() as conn:
+        df = pd.read_sql_query(text("SELECT employee_id FROM tv_features ORDER BY employee_id"), conn)
+    return df['employee_id'].tolist()
+
+
+def benchmark_sets(employee_ids):
+    step = len(employee_ids) // 7
+    return [
+        employee_ids[:1],
+        employee_ids[step:step + 2],
+        employee_ids[2 * step:2 * step + 3],
+        [employee_ids[-1], employee_ids[0], employee_ids[3 * step]],
+        [employee_ids[4 * step], 'TIDAK_ADA'],
+    ]
+
+
+def assert_same_ranking(df_sql, df_engine):
+    """Nilai per (employee_id, tgv_name, tv_name) sama; urutan hanya boleh beda di antara nilai final_match_rate yang sama."""
+    assert len(df_sql) == len(df_engine)
+    assert list(df_sql.columns) == list(df_engine.columns)
+
+    pd.testing.assert_frame_equal(
+        df_sql.sort_values(KEY, ignore_index=True),
+        df_engine.sort_values(KEY, ignore_index=True),
+        check_dtype=False,
+    )
+
+    rates_sql = df_sql.drop_duplicates('employee_id')['final_match_rate'].round(6).tolist()
+    rates_engine = df_engine.drop_duplicates('employee_id')['final_match_rate'].round(6).tolist()
+    assert rates_sql == rates_engine
+    assert rates_sql == sorted(rates_sql, reverse=True)
+
+
+def test_sql_and_engine_paths_agree(matchers, employee_ids):
+    sql_matcher, engine_matcher = matchers
+    for benchmark_ids in benchmark_sets(employee_ids):
+        df_sql = sql_matcher.match(benchmark_ids)
+        df_engine = engine_matcher.match(benchmark_ids)
+        assert not df_sql.empty
+        assert_same_ranking(df_sql, df_engine)
+
+
+def test_baseline_fstring_query_and_engine_agree(matchers, employee_ids, embedded_engine):
+    # Query lama (Rule Engine TV dari tabel mentah, ID sebagai literal) vs TalentMatrix.match_baseline
+    _, engine_matcher = matchers
+    for benchmark_ids in benchmark_sets(employee_ids):
+        with embedded_engine.connect() as conn:
+            df_baseline = pd.read_sql_query(text(baseline_statement(benchmark_ids)), conn)
+        df_engine = engine_matcher.match(benchmark_ids)
+        assert not df_baseline.empty
+        assert_same_ranking(df_baseline, df_engine)
+
+
+@pytest.mark.parametrize('benchmark_ids', [[], ['TIDAK_ADA'], ['TIDAK_ADA', 'JUGA_TIDAK']])
+def test_unknown_or_empty_benchmarks_return_empty_frame(matchers, benchmark_ids):
+    for matcher in matchers:
+        assert matcher.match(benchmark_ids).empty
@@ -0,0 +1,51 @@
+import shutil
+
+import pandas as pd
+import pytest
+
+from talent_match.embedded import table_path
+from talent_match.master_table import build_master_table
+
+
+@pytest.fixture
+def dataset_copy(tmp_path):
+    dataset_dir = tmp_path / 'dataset'
+    dataset_dir.mkdir()
+    for table in ('employees', 'performance_yearly', 'competencies_yearly', 'papi_scores', 'profiles_psych',
+                  'dim_grades', 'dim_education', 'dim_majors', 'dim_positions', 'dim_departments', 'dim_directorates'):
+        shutil.copy(table_path('dataset', table), dataset_dir)
+    return dataset_dir
+
+
+def read_master(out_dir):
+    return pd.read_parquet(out_dir).sort_values('employee_id', ignore_index=True)
+
+
+def test_incremental_rebuild_equals_full_rebuild(dataset_copy, tmp_path):
+    incremental_dir, full_dir = str(tmp_path / 'incremental'), str(tmp_path / 'full')
+    first = build_master_table(str(dataset_copy), incremental_dir, partitions=8)
+    assert first['mode'] == 'full'
+
+    # Satu potongan sumber berubah: rating tahun terakhir dua karyawan, dan satu karyawan hilang dari PAPI
+    performance_path = table_path(str(dataset_copy), 'performance_yearly')
+    df_performance = pd.read_csv(performance_path)
+    rated = df_performance[df_performance['rating'].between(1, 5)]
+    latest = rated.loc[rated.groupby('employee_id')['year'].idxmax()]
+    changed_rows = latest.index[:2]
+    df_performance.loc[changed_rows, 'rating'] = df_performance.loc[changed_rows, 'rating'] % 5 + 1
+    df_performance.to_csv(performance_path, index=False)
+
+    papi_path = table_path(str(dataset_copy), 'papi_scores')
+    df_papi = pd.read_csv(papi_path)
+    dropped = sorted(set(df_papi['employee_id']) - set(latest.loc[changed_rows, 'employee_id']))[0]
+    df_papi[df_papi['employee_id'] != dropped].to_csv(papi_path, index=False)
+
+    second = build_master_table(str(dataset_copy), incremental_dir, partitions=8)
+    assert second['mode'] == 'incremental'
+    assert second['changed'] == 3
+    assert second['partitions_written'] <= 3
+
+    build_master_table(str(dataset_copy), full_dir, partitions=8, full=True)
+    df_incremental, df_full = read_master(incremental_dir), read_master(full_dir)
+    assert second['rows'] == len(df_full)
+    pd.testing.assert_frame_equal(df_incremental, df_full)
@@ -0,0 +1,40 @@
+import pandas as pd
+import pytest
+
+from talent_match.cache import BaselineResultCache
+from talent_match.matching import TalentMatcher, read_talent_matrix
+from talent_match.pattern_index import PatternIndex
+
+
+@pytest.fixture(scope='module')
+def talent_matrix(embedded_engine):
+    return read_talent_matrix(embedded_engine)
+
+
+def assert_same_result(df_cached, df_computed):
+    pd.testing.assert_frame_equal(df_cached, df_computed)
+    assert set(df_cached.attrs) == set(df_computed.attrs)
+    for name, value in df_computed.attrs.items():
+        if isinstance(value, pd.DataFrame):
+            pd.testing.assert_frame_equal(df_cached.attrs[name], value)
+        else:
+            assert list(df_cached.attrs[name]) == list(value)
+
+
+@pytest.mark.parametrize('result_format', ['wide', 'long', 'topk'])
+def test_warmed_entry_equals_computed_result(embedded_engine, talent_matrix, tmp_path, result_format):
+    pattern_index = PatternIndex(talent_matrix)
+    baselines = talent_matrix.common_baselines(3)
+
+    def matcher(result_cache=None):
+        return TalentMatcher(embedded_engine, talent_matrix, pattern_index, result_format, 50, result_cache)
+
+    matcher(BaselineResultCache(disk_dir=str(tmp_path), namespace=result_format)).warm(baselines)
+
+    # Cache baru di folder yang sama: entri dibaca dari disk
+    cache = BaselineResultCache(disk_dir=str(tmp_path), namespace=result_format)
+    for baseline in baselines:
+        df_computed = matcher().compute(None, baseline)
+        assert_same_result(cache.get(baseline), df_computed)
+        if result_format != 'long':
+            assert 'tv_name' not in cache.get(baseline).columns
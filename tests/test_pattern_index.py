@@ -0,0 +1,53 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from talent_match.engine import TalentMatrix
+from talent_match.matching import read_talent_matrix
+from talent_match.pattern_index import PatternIndex
+
+
+def synthetic_matrix(n_employees=500, seed=0):
+    """Sedikit TV aktif agar banyak pola (dan final_match_rate) yang sama; ID tidak urut."""
+    rng = np.random.default_rng(seed)
+    scores = np.zeros((n_employees, 10), dtype=np.int8)
+    scores[:, :4] = rng.integers(0, 2, size=(n_employees, 4))
+    employee_ids = np.array([f'EMP{i:05d}' for i in rng.permutation(n_employees)], dtype=object)
+    details = pd.DataFrame({
+        'fullname': [f'Karyawan {emp_id}' for emp_id in employee_ids],
+        'directorate': rng.choice(['R&D', 'HR', 'Operations'], n_employees),
+        'role': rng.choice(['Analyst', 'Engineer'], n_employees),
+        'grade': rng.choice(['III', 'IV', 'V'], n_employees),
+    })
+    return TalentMatrix(employee_ids, scores, details)
+
+
+def assert_top_k_matches_full_ranking(matrix, baselines, ks):
+    index = PatternIndex(matrix)
+    for baseline in baselines:
+        df_full = matrix.match_baseline_wide(baseline)
+        for k in ks:
+            df_top = index.top_k(baseline, k)
+            pd.testing.assert_frame_equal(df_top, df_full.iloc[:k].reset_index(drop=True))
+        for offset in (0, 3, len(matrix) - 2):
+            df_page = index.top_k(baseline, 5, offset=offset)
+            pd.testing.assert_frame_equal(df_page, df_full.iloc[offset:offset + 5].reset_index(drop=True))
+
+
+def test_top_k_equals_full_ranking_with_ties():
+    matrix = synthetic_matrix()
+    rng = np.random.default_rng(1)
+    baselines = [np.zeros(10), np.ones(10)] + [rng.choice([0.0, 0.5, 1.0], 10) for _ in range(5)]
+    assert_top_k_matches_full_ranking(matrix, baselines, ks=[1, 7, 60, len(matrix), len(matrix) + 25])
+
+
+@pytest.fixture(scope='module')
+def dataset_matrix(embedded_engine):
+    return read_talent_matrix(embedded_engine)
+
+
+def test_top_k_equals_full_ranking_on_dataset(dataset_matrix):
+    baselines = [dataset_matrix.scores[i].astype(float) for i in (0, 10, 100)]
+    baselines.append(dataset_matrix.baseline(dataset_matrix.employee_ids[:2]))
+    n = len(dataset_matrix)
+    assert_top_k_matches_full_ranking(dataset_matrix, baselines, ks=[1, 200, n, n + 1])
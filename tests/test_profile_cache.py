@@ -0,0 +1,84 @@
+import os
+import threading
+import time
+
+from talent_match import profile_cache
+from talent_match.profile_cache import ProfileCache, profile_key
+
+
+def test_profile_key_normalizes_input():
+    assert profile_key(' Data  Analyst', 'V', 'Analisis data', 'm') == profile_key('data analyst', ' v ', 'analisis  DATA', 'm')
+    assert profile_key('Data Analyst', 'V', 'Analisis data', 'm') != profile_key('Data Analyst', 'V', 'Analisis data', 'n')
+
+
+def test_concurrent_identical_requests_call_llm_once(tmp_path):
+    cache = ProfileCache(str(tmp_path))
+    key = profile_key('Data Analyst', 'V', 'Analisis data', 'm')
+    n_threads = 8
+    calls, results = [], []
+    start_barrier = threading.Barrier(n_threads)
+
+    def stream():
+        calls.append(1)
+        time.sleep(0.3)
+        yield '### Deskripsi Pekerjaan\n'
+        yield 'profil'
+
+    def request():
+        start_barrier.wait()
+        results.append(''.join(cache.stream_or_fetch(key, stream)))
+
+    threads = [threading.Thread(target=request) for _ in range(n_threads)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert len(calls) == 1
+    assert results == ['### Deskripsi Pekerjaan\nprofil'] * n_threads
+    stats = cache.stats()
+    assert stats['misses'] == 1
+    assert stats['coalesced'] + stats['hits'] == n_threads - 1
+
+
+def test_failed_leader_lets_next_request_retry(tmp_path):
+    cache = ProfileCache(str(tmp_path))
+
+    def failing():
+        yield 'pro'
+        raise RuntimeError("LLM down")
+
+    try:
+        list(cache.stream_or_fetch('k', failing))
+    except RuntimeError:
+        pass
+    assert cache.get('k') is None
+    assert list(cache.stream_or_fetch('k', lambda: iter(['pro', 'fil']))) == ['pro', 'fil']
+    # Hit cache: teks lengkap sebagai satu potongan
+    assert list(cache.stream_or_fetch('k', failing)) == ['profil']
+
+
+def test_entry_expires_after_ttl(tmp_path, monkeypatch):
+    cache = ProfileCache(str(tmp_path), ttl=60)
+    cache.put('k', 'lama')
+    assert cache.get('k') == 'lama'
+
+    now = time.time()
+    monkeypatch.setattr(profile_cache.time, 'time', lambda: now + 61)
+    assert cache.get('k') is None
+    assert not os.path.exists(cache._path('k'))
+    assert list(cache.stream_or_fetch('k', lambda: iter(['baru']))) == ['baru']
+
+
+def test_oldest_entries_evicted_over_max_bytes(tmp_path):
+    text = 'x' * 1000
+    cache = ProfileCache(str(tmp_path), max_bytes=2500)
+    now = time.time()
+    for age, key in ((30, 'k1'), (20, 'k2')):
+        cache.put(key, text)
+        os.utime(cache._path(key), (now - age, now - age))
+    cache.put('k3', text)
+
+    assert cache.get('k1') is None
+    assert cache.get('k2') == text
+    assert cache.get('k3') == text
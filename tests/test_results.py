@@ -0,0 +1,19 @@
+import pytest
+
+from talent_match.matching import TalentMatcher, read_talent_matrix
+from talent_match.results import ResultView
+
+
+@pytest.mark.parametrize('result_format', ['wide', 'long'])
+def test_ranked_display_is_capped_to_limit(embedded_engine, result_format):
+    talent_matrix = read_talent_matrix(embedded_engine)
+    benchmark_ids = sorted(talent_matrix.employee_ids)[:3]
+    view = ResultView(TalentMatcher(embedded_engine, talent_matrix, result_format=result_format).match(benchmark_ids), benchmark_ids)
+
+    df_top = view.ranked_display(25)
+    assert len(df_top) == 25
+    assert view.n_candidates == len(view.ranked) > 25
+    assert df_top['employee_id'].tolist() == view.ranked['employee_id'].head(25).tolist()
+    assert df_top['final_match_rate'].str.endswith('%').all()
+    assert len(view.ranked_display()) == len(view.ranked)
+    assert view.ranked_display(25) is df_top
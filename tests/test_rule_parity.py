@@ -0,0 +1,45 @@
+import re
+
+import numpy as np
+import pandas as pd
+import pytest
+from sqlalchemy import text
+
+from talent_match.rule_engine import RuleEvaluator, raw_features_sql, tv_features_sql, tv_features_view_sql
+from talent_match.rules import TV_RULES
+
+TV_FLAG_COLUMNS = [column for column, _, _, _ in TV_RULES]
+
+
+@pytest.fixture(scope='module')
+def migration_sql():
+    with open('migrations/001_tv_features.sql') as f:
+        return f.read()
+
+
+def read_flags(engine, query):
+    with engine.connect() as conn:
+        df = pd.read_sql_query(text(query), conn)
+    return df[['employee_id'] + TV_FLAG_COLUMNS].sort_values('employee_id', ignore_index=True)
+
+
+def test_migration_view_is_compiled_from_tv_rules(migration_sql):
+    assert tv_features_view_sql() in migration_sql
+
+
+def test_migration_view_and_compiled_rules_give_same_flags(embedded_engine, migration_sql):
+    view_body = re.search(r'CREATE OR REPLACE VIEW tv_features_source AS(.*?);', migration_sql, re.S).group(1)
+    df_view = read_flags(embedded_engine, view_body)
+    df_compiled = read_flags(embedded_engine, tv_features_sql())
+    df_store = read_flags(embedded_engine, "SELECT * FROM tv_features")
+
+    pd.testing.assert_frame_equal(df_view, df_compiled, check_dtype=False)
+    pd.testing.assert_frame_equal(df_store, df_compiled, check_dtype=False)
+
+
+def test_numpy_evaluator_matches_compiled_rules(embedded_engine):
+    df_compiled = read_flags(embedded_engine, tv_features_sql())
+    with embedded_engine.connect() as conn:
+        df_raw = pd.read_sql_query(text(raw_features_sql()), conn)
+    evaluator = RuleEvaluator(df_raw, df_compiled['employee_id'])
+    np.testing.assert_array_equal(evaluator.scores(), df_compiled[TV_FLAG_COLUMNS].to_numpy())
@@ -0,0 +1,73 @@
+import threading
+import time
+
+import pytest
+
+from talent_match.scheduler import MatchScheduler, QueueFull, request_key
+
+
+def blocking_job(release, calls, result='ok'):
+    def run():
+        calls.append(result)
+        release.wait(5)
+        return result
+    return run
+
+
+def test_identical_request_while_running_is_coalesced():
+    scheduler = MatchScheduler(max_workers=2)
+    release, calls = threading.Event(), []
+    key = request_key(['E1', 'E2'], 'v1')
+
+    first = scheduler.submit(key, blocking_job(release, calls))
+    second = scheduler.submit(key, blocking_job(release, calls))
+    release.set()
+
+    assert second is first
+    assert first.result(5) == 'ok'
+    assert calls == ['ok']
+    assert scheduler.stats()['coalesced'] == 1
+    assert scheduler.stats()['submitted'] == 1
+
+
+def test_request_key_ignores_order_and_duplicates():
+    assert request_key(['E2', 'E1', 'E2'], 'v1') == request_key(['E1', 'E2'], 'v1')
+    assert request_key(['E1', 'E2'], 'v1') != request_key(['E1', 'E2'], 'v2')
+    assert request_key(['E1'], 'v1') != request_key(['E1', 'E2'], 'v1')
+
+
+def test_queue_full_after_timeout():
+    scheduler = MatchScheduler(max_workers=1, max_queue=1, queue_timeout=0.2)
+    release, calls = threading.Event(), []
+    running = scheduler.submit(('running',), blocking_job(release, calls))
+    while not calls:
+        time.sleep(0.01)
+    queued = scheduler.submit(('queued',), blocking_job(release, calls))
+
+    start = time.monotonic()
+    with pytest.raises(QueueFull):
+        scheduler.submit(('rejected',), blocking_job(release, calls))
+    assert time.monotonic() - start >= 0.2
+    assert scheduler.stats()['rejected'] == 1
+
+    release.set()
+    assert running.result(5) == queued.result(5) == 'ok'
+
+
+def test_failure_frees_key_for_retry():
+    scheduler = MatchScheduler(max_workers=1)
+    key = request_key(['E1'])
+    attempts = []
+
+    def flaky():
+        attempts.append(len(attempts))
+        if len(attempts) == 1:
+            raise RuntimeError("database down")
+        return 'ok'
+
+    with pytest.raises(RuntimeError):
+        scheduler.run(key, flaky, timeout=5)
+    assert scheduler.run(key, flaky, timeout=5) == 'ok'
+    assert attempts == [0, 1]
+    assert scheduler.stats()['failed'] == 1
+    assert scheduler.stats()['coalesced'] == 0
@@ -0,0 +1,52 @@
+import numpy as np
+import pandas as pd
+import pytest
+from sqlalchemy import create_engine, text
+
+from benchmarks.synth_data import generate
+from talent_match.embedded import embedded_url, prepare_embedded_database
+from talent_match.similarity import SimilarityIndex, similarity_features_sql
+
+
+@pytest.fixture(scope='module')
+def df_features(tmp_path_factory):
+    synth_dir = tmp_path_factory.mktemp('synth')
+    generate('dataset', str(synth_dir), 6000, seed=7)
+    db_path = prepare_embedded_database(str(synth_dir), str(tmp_path_factory.mktemp('synth_db')))
+    engine = create_engine(embedded_url(db_path), connect_args={'read_only': True})
+    with engine.connect() as conn:
+        df = pd.read_sql_query(text(similarity_features_sql()), conn)
+    engine.dispose()
+
+    # Salinan persis beberapa karyawan dengan ID lain: jarak sama, urutan ditentukan employee_id
+    df_twins = df.iloc[::50].assign(employee_id=lambda d: 'A' + d['employee_id'])
+    return pd.concat([df, df_twins], ignore_index=True)
+
+
+@pytest.fixture(scope='module')
+def index(df_features):
+    return SimilarityIndex.from_frame(df_features)
+
+
+def test_nearest_equals_float64_ranking(index):
+    all_rows = np.arange(len(index))
+    rng = np.random.default_rng(3)
+    twins = [emp_id for emp_id in index.employee_ids if emp_id.startswith('A')]
+    benchmark_sets = [[emp_id] for emp_id in twins[:3]]
+    benchmark_sets += [list(rng.choice(index.employee_ids, rng.integers(1, 4), replace=False)) for _ in range(8)]
+
+    for benchmark_ids in benchmark_sets:
+        baseline = index.baseline(benchmark_ids)
+        expected_rows, expected_squared = index._ordered(all_rows, index.squared_distances(all_rows, baseline))
+        for k in (1, 10, 200, len(index) + 5):
+            rows, squared = index.nearest(baseline, k)
+            np.testing.assert_array_equal(index.employee_ids[rows], index.employee_ids[expected_rows[:k]])
+            np.testing.assert_allclose(squared, expected_squared[:k])
+
+
+def test_nearest_ties_break_on_employee_id(index):
+    twin = next(emp_id for emp_id in index.employee_ids if emp_id.startswith('A'))
+    rows, squared = index.nearest(index.baseline([twin]), 2)
+    # Benchmark dan salinannya sama-sama berjarak 0; ID 'A...' lebih kecil
+    assert index.employee_ids[rows].tolist() == [twin, twin[1:]]
+    np.testing.assert_allclose(squared, 0, atol=1e-9)
@@ -0,0 +1,70 @@
+import pytest
+
+from talent_match.talent_query import cte_breakdown
+
+
+def node(node_type, total_ms, plans=(), hit=0, **extra):
+    return {
+        'Node Type': node_type, 'Actual Total Time': total_ms, 'Actual Loops': 1,
+        'Shared Hit Blocks': hit, 'Shared Read Blocks': 0, 'Plans': list(plans), **extra,
+    }
+
+
+def cte_scan(cte, total_ms, hit=0):
+    return node('CTE Scan', total_ms, hit=hit, **{'CTE Name': cte})
+
+
+def init_plan(cte, plan):
+    return {**plan, 'Parent Relationship': 'InitPlan', 'Subplan Name': f'CTE {cte}'}
+
+
+@pytest.fixture
+def plan():
+    # `base` dibaca dua kali (di CTE `agg` dan di query utama); `agg` dibaca query utama.
+    # Waktu CTE Scan sudah termasuk evaluasi CTE yang dipicunya.
+    base = init_plan('base', node('Seq Scan', 30.0, hit=40, **{'Relation Name': 'competencies_yearly'}))
+    agg = init_plan('agg', node('HashAggregate', 50.0, [cte_scan('base', 35.0, hit=40)], hit=40))
+    root = node('Hash Join', 100.0, [
+        base,
+        agg,
+        cte_scan('agg', 60.0, hit=40),
+        node('Seq Scan', 5.0, hit=7, **{'Relation Name': 'employees'}),
+        cte_scan('base', 7.0),
+    ], hit=50)
+    return [{'Plan': root, 'Planning Time': 1.5, 'Execution Time': 100.0}]
+
+
+def test_cte_breakdown_exclusive_time_per_cte(plan):
+    rows = cte_breakdown(plan)
+    by_section = {row['section']: row for row in rows}
+
+    assert [row['section'] for row in rows] == ['(query utama)', 'base', 'agg']
+    # base: evaluasi 30 ms; sisa 12 ms dari dua CTE Scan-nya dibagi 35:7 ke bagian pembacanya
+    assert by_section['base']['exclusive_ms'] == pytest.approx(30.0)
+    # agg: 50 - 35 (CTE Scan base) + 10 (bagian scan base di dalam agg)
+    assert by_section['agg']['exclusive_ms'] == pytest.approx(25.0)
+    # query utama: 100 - 72 anak + 10 (sisa scan agg) + 5 (Seq Scan) + 2 (sisa scan base)
+    assert by_section['(query utama)']['exclusive_ms'] == pytest.approx(45.0)
+    assert sum(row['exclusive_ms'] for row in rows) == pytest.approx(100.0)
+    assert [row['share'] for row in rows] == [0.45, 0.3, 0.25]
+
+    assert by_section['base']['shared_blocks'] == 40
+    assert by_section['agg']['shared_blocks'] == 0
+    assert by_section['(query utama)']['shared_blocks'] == 10
+    assert {row['section']: row['nodes'] for row in rows} == {'(query utama)': 4, 'base': 1, 'agg': 2}
+
+
+def test_cte_breakdown_without_execution_time_uses_sum(plan):
+    del plan[0]['Execution Time']
+    rows = cte_breakdown(plan)
+    assert sum(row['share'] for row in rows) == pytest.approx(1.0)
+
+
+def test_cte_breakdown_multiplies_loops():
+    root = node('Nested Loop', 20.0, [
+        init_plan('x', node('Seq Scan', 4.0)),
+        {**cte_scan('x', 2.0), 'Actual Loops': 3},
+    ])
+    rows = cte_breakdown([{'Plan': root, 'Execution Time': 20.0}])
+    # CTE Scan: 3 loop x 2 ms = 6 ms, termasuk 4 ms evaluasi x
+    assert {row['section']: row['exclusive_ms'] for row in rows} == {'(query utama)': 16.0, 'x': 4.0}